@@ -0,0 +1,4 @@
+"""
+Benchmarks to measure the speed and memory use of motherstarter,
+using synthetic inventories of increasing size.
+"""
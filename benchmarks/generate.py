@@ -0,0 +1,193 @@
+"""
+This module generates synthetic inventory and groups source files, so that
+motherstarter can be benchmarked against inventories of any size.
+
+The inventory is generated deterministically, so the same size always
+produces the same source files.
+"""
+
+# Import modules
+from __future__ import annotations
+from motherstarter import motherstarter as ms
+from typing import Callable, Dict, List, Tuple
+import click
+import importlib.util
+import pathlib as pl
+import pandas as pd
+
+# Specify the default inventory sizes, in number of devices
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+# Specify the source types which are generated. The parquet and feather source
+# types require the optional pyarrow dependency, so they are only generated
+# when it is installed
+SOURCE_TYPES = ["csv", "json", "xlsx", "workbook", "sqlite"]
+if importlib.util.find_spec("pyarrow") is not None:
+    SOURCE_TYPES += ["parquet", "feather"]
+# Specify the sites which the devices are spread across
+SITES = ["syd", "mel", "bne", "per", "lon", "ams", "nyc", "sfo", "sin", "tyo"]
+# Specify the device profiles which the inventory is generated from, as a tuple
+# of vendor, device type, operating system and the weight of that profile
+DEVICE_PROFILES: List[Tuple[str, str, str, int]] = [
+    ("cisco", "router", "ios", 30),
+    ("cisco", "switch", "nxos", 25),
+    ("cisco", "router", "iosxr", 10),
+    ("juniper", "router", "junos", 15),
+    ("arista", "switch", "eos", 15),
+    ("juniper", "firewall", "srx", 5),
+]
+
+
+def generate_inventory(size: int) -> pd.DataFrame:
+    """
+    Generate an inventory dataframe with the number of devices, with
+    the devices spread across the sites and device profiles by weight.
+
+    Args:
+        size: The number of devices in the inventory.
+
+    Returns:
+        df: The pandas dataframe object of the inventory.
+
+    Raises:
+        N/A
+    """
+    # Expand the device profiles by weight, so profiles can be picked by index
+    profiles = [p[:3] for p in DEVICE_PROFILES for _ in range(p[3])]
+    rows = []
+    for i in range(size):
+        vendor, device_type, operating_system = profiles[i % len(profiles)]
+        site = SITES[i // len(profiles) % len(SITES)]
+        rows.append(
+            (
+                f"{site}-{operating_system}-{i:07d}.lab.dfjt.local",
+                f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+                vendor,
+                device_type,
+                operating_system,
+            )
+        )
+    return pd.DataFrame(
+        rows, columns=["name", "mgmt_ip", "vendor", "device_type", "operating_system"]
+    )
+
+
+def generate_groups(inventory: pd.DataFrame) -> pd.DataFrame:
+    """
+    Generate a groups dataframe, with a group for each operating
+    system in the inventory.
+
+    Args:
+        inventory: The pandas dataframe object of the inventory.
+
+    Returns:
+        df: The pandas dataframe object of the groups.
+
+    Raises:
+        N/A
+    """
+    return pd.DataFrame(
+        [
+            (os_name, os_name, 22, False)
+            for os_name in inventory["operating_system"].unique()
+        ],
+        columns=["name", "platform", "port", "auth_strict_key"],
+    )
+
+
+def write_binary(
+    render: Callable[..., None], source_file: str, df: pd.DataFrame
+) -> None:
+    """
+    Render the dataframe to a binary source file, using the render function.
+    """
+    with open(source_file, "wb") as f:
+        render(f, df=df)
+
+
+# Specify the function which writes the source file of each source type, from
+# the source file path, the source name and the dataframe
+SOURCE_WRITERS: Dict[str, Callable[[str, str, pd.DataFrame], None]] = {
+    "csv": lambda path, name, df: df.to_csv(path, index=False),
+    "json": lambda path, name, df: df.to_json(path, indent=4, orient="records"),
+    "xlsx": lambda path, name, df: ms.write_xlsx(path, df=df, sheet_name=name),
+    "sqlite": lambda path, name, df: ms.write_sqlite(path, df=df, table_name=name),
+    "parquet": lambda path, name, df: write_binary(ms.render_parquet, path, df),
+    "feather": lambda path, name, df: write_binary(ms.render_feather, path, df),
+}
+
+
+def write_workbook(workbook_file: str, dfs: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write the inventory and groups to the sheets of a single workbook,
+    streaming the rows.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for name, df in dfs.items():
+        ws = wb.create_sheet(title=name)
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(workbook_file)
+
+
+def write_sources(
+    source_dir: str, size: int, source_types: List[str] = SOURCE_TYPES
+) -> None:
+    """
+    Generate the inventory and groups with the number of devices, and
+    write them to the source directory for each of the source types.
+
+    Args:
+        source_dir: The source directory to write the source files to.
+        size: The number of devices in the inventory.
+        source_types: The source types to write the source files for.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Create entry directory and/or check that it exists
+    pl.Path(source_dir).mkdir(parents=True, exist_ok=True)
+    dfs = {"inventory": generate_inventory(size)}
+    dfs["groups"] = generate_groups(dfs["inventory"])
+    for source_type in source_types:
+        if source_type == "workbook":
+            write_workbook(f"{source_dir}/workbook.xlsx", dfs)
+            continue
+        for name, df in dfs.items():
+            SOURCE_WRITERS[source_type](f"{source_dir}/{name}.{source_type}", name, df)
+
+
+@click.command()
+@click.option(
+    "--size",
+    "-s",
+    help="Specify the number of devices to generate. Can be used multiple times.",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=DEFAULT_SIZES,
+    show_default=True,
+)
+@click.option(
+    "--data-dir",
+    "-dd",
+    help="Specify the directory to write the source files to, in a directory per size.",
+    default="benchmarks/data",
+    show_default=True,
+)
+def cli(size: List[int], data_dir: str) -> None:
+    """
+    Generate synthetic source files of each size, for benchmarking.
+    """
+    for devices in size:
+        source_dir = f"{data_dir}/{devices}"
+        write_sources(source_dir, size=devices)
+        click.echo(f"Source files for {devices} devices written to: {source_dir}")
+
+
+if __name__ == "__main__":
+    cli()  # pragma: no cover (ignore pytest)
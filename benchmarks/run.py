@@ -0,0 +1,376 @@
+"""
+This module benchmarks the speed and memory use of every motherstarter
+reader, every writer and the whole workflow, against synthetic source
+files of each size.
+
+The results are saved to a json file, so they can be compared against the
+results of a previous release to find regressions.
+"""
+
+# Import modules
+from __future__ import annotations
+from benchmarks.generate import DEFAULT_SIZES, SOURCE_TYPES, write_sources
+from motherstarter import __version__
+from motherstarter import motherstarter as ms
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import click
+import datetime
+import gc
+import importlib.util
+import json
+import os
+import pathlib as pl
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+
+# Specify the readers which are benchmarked for each source type
+READERS: Dict[str, List[Callable[..., Any]]] = {
+    "csv": [ms.init_inventory_csv, ms.init_groups_csv],
+    "json": [ms.init_inventory_json, ms.init_groups_json],
+    "xlsx": [ms.init_inventory_xlsx, ms.init_groups_xlsx],
+    "workbook": [ms.init_workbook],
+    "sqlite": [ms.init_inventory_sqlite, ms.init_groups_sqlite],
+    "parquet": [ms.init_inventory_parquet, ms.init_groups_parquet],
+    "feather": [ms.init_inventory_feather, ms.init_groups_feather],
+}
+# Specify the default slowdown, as a fraction, which is reported as a regression
+DEFAULT_THRESHOLD = 0.1
+
+
+def read_json_orjson(json_file: str) -> pd.DataFrame:
+    """
+    Read the json file with the orjson parser, which motherstarter uses when
+    the optional orjson dependency is installed.
+    """
+    return ms.read_json(json_file)
+
+
+def read_json_pandas(json_file: str) -> pd.DataFrame:
+    """
+    Read the json file with the pandas parser, which motherstarter falls back
+    to when orjson isn't installed, by hiding orjson while the file is read.
+    """
+    orjson = sys.modules.get("orjson")
+    sys.modules["orjson"] = None  # type: ignore
+    try:
+        return ms.read_json(json_file)
+    finally:
+        if orjson is None:
+            del sys.modules["orjson"]
+        else:
+            sys.modules["orjson"] = orjson
+
+
+# Specify the json parsers which are compared against each other, which are
+# only compared when orjson is installed
+JSON_PARSERS: List[Callable[..., Any]] = []
+if importlib.util.find_spec("orjson") is not None:
+    JSON_PARSERS = [read_json_pandas, read_json_orjson]
+
+
+def measure(
+    func: Callable[..., Any], memory: bool = True, **kwargs: Any
+) -> Tuple[Any, Dict[str, Optional[float]]]:
+    """
+    Execute the function and measure its duration and, optionally, its
+    peak memory use. As tracing memory allocations slows the function
+    down, the function is executed a second time to measure the memory.
+
+    Args:
+        func: The function to execute.
+        memory: Whether to measure the peak memory use.
+        kwargs: The keyword arguments to execute the function with.
+
+    Returns:
+        result: The result of the function.
+        measurements: The dictionary of the duration in seconds and the peak
+        memory use in bytes, which is None when it is not measured.
+
+    Raises:
+        N/A
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = func(**kwargs)
+    seconds = time.perf_counter() - start
+    peak_memory = None
+    if memory:
+        # Release the first result, so it isn't counted against the second
+        del result
+        gc.collect()
+        tracemalloc.start()
+        result = func(**kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, {"seconds": seconds, "peak_memory_bytes": peak_memory}
+
+
+def run_benchmarks(
+    sizes: List[int],
+    data_dir: str,
+    source_types: List[str] = SOURCE_TYPES,
+    memory: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Generate the source files for each size, when they don't exist, and
+    benchmark the readers, the writers and the main workflow against them.
+
+    Args:
+        sizes: The list of inventory sizes, in number of devices.
+        data_dir: The directory of the generated source files.
+        source_types: The source types to benchmark.
+        memory: Whether to measure the peak memory use.
+
+    Returns:
+        results: The list of benchmark results.
+
+    Raises:
+        N/A
+    """
+    logger = ms.init_logger(log_level="CRITICAL", log_name="benchmarks.log")
+    template_dir = os.path.join(ms.dirname, "templates/core/")
+    env = ms.prep_templates(tmpl_dir=template_dir)
+    results = []
+
+    def record(
+        group: str,
+        source_type: str,
+        size: int,
+        func: Callable[..., Any],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        # Measure the benchmark, and record and output its result
+        name = func.__name__
+        result, measurements = measure(func, memory=memory, **kwargs)
+        results.append(
+            {
+                "name": name,
+                "group": group,
+                "source_type": source_type,
+                "size": size,
+                **measurements,
+            }
+        )
+        click.echo(
+            f"{group:<8} {name:<24} {source_type:<9} {size:>8} {measurements['seconds']:.3f}s"
+        )
+        return result
+
+    for size in sizes:
+        # Generate the source files, unless they were generated previously
+        source_dir = f"{data_dir}/{size}"
+        missing = [
+            st
+            for st in source_types
+            for source in ["inventory", "groups"]
+            if not os.path.exists(ms.get_source_files(source_dir, st, source)[0])
+        ]
+        if missing:
+            write_sources(source_dir, size=size, source_types=sorted(set(missing)))
+        # Benchmark each of the readers of each source type
+        for source_type in source_types:
+            for reader in READERS[source_type]:
+                record("reader", source_type, size, reader, {"source_dir": source_dir})
+        # Compare the json parsers on the inventory, and output the speedup
+        if "json" in source_types and JSON_PARSERS:
+            for parser in JSON_PARSERS:
+                json_file = f"{source_dir}/inventory.json"
+                record("parser", "json", size, parser, {"json_file": json_file})
+            pandas_seconds, orjson_seconds = [r["seconds"] for r in results[-2:]]
+            click.echo(
+                f"orjson speedup over pandas: {pandas_seconds / orjson_seconds:.1f}x"
+            )
+        # Benchmark each of the writers, using the dataframes read from csv
+        dfs = {
+            "inventory": ms.init_inventory_csv(source_dir=source_dir),
+            "groups": ms.init_groups_csv(source_dir=source_dir),
+        }
+        with tempfile.TemporaryDirectory() as output_dir:
+            for writer, source, template in ms.get_writers(output_type="all"):
+                kwargs = {"logger": logger, "df": dfs[source], "output_dir": output_dir}
+                if template is not None:
+                    kwargs["env"] = env
+                record("writer", "csv", size, writer, kwargs)
+        # Benchmark the main workflow of each source type, writing all outputs
+        for source_type in source_types:
+            with tempfile.TemporaryDirectory() as run_dir:
+                cwd = os.getcwd()
+                source_path = os.path.abspath(source_dir)
+                os.chdir(run_dir)
+                try:
+                    kwargs = {
+                        "logger": logger,
+                        "source_type": source_type,
+                        "output_type": "all",
+                        "source_dir": source_path,
+                        "template_dir": template_dir,
+                    }
+                    record("main", source_type, size, ms.main, kwargs)
+                finally:
+                    os.chdir(cwd)
+    return results
+
+
+def save_results(results: List[Dict[str, Any]], output_file: str) -> Dict[str, Any]:
+    """
+    Save the benchmark results to a json file, along with the versions
+    and platform which they were measured on.
+
+    Args:
+        results: The list of benchmark results.
+        output_file: The json file to save the results to.
+
+    Returns:
+        report: The dictionary which was saved to the json file.
+
+    Raises:
+        N/A
+    """
+    report = {
+        "motherstarter": __version__,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": results,
+    }
+    # Create entry directory and/or check that it exists
+    pl.Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w") as f:
+        json.dump(report, f, indent=4)
+    return report
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    report: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Compare the benchmark results against the results of a baseline,
+    and return a description of each benchmark which is slower by more
+    than the threshold.
+
+    Args:
+        baseline: The report of the baseline benchmark results.
+        report: The report of the benchmark results.
+        threshold: The slowdown, as a fraction, which is a regression.
+
+    Returns:
+        regressions: The list of regression descriptions.
+
+    Raises:
+        N/A
+    """
+
+    def key(result: Dict[str, Any]) -> Tuple[str, str, str, int]:
+        return (result["group"], result["name"], result["source_type"], result["size"])
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        previous = baseline_results.get(key(result))
+        if previous is None or not previous["seconds"]:
+            continue
+        slowdown = result["seconds"] / previous["seconds"] - 1
+        if slowdown > threshold:
+            group, name, source_type, size = key(result)
+            regressions.append(
+                f"{group} {name} ({source_type}, {size} devices): "
+                f"{previous['seconds']:.3f}s -> {result['seconds']:.3f}s "
+                f"(+{slowdown:.0%})"
+            )
+    return regressions
+
+
+@click.command()
+@click.option(
+    "--size",
+    "-s",
+    help="Specify the number of devices to benchmark. Can be used multiple times.",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=DEFAULT_SIZES,
+    show_default=True,
+)
+@click.option(
+    "--source-type",
+    "-st",
+    help="Specify the source type to benchmark. Can be used multiple times.",
+    multiple=True,
+    type=click.Choice(SOURCE_TYPES),
+    default=SOURCE_TYPES,
+    show_default=True,
+)
+@click.option(
+    "--data-dir",
+    "-dd",
+    help="Specify the directory of the generated source files.",
+    default="benchmarks/data",
+    show_default=True,
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Specify the json file to save the results to.",
+    default=f"benchmarks/results/motherstarter-{__version__}.json",
+    show_default=True,
+)
+@click.option(
+    "--baseline",
+    "-b",
+    help="Specify a json file of previous results to compare the results against.",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--threshold",
+    "-t",
+    help="Specify the slowdown, as a fraction, which is reported as a regression.",
+    default=DEFAULT_THRESHOLD,
+    type=click.FloatRange(min=0),
+    show_default=True,
+)
+@click.option(
+    "--no-memory",
+    help="Skip measuring the peak memory use, which executes each benchmark twice.",
+    is_flag=True,
+    default=False,
+)
+def cli(
+    size: List[int],
+    source_type: List[str],
+    data_dir: str,
+    output: str,
+    baseline: Optional[str],
+    threshold: float,
+    no_memory: bool,
+) -> None:
+    """
+    Benchmark the motherstarter readers, writers and workflow.
+    """
+    results = run_benchmarks(
+        sizes=list(size),
+        data_dir=data_dir,
+        source_types=list(source_type),
+        memory=not no_memory,
+    )
+    report = save_results(results, output_file=output)
+    click.echo(f"Benchmark results written to: {output}")
+    # Compare the results against the baseline, when it is supplied
+    if baseline is not None:
+        with open(baseline) as f:
+            regressions = compare_results(json.load(f), report, threshold=threshold)
+        for regression in regressions:
+            click.echo(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        click.echo(f"No regressions against: {baseline}")
+
+
+if __name__ == "__main__":
+    cli()  # pragma: no cover (ignore pytest)
@@ -0,0 +1,236 @@
+"""
+This module provides the library API of motherstarter, which renders the
+outputs in memory and returns them, rather than writing them to files.
+
+For example:
+
+    from motherstarter.api import render
+
+    outputs = render(output_type="nornir", source_dir="inputs", source_type="csv")
+    hosts_yaml = outputs["hosts.yaml"]
+"""
+
+# Import modules
+from __future__ import annotations
+from functools import partial
+from motherstarter import motherstarter as ms
+from typing import Callable, Dict, Iterable, Optional, Union, TYPE_CHECKING
+import io
+import logging
+import os
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Specify the function which renders the output of each writer to a file
+# object, keyed by writer name. The template renderers are also passed the
+# Jinja2 environment.
+RENDERERS: Dict[str, Callable[..., object]] = {
+    "to_nr_hosts": ms.render_nr_hosts,
+    "to_nr_groups": ms.render_nr_groups,
+    "to_pyats": ms.render_pyats,
+    "to_ansible": ms.render_ansible,
+    "to_ansible_json": ms.render_ansible_json,
+    "to_csv_inventory": ms.render_csv,
+    "to_csv_groups": ms.render_csv,
+    "to_xlsx_inventory": partial(ms.write_xlsx, sheet_name="inventory"),
+    "to_xlsx_groups": partial(ms.write_xlsx, sheet_name="groups"),
+    "to_json_inventory": ms.render_json,
+    "to_json_groups": ms.render_json,
+    "to_parquet_inventory": ms.render_parquet,
+    "to_parquet_groups": ms.render_parquet,
+    "to_feather_inventory": ms.render_feather,
+    "to_feather_groups": ms.render_feather,
+    "to_sqlite_inventory": partial(ms.write_sqlite, table_name="inventory"),
+    "to_sqlite_groups": partial(ms.write_sqlite, table_name="groups"),
+}
+
+# Specify the suffixes of the output files which are rendered to a binary
+# file object, rather than a text file object
+BINARY_SUFFIXES = (".feather", ".parquet", ".sqlite", ".xlsx")
+
+
+def load_sources(
+    sources: Iterable[str] = ("inventory", "groups"),
+    inventory: Optional[pd.DataFrame] = None,
+    groups: Optional[pd.DataFrame] = None,
+    source_dir: Optional[str] = None,
+    source_type: str = "json",
+    cache_dir: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Return the dataframes of the sources, using the supplied dataframes
+    and reading the other sources from the source files.
+
+    Args:
+        sources: The names of the sources to return, "inventory" and/or
+        "groups".
+        inventory: The pandas dataframe object of the inventory, or None to
+        read it from the source files.
+        groups: The pandas dataframe object of the groups, or None to read
+        it from the source files.
+        source_dir: The source directory of the input files, or None for the
+        sample input files.
+        source_type: The source file type to read the inventory and group
+        data from, when they aren't supplied.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+
+    Returns:
+        dfs: The dictionary of pandas dataframe objects, keyed by source name.
+
+    Raises:
+        N/A
+    """
+    # Assign the supplied dataframes, and read the sources which are missing
+    supplied = {"inventory": inventory, "groups": groups}
+    dfs = {s: supplied[s] for s in sources if supplied[s] is not None}
+    missing = sorted({s for s in sources if s not in dfs})
+    source_dir = source_dir or os.path.join(ms.dirname, "inputs")
+    if missing and source_type == "workbook":
+        # Read in all the missing sheets, with one workbook parse
+        dfs.update(
+            ms.init_workbook(
+                source_dir=source_dir, sheet_names=missing, cache_dir=cache_dir
+            )
+        )
+    elif missing:
+        # Retrieve the logger, without initialising it for the application
+        logger = logging.getLogger(ms.__name__)
+        for source in missing:
+            init_source = ms.init_inventory if source == "inventory" else ms.init_groups
+            dfs[source] = init_source(
+                logger=logger,
+                source_dir=source_dir,
+                source_type=source_type,
+                cache_dir=cache_dir,
+            )
+    return dfs
+
+
+def render_streams(
+    output_type: str = "all",
+    inventory: Optional[pd.DataFrame] = None,
+    groups: Optional[pd.DataFrame] = None,
+    source_dir: Optional[str] = None,
+    source_type: str = "json",
+    template_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, Union[io.StringIO, io.BytesIO]]:
+    """
+    Render the outputs of the output type in memory, and return each of
+    them as a file object positioned at the start. The xlsx, parquet,
+    feather and sqlite outputs are binary file objects and the other outputs
+    are text file objects.
+
+    The inventory and groups are rendered from the supplied dataframes, or
+    read from the source files when they aren't supplied.
+
+    Args:
+        output_type: What file type(s) you would like to be outputted.
+        inventory: The pandas dataframe object of the inventory, or None to
+        read it from the source files.
+        groups: The pandas dataframe object of the groups, or None to read
+        it from the source files.
+        source_dir: The source directory of the input files, or None for the
+        sample input files.
+        source_type: The source file type to read the inventory and group
+        data from, when they aren't supplied.
+        template_dir: The template directory of the template files, or None
+        for the core templates.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+
+    Returns:
+        outputs: The dictionary of output file objects, keyed by output file
+        name, such as "hosts.yaml".
+
+    Raises:
+        ValueError: When the output type doesn't exist.
+    """
+    writers = ms.get_writers(output_type=output_type)
+    if not writers:
+        raise ValueError(f"Invalid output type: {output_type}")
+    dfs = load_sources(
+        sources=[source for _, source, _ in writers],
+        inventory=inventory,
+        groups=groups,
+        source_dir=source_dir,
+        source_type=source_type,
+        cache_dir=cache_dir,
+    )
+    # Prepare the jinja2 template environment, when any writer renders a template
+    env = None
+    if any(template is not None for _, _, template in writers):
+        env = ms.prep_templates(
+            tmpl_dir=template_dir or os.path.join(ms.dirname, "templates/core/"),
+            cache_dir=cache_dir,
+        )
+    # Create a dictionary of records, so that each source is only converted
+    # to records once and shared by the template writers
+    records: Dict[str, ms.RecordView] = {}
+    outputs: Dict[str, Union[io.StringIO, io.BytesIO]] = {}
+    for writer, source, template in writers:
+        name = writer.__name__
+        file_name = ms.OUTPUT_FILES[name]
+        # Render the binary outputs to a binary file object, and the others
+        # to a text file object
+        f: Union[io.StringIO, io.BytesIO]
+        f = io.BytesIO() if file_name.endswith(BINARY_SUFFIXES) else io.StringIO()
+        if template is not None:
+            if source not in records:
+                records[source] = ms.RecordView(dfs[source])
+            RENDERERS[name](f, env=env, df=records[source])
+        else:
+            RENDERERS[name](f, df=dfs[source])
+        f.seek(0)
+        outputs[file_name] = f
+    return outputs
+
+
+def render(
+    output_type: str = "all",
+    inventory: Optional[pd.DataFrame] = None,
+    groups: Optional[pd.DataFrame] = None,
+    source_dir: Optional[str] = None,
+    source_type: str = "json",
+    template_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, Union[str, bytes]]:
+    """
+    Render the outputs of the output type in memory, and return the content
+    of each of them. The xlsx, parquet, feather and sqlite outputs are
+    returned as bytes and the other outputs are returned as strings.
+
+    Args:
+        output_type: What file type(s) you would like to be outputted.
+        inventory: The pandas dataframe object of the inventory, or None to
+        read it from the source files.
+        groups: The pandas dataframe object of the groups, or None to read
+        it from the source files.
+        source_dir: The source directory of the input files, or None for the
+        sample input files.
+        source_type: The source file type to read the inventory and group
+        data from, when they aren't supplied.
+        template_dir: The template directory of the template files, or None
+        for the core templates.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+
+    Returns:
+        outputs: The dictionary of output contents, keyed by output file
+        name, such as "hosts.yaml".
+
+    Raises:
+        ValueError: When the output type doesn't exist.
+    """
+    streams = render_streams(
+        output_type=output_type,
+        inventory=inventory,
+        groups=groups,
+        source_dir=source_dir,
+        source_type=source_type,
+        template_dir=template_dir,
+        cache_dir=cache_dir,
+    )
+    return {name: f.getvalue() for name, f in streams.items()}
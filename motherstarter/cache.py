@@ -0,0 +1,333 @@
+"""
+This module provides the on-disk caches used by motherstarter to avoid
+repeating expensive work between runs.
+"""
+
+# Import modules
+from __future__ import annotations
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pathlib as pl
+import tempfile
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Specify the default cache directory, following the XDG base directory
+# specification where it is configured
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")), "motherstarter"
+)
+# Specify the default maximum total size (in bytes) and maximum age (in seconds)
+# of the parsed source cache, before cache files are evicted
+SOURCE_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+SOURCE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def get_cache_dir(cache_dir: Optional[str] = None, name: str = "") -> str:
+    """
+    Take the cache directory and return the named sub-directory
+    of it, creating the directories when they don't exist.
+
+    Args:
+        cache_dir: The cache directory, or None to use the default
+        cache directory.
+        name: The name of the sub-directory for a specific cache.
+
+    Returns:
+        path: The absolute path of the cache sub-directory.
+
+    Raises:
+        N/A
+    """
+    # Expand the user directory, as the default cache directory uses it
+    path = pl.Path(os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR), name)
+    # Create entry directory and/or check that it exists
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path.resolve())
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    A Jinja2 bytecode cache which stores the compiled templates on disk,
+    so that templates are only compiled when they change.
+
+    The cache files are keyed by the template path and modification time,
+    and are validated against a checksum of the template source when loaded.
+    Cache files are written to a temporary file and then renamed, so it is
+    safe to share a cache directory between concurrent processes.
+
+    Args:
+        directory: The directory to store the cache files in.
+
+    Attributes:
+        hits: The number of templates loaded from the cache.
+        misses: The number of templates which had to be compiled.
+    """
+
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory=directory, pattern="__motherstarter_%s.cache")
+        self.hits = 0
+        self.misses = 0
+
+    def get_cache_key(self, name: str, filename: Optional[str] = None) -> str:
+        # Include the modification time of the template in the key, so a
+        # changed template never reads the previous compiled template
+        if filename is not None and os.path.exists(filename):
+            filename = f"{filename}|{os.path.getmtime(filename)}"
+        return super().get_cache_key(name, filename)
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        # Update the counters, based on whether compiled code was loaded
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+
+def file_digest(path: str) -> str:
+    """
+    Take a file path and return the SHA-256 digest of the file content,
+    reading the file in chunks so large files are not held in memory.
+
+    Args:
+        path: The file path.
+
+    Returns:
+        digest: The hex digest of the file content.
+
+    Raises:
+        N/A
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def text_digest(text: str) -> str:
+    """
+    Take a string and return the SHA-256 digest of it.
+
+    Args:
+        text: The string to digest.
+
+    Returns:
+        digest: The hex digest of the string.
+
+    Raises:
+        N/A
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """
+    A manifest of the outputs written by motherstarter and a digest of the
+    inputs they were written from, used to skip outputs which are up to date.
+
+    Every output file of each writer is recorded with its modification time,
+    so a writer with many outputs, such as a sharded writer, is written again
+    when any one of its output files is removed or changed.
+
+    A manifest is stored in the cache directory for each working directory,
+    as the outputs are written relative to the working directory. The
+    manifest is written to a temporary file and then renamed, so concurrent
+    processes never read a partially written manifest.
+
+    Args:
+        cache_dir: The cache directory to store the manifest in.
+
+    Attributes:
+        path: The path of the manifest file.
+        entries: The dictionary of manifest entries, keyed by writer name.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        manifest_name = text_digest(os.getcwd())
+        self.path = os.path.join(
+            get_cache_dir(cache_dir, "builds"), f"{manifest_name}.json"
+        )
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Load the existing manifest. NOTE: A missing or corrupt manifest is
+        # treated as empty, so all outputs are written again
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def is_current(self, name: str, digest: str) -> bool:
+        """
+        Return whether the outputs of the writer were written from inputs with
+        the same digest, and every output file still exists unchanged.
+        """
+        entry = self.entries.get(name)
+        if entry is None or entry.get("digest") != digest:
+            return False
+        outputs = entry.get("outputs")
+        if not isinstance(outputs, dict) or not outputs:
+            return False
+        for output, mtime_ns in outputs.items():
+            try:
+                if os.stat(output).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def update(self, name: str, digest: str, outputs: List[str]) -> None:
+        """
+        Record the digest of the inputs and every output file of the writer,
+        with the modification time it was written with.
+        """
+        self.entries[name] = {
+            "digest": digest,
+            "outputs": {
+                os.path.abspath(output): os.stat(output).st_mtime_ns
+                for output in outputs
+            },
+        }
+
+    def save(self) -> None:
+        """
+        Save the manifest to the cache directory.
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=os.path.dirname(self.path), suffix=".tmp", delete=False
+        ) as f:
+            json.dump(self.entries, f, indent=4)
+        os.replace(f.name, self.path)
+
+
+class SourceCache:
+    """
+    A cache of parsed source files, stored on disk in the Feather format
+    so they can be loaded far faster than the source file can be parsed.
+
+    The cache files are keyed by the source file path, size and modification
+    time, along with any reader options such as the sheet name. Once a cache
+    file is written, the oldest cache files are evicted when they are older
+    than the maximum age, or the cache is larger than the maximum size.
+
+    NOTE: The Feather format requires the optional pyarrow dependency. When
+    it is not installed, the cache is disabled and nothing is cached.
+
+    Args:
+        cache_dir: The cache directory to store the cache files in.
+        max_size: The maximum total size of the cache files, in bytes.
+        max_age: The maximum age of a cache file since it was last used,
+        in seconds.
+
+    Attributes:
+        enabled: Whether the cache is enabled.
+        directory: The directory of the cache files.
+        hits: The number of sources loaded from the cache.
+        misses: The number of sources which had to be parsed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size: int = SOURCE_CACHE_MAX_SIZE,
+        max_age: int = SOURCE_CACHE_MAX_AGE,
+    ) -> None:
+        self.enabled = importlib.util.find_spec("pyarrow") is not None
+        self.directory = get_cache_dir(cache_dir, "sources")
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def get_cache_file(self, path: str, **options: Any) -> str:
+        """
+        Return the cache file path for the source file and reader options.
+        """
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{options}"
+        return os.path.join(self.directory, f"{text_digest(key)}.feather")
+
+    def load(self, path: str, **options: Any) -> Optional[pd.DataFrame]:
+        """
+        Return the cached dataframe for the source file and reader options,
+        or None when it is not cached.
+        """
+        import pandas as pd
+
+        if not self.enabled:
+            return None
+        cache_file = self.get_cache_file(path, **options)
+        try:
+            df = pd.read_feather(cache_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # Update the modification time, so recently used files are evicted last
+        os.utime(cache_file)
+        self.hits += 1
+        return df
+
+    def save(self, path: str, df: pd.DataFrame, **options: Any) -> None:
+        """
+        Save the dataframe for the source file and reader options to the
+        cache, and then evict any cache files over the limits. Dataframes
+        which can't be saved in the Feather format, such as those with a
+        column of mixed types, aren't cached.
+        """
+        if not self.enabled:
+            return
+        import pyarrow as pa  # type: ignore
+
+        cache_file = self.get_cache_file(path, **options)
+        # Write to a temporary file and then rename, so concurrent processes
+        # never read a partially written cache file
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            try:
+                df.reset_index(drop=True).to_feather(f.name)
+            except (pa.ArrowException, TypeError, ValueError) as err:
+                logging.getLogger(__name__).debug(
+                    "Source not cached, as it can't be saved as Feather: %s: %r",
+                    path,
+                    err,
+                )
+                f.close()
+                os.remove(f.name)
+                return
+        os.replace(f.name, cache_file)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the cache files older than the maximum age, and then remove
+        the least recently used cache files until the cache is no larger than
+        the maximum size.
+        """
+        now = time.time()
+        files = []
+        for cache_file in pl.Path(self.directory).glob("*.feather"):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                cache_file.unlink(missing_ok=True)
+            else:
+                files.append((stat.st_mtime, stat.st_size, cache_file))
+        # Remove the least recently used files, until the cache fits
+        total_size = sum(size for _, size, _ in files)
+        for _, size, cache_file in sorted(files):
+            if total_size <= self.max_size:
+                break
+            cache_file.unlink(missing_ok=True)
+            total_size -= size
@@ -0,0 +1,216 @@
+"""
+This module provides the instrumentation used by motherstarter to measure
+the duration, rows processed and bytes written by each stage of a run.
+"""
+
+# Import modules
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+import json
+import os
+import pathlib as pl
+import time
+import tracemalloc
+
+if TYPE_CHECKING:
+    import cProfile
+
+# Specify the number of functions in each section of the profile report
+PROFILE_REPORT_LIMIT = 50
+
+
+class Metrics:
+    """
+    A collection of the metrics of each stage of a motherstarter run, in
+    the order the stages finished.
+
+    Each stage is a dictionary of the stage name, the duration in seconds,
+    the number of rows processed, the number of bytes written and the peak
+    memory allocated by the stage, above the memory already allocated when
+    it started. These are None when they don't apply to a stage, or
+    are unknown.
+
+    NOTE: Tracing memory allocations slows down the run, so the peak memory
+    is only recorded when it is enabled. Before Python 3.9 the peak cannot
+    be reset, so it is the peak since tracing started rather than the peak
+    of each stage.
+
+    Args:
+        trace_memory: Whether to trace memory allocations, to record the
+        peak memory allocated by each stage.
+
+    Attributes:
+        stages: The list of stage dictionaries.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.stages: List[Dict[str, Any]] = []
+        self.start = time.perf_counter()
+        self.trace_memory = trace_memory
+        if trace_memory:
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        """
+        Stop tracing memory allocations, when it is enabled.
+        """
+        if self.trace_memory:
+            tracemalloc.stop()
+            self.trace_memory = False
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Measure the duration of the code executed in the context, as the
+        stage with the name. The stage dictionary is yielded, so that the
+        rows and bytes can be set once they are known.
+        """
+        entry = {
+            "stage": name,
+            "seconds": 0.0,
+            "rows": rows,
+            "bytes": None,
+            "peak_memory_bytes": None,
+        }
+        # Reset the peak memory, so only this stage's allocations are counted
+        # above the memory which was already allocated when it started
+        base_memory = 0
+        if self.trace_memory:
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["seconds"] = time.perf_counter() - start
+            if self.trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - base_memory
+                entry["peak_memory_bytes"] = max(peak_memory, 0)
+            self.stages.append(entry)
+
+    def add(
+        self,
+        name: str,
+        seconds: float,
+        rows: Optional[int] = None,
+        output: Optional[str] = None,
+    ) -> None:
+        """
+        Add a stage which was measured elsewhere, such as in a writer process.
+        When an output file is supplied, its size is recorded as the bytes.
+        NOTE: The peak memory of stages measured elsewhere is not known.
+        """
+        self.stages.append(
+            {
+                "stage": name,
+                "seconds": seconds,
+                "rows": rows,
+                "bytes": file_size(output),
+                "peak_memory_bytes": None,
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the metrics as a dictionary, including the total duration of
+        the run so far.
+        """
+        return {
+            "total_seconds": time.perf_counter() - self.start,
+            "stages": self.stages,
+        }
+
+    def save(self, metrics_file: str) -> None:
+        """
+        Save the metrics to a json file.
+        """
+        # Create entry directory and/or check that it exists
+        pl.Path(metrics_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(metrics_file, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    def summary(self) -> str:
+        """
+        Return the metrics as a table of the stages, with a total row. The
+        peak memory column is only included when any stage recorded it.
+        """
+        metrics = self.to_dict()
+        columns = ["rows", "bytes"]
+        header = ["Stage", "Seconds", "Rows", "Bytes"]
+        if any(entry["peak_memory_bytes"] is not None for entry in self.stages):
+            columns.append("peak_memory_bytes")
+            header.append("Peak memory")
+        rows = [header]
+        for entry in metrics["stages"]:
+            rows.append(
+                [entry["stage"], f"{entry['seconds']:.3f}"]
+                + ["-" if entry[c] is None else str(entry[c]) for c in columns]
+            )
+        rows.append(["total", f"{metrics['total_seconds']:.3f}"] + ["-"] * len(columns))
+        # Left align the stage names and right align the numbers
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [v.rjust(w) for v, w in zip(row[1:], widths[1:])]
+            )
+            for row in rows
+        )
+
+
+def file_size(path: Optional[str]) -> Optional[int]:
+    """
+    Take a file path and return the size of the file in bytes, or None
+    when there is no path or the file doesn't exist.
+
+    Args:
+        path: The file path.
+
+    Returns:
+        size: The size of the file in bytes.
+
+    Raises:
+        N/A
+    """
+    if path is None:
+        return None
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def save_profile(
+    profile: cProfile.Profile,
+    stats_file: str,
+    report_file: str,
+    limit: int = PROFILE_REPORT_LIMIT,
+) -> None:
+    """
+    Save the raw stats of the profile, which can be loaded with pstats or
+    a profile viewer, and a report of the hotspots of the profile. The
+    report lists the functions with the highest cumulative time, followed
+    by the functions with the highest time spent in the function itself.
+
+    Args:
+        profile: The profile of the run.
+        stats_file: The file to save the raw stats to.
+        report_file: The file to save the hotspot report to.
+        limit: The number of functions in each section of the report.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    import pstats
+
+    profile.dump_stats(stats_file)
+    with open(report_file, "w") as f:
+        stats = pstats.Stats(profile, stream=f)
+        for sort_key in ["cumulative", "tottime"]:
+            f.write(f"Hotspots sorted by {sort_key} time:\n")
+            stats.sort_stats(sort_key).print_stats(limit)
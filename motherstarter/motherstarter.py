@@ -6,17 +6,43 @@ used to perform network automation tasks.
 """
 
 # Import modules
-import pandas as pd
-from jinja2 import Environment, FileSystemLoader
+# NOTE: pandas, jinja2, colorama and concurrent.futures are slow to import,
+# so they are imported inside the functions which use them. This keeps the
+# start up time of commands such as "motherstarter --version" to a minimum.
+from __future__ import annotations
 import pathlib as pl
-from colorama import init  # type: ignore
 from logging import Logger
 import logging
 import click
-from typing import Optional, TextIO, Union, List, Dict, Any
+from typing import (
+    Optional,
+    TextIO,
+    BinaryIO,
+    Union,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Tuple,
+    Iterator,
+    Iterable,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
+)
+from collections.abc import Mapping
 from motherstarter import __version__
+import json
 import os
+import re
 import sys
+import tempfile
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from jinja2 import Environment
+    from concurrent.futures import Future
+    from motherstarter.metrics import Metrics
 
 
 # Get path of the current dir under which the file is executed
@@ -25,8 +51,118 @@ dirname = os.path.dirname(os.path.abspath(__file__))
 # files and templates
 sys.path.append(os.path.join(dirname))
 
-# Auto-reset colorama colours back after each print statement
-init(autoreset=True)
+# Specify the buffer size used when streaming rendered templates to a file
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Specify the type of a writer tuple, which is the writer function, the source
+# it is passed and the name of the template it renders (None when it doesn't)
+WriterSpec = Tuple[Callable[..., Any], str, Optional[str]]
+
+# Specify the type of a writer task, which is a writer executed against one
+# source (or one shard of it). It is the task name, the writer function, the
+# source (or shard) it is passed, the name of the template it renders and the
+# output directory, which is an empty string for the default output directory
+WriterTask = Tuple[str, Callable[..., Any], str, Optional[str], str]
+
+# Specify the operating systems which always have an Ansible group, in the
+# order they are outputted. Other operating systems are outputted after these.
+ANSIBLE_OS_GROUPS = ["ios", "nxos", "iosxr", "junos", "eos"]
+
+# Specify the group vars of each Ansible operating system group, and of the
+# "all" group, as per the ansible/hosts.j2 template. These are used by the
+# Ansible dynamic inventory json output.
+ANSIBLE_GROUP_VARS: Dict[str, Dict[str, str]] = {
+    "ios": {"ansible_network_os": "cisco.ios.ios", "os": "ios"},
+    "nxos": {"ansible_network_os": "cisco.nxos.nxos", "os": "nxos"},
+    "iosxr": {"ansible_network_os": "cisco.iosxr.iosxr", "os": "iosxr"},
+    "junos": {
+        "ansible_network_os": "junipernetworks.junos.junos",
+        "os": "junos",
+        "ansible_connection": "netconf",
+    },
+    "eos": {"ansible_network_os": "arista.eos.eos", "os": "eos"},
+    "all": {
+        "ansible_connection": "network_cli",
+        "ansible_user": "{{lookup('env','ANSIBLE_NET_UNAME')}}",
+        # The password is looked up from the environment by Ansible
+        "ansible_password": "{{lookup('env','ANSIBLE_NET_PWORD')}}",  # nosec B105
+    },
+}
+
+# Specify the default output directory of each writer, keyed by writer name
+OUTPUT_DIRS = {
+    "to_nr_hosts": "motherstarter/outputs/nr/inventory",
+    "to_nr_groups": "motherstarter/outputs/nr/inventory",
+    "to_pyats": "motherstarter/outputs/pyats",
+    "to_ansible": "motherstarter/outputs/ansible/inventory",
+    "to_ansible_json": "motherstarter/outputs/ansible/inventory",
+    "to_csv_inventory": "motherstarter/outputs/csv",
+    "to_csv_groups": "motherstarter/outputs/csv",
+    "to_xlsx_inventory": "motherstarter/outputs/xlsx",
+    "to_xlsx_groups": "motherstarter/outputs/xlsx",
+    "to_json_inventory": "motherstarter/outputs/json",
+    "to_json_groups": "motherstarter/outputs/json",
+    "to_parquet_inventory": "motherstarter/outputs/parquet",
+    "to_parquet_groups": "motherstarter/outputs/parquet",
+    "to_feather_inventory": "motherstarter/outputs/feather",
+    "to_feather_groups": "motherstarter/outputs/feather",
+    "to_sqlite_inventory": "motherstarter/outputs/sqlite",
+    "to_sqlite_groups": "motherstarter/outputs/sqlite",
+}
+
+# Specify the output file name of each writer, keyed by writer name
+OUTPUT_FILES = {
+    "to_nr_hosts": "hosts.yaml",
+    "to_nr_groups": "groups.yaml",
+    "to_pyats": "mother_starter_tb.yaml",
+    "to_ansible": "hosts",
+    "to_ansible_json": "hosts.json",
+    "to_csv_inventory": "inventory.csv",
+    "to_csv_groups": "groups.csv",
+    "to_xlsx_inventory": "inventory.xlsx",
+    "to_xlsx_groups": "groups.xlsx",
+    "to_json_inventory": "inventory.json",
+    "to_json_groups": "groups.json",
+    "to_parquet_inventory": "inventory.parquet",
+    "to_parquet_groups": "groups.parquet",
+    "to_feather_inventory": "inventory.feather",
+    "to_feather_groups": "groups.feather",
+    "to_sqlite_inventory": "inventory.sqlite",
+    "to_sqlite_groups": "groups.sqlite",
+}
+
+# Specify the output types which support reading the inventory in chunks
+CHUNKED_OUTPUT_TYPES = ["ansible", "csv", "nornir", "pyats", "xlsx"]
+
+# Specify the files which the profile of a run is saved to, when profiling
+PROFILE_STATS_FILE = "motherstarter.prof"
+PROFILE_REPORT_FILE = "motherstarter-profile.txt"
+
+# Specify the columns which are indexed in the sqlite outputs, when they are
+# in the table, so the sqlite source can be queried by them
+SQLITE_INDEX_COLUMNS = ["name", "mgmt_ip", "operating_system"]
+
+# Specify the maximum number of rows in an xlsx worksheet, including the header
+# row. Outputs with more rows than this are split across multiple worksheets.
+XLSX_MAX_ROWS = 1048576
+
+# Specify the dtypes of the inventory and groups columns. Columns with a handful
+# of distinct values repeated across every row are stored as categories, and the
+# unique string columns are stored as Arrow-backed strings.
+# NOTE: Arrow-backed strings require the optional pyarrow dependency. When it
+# is not installed, those columns are left as they were read.
+INVENTORY_SCHEMA = {
+    "name": "string[pyarrow]",
+    "mgmt_ip": "string[pyarrow]",
+    "vendor": "category",
+    "device_type": "category",
+    "operating_system": "category",
+}
+GROUPS_SCHEMA = {
+    "name": "string[pyarrow]",
+    "platform": "category",
+    "auth_strict_key": "category",
+}
 
 
 # This block of code initialises motherstarter from the command
@@ -65,7 +201,10 @@ def cli() -> None:
     "-st",
     help="Specify the source file type.",
     default="json",
-    type=click.Choice(["csv", "json", "xlsx"], case_sensitive=False),
+    type=click.Choice(
+        ["csv", "feather", "json", "parquet", "sqlite", "workbook", "xlsx"],
+        case_sensitive=False,
+    ),
     show_default=True,
 )
 @click.option(
@@ -88,17 +227,111 @@ def cli() -> None:
     help="Specify the output file types.  This argument only takes one option.",
     default="all",
     type=click.Choice(
-        ["all", "ansible", "csv", "json", "nornir", "pyats", "xlsx"],
+        [
+            "all",
+            "ansible",
+            "ansible_json",
+            "csv",
+            "feather",
+            "json",
+            "nornir",
+            "parquet",
+            "pyats",
+            "sqlite",
+            "xlsx",
+        ],
         case_sensitive=False,
     ),
     show_default=True,
 )
+@click.option(
+    "--jobs",
+    "-j",
+    help="Specify the number of parallel processes used to write the outputs.",
+    default=1,
+    type=click.IntRange(min=1),
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    "-cd",
+    help="Specify the cache directory for the on-disk caches.  [default: "
+    "$XDG_CACHE_HOME/motherstarter or ~/.cache/motherstarter]",
+    default=None,
+)
+@click.option(
+    "--no-cache",
+    help="Disable the on-disk caches.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--incremental",
+    "-i",
+    help="Skip the outputs whose inputs are unchanged since they were last written.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--chunk-size",
+    "-cs",
+    help="Read the csv inventory in chunks of this many rows, so that memory "
+    "use does not grow with the inventory size.  Only supported by the "
+    "ansible, csv, nornir, pyats and xlsx output types.",
+    default=None,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--metrics-file",
+    "-mf",
+    help="Specify a json file to save the duration, rows and bytes of each stage to.",
+    default=None,
+)
+@click.option(
+    "--shard-by",
+    "-sb",
+    help="Shard the inventory outputs by the values of this inventory column, "
+    "such as operating_system, writing each shard to its own directory.",
+    default=None,
+)
+@click.option(
+    "--where",
+    "-w",
+    help="Only read the inventory rows which match this SQL WHERE clause, such "
+    "as \"operating_system = 'ios'\".  The clause is run as it is against the "
+    "read-only database, so only pass trusted input.  Only supported by the "
+    "sqlite source type.",
+    default=None,
+)
+@click.option(
+    "--profile",
+    help=f"Profile the run, saving the raw stats to {PROFILE_STATS_FILE} and a "
+    f"report of the hotspots to {PROFILE_REPORT_FILE}.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--profile-memory",
+    help="Record the peak memory allocated by each stage in the metrics.",
+    is_flag=True,
+    default=False,
+)
 def convert(
     log_level: str,
     source_type: str,
     source_dir: str,
     template_dir: str,
     output_type: str,
+    jobs: int,
+    cache_dir: Optional[str],
+    no_cache: bool,
+    incremental: bool,
+    chunk_size: Optional[int],
+    metrics_file: Optional[str],
+    shard_by: Optional[str],
+    where: Optional[str],
+    profile: bool,
+    profile_memory: bool,
 ) -> None:
     """
     Convert source file(s) into network automation inventory outputs
@@ -112,12 +345,29 @@ def convert(
         log_level: The severity logging level for all events. Valid
         options: "debug", "info", "warning", "error" and "critical".
         source_type: The source file type to read the inventory/group
-        data from. Valid options: "csv", "json" and "xlsx".\n
+        data from. Valid options: "csv", "feather", "json", "parquet",
+        "sqlite", "workbook" and "xlsx".\n
         source_dir: The source directory to find the files in.\n
         template_dir: The template directory to find the templates in.\n
         output_type: What file type(s) you would like to be outputted
         as a result of running the function. Valid options: "all", "ansible",
-        "csv", "json", "nornir", "pyats" and "xlsx".\n
+        "ansible_json", "csv", "feather", "json", "nornir", "parquet", "pyats",
+        "sqlite" and "xlsx".\n
+        jobs: The number of parallel processes used to write the outputs.
+        The default of 1 writes the outputs one after another.\n
+        cache_dir: The cache directory for the on-disk caches.\n
+        no_cache: Disable the on-disk caches.\n
+        incremental: Skip the outputs whose source files, templates,
+        motherstarter version and output type are unchanged since they were
+        last written.\n
+        chunk_size: The number of rows in each chunk, when reading the csv
+        inventory in chunks.\n
+        metrics_file: The json file to save the metrics of each stage to.\n
+        shard_by: The inventory column to shard the inventory outputs by.\n
+        where: The SQL WHERE clause which the sqlite inventory rows are
+        filtered by.\n
+        profile: Profile the run and save the raw stats and hotspot report.\n
+        profile_memory: Record the peak memory allocated by each stage.\n
 
     Returns:
         N/A
@@ -125,6 +375,13 @@ def convert(
     Raises:
         N/A
     """
+    # Import colorama, the cache defaults and metrics, only when converting
+    from colorama import init
+    from motherstarter.cache import DEFAULT_CACHE_DIR
+    from motherstarter.metrics import Metrics
+
+    # Auto-reset colorama colours back after each print statement
+    init(autoreset=True)
     # Convert log level to an upper-case variable
     ll = log_level.upper()
     # Rename the other inputs for usage below
@@ -150,10 +407,427 @@ def convert(
     else:
         # If the user supplies something, use that instead.
         sd = source_dir
+    # If/else block to handle disabling the caches, or using the default
+    # cache directory when the user doesn't specify one
+    if no_cache:
+        cd = None
+    else:
+        cd = cache_dir or DEFAULT_CACHE_DIR
     # Initialise the logger
     logger = init_logger(log_level=ll, log_name="motherstarter.log")
-    # Initialise the main workflow
-    main(logger=logger, source_type=st, output_type=ot, source_dir=sd, template_dir=td)
+    # Initialise the metrics and profiler, which are reported even when the
+    # workflow fails
+    metrics = Metrics(trace_memory=profile_memory)
+    profiler = None
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        # Initialise the main workflow
+        main(
+            logger=logger,
+            source_type=st,
+            output_type=ot,
+            source_dir=sd,
+            template_dir=td,
+            jobs=jobs,
+            cache_dir=cd,
+            incremental=incremental,
+            chunk_size=chunk_size,
+            metrics=metrics,
+            shard_by=shard_by,
+            where=where,
+        )
+    finally:
+        metrics.stop()
+        # Save the profile of the run, when profiling
+        if profiler is not None:
+            from motherstarter.metrics import save_profile
+
+            profiler.disable()
+            save_profile(
+                profiler,
+                stats_file=PROFILE_STATS_FILE,
+                report_file=PROFILE_REPORT_FILE,
+            )
+            logger.info(f"Profile output location: {PROFILE_REPORT_FILE}")
+        # Output the metrics summary and save them, when a file is specified
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Stage metrics:\n%s", metrics.summary())
+        if metrics_file is not None:
+            metrics.save(metrics_file)
+            logger.info(f"Metrics output location: {metrics_file}")
+        # Write the queued records, so the output is complete on return
+        flush_logger()
+
+
+@cli.command()
+@click.option(
+    "--log-level",
+    "-l",
+    help="Specify the logging level.",
+    default="info",
+    type=click.Choice(
+        ["debug", "info", "warning", "error", "critical"], case_sensitive=False
+    ),
+    show_default=True,
+)
+@click.option(
+    "--source-type",
+    "-st",
+    help="Specify the source file type.",
+    default="json",
+    type=click.Choice(
+        ["csv", "feather", "json", "parquet", "sqlite", "workbook", "xlsx"],
+        case_sensitive=False,
+    ),
+    show_default=True,
+)
+@click.option(
+    "--source-dir",
+    "-sd",
+    help="Specify the source directory for the source files.",  # noqa (pylama ignore)
+    default="motherstarter/inputs/",
+    show_default=True,
+)
+@click.option(
+    "--template-dir",
+    "-td",
+    help="Specify the template directory for the template files.",  # noqa (pylama ignore)
+    default="motherstarter/templates/core/",
+    show_default=True,
+)
+@click.option(
+    "--output-type",
+    "-o",
+    help="Specify the output file types.  This argument only takes one option.",
+    default="all",
+    type=click.Choice(
+        [
+            "all",
+            "ansible",
+            "ansible_json",
+            "csv",
+            "feather",
+            "json",
+            "nornir",
+            "parquet",
+            "pyats",
+            "sqlite",
+            "xlsx",
+        ],
+        case_sensitive=False,
+    ),
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    "-cd",
+    help="Specify the cache directory for the on-disk caches.  [default: "
+    "$XDG_CACHE_HOME/motherstarter or ~/.cache/motherstarter]",
+    default=None,
+)
+@click.option(
+    "--no-cache",
+    help="Disable the on-disk caches.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--interval",
+    "-in",
+    help="Specify how often to check the source and template files for changes, "
+    "in seconds.",
+    default=1.0,
+    type=click.FloatRange(min=0.1),
+    show_default=True,
+)
+@click.option(
+    "--debounce",
+    "-db",
+    help="Specify how long the files must be unchanged before regenerating the "
+    "outputs, in seconds.",
+    default=0.5,
+    type=click.FloatRange(min=0),
+    show_default=True,
+)
+def watch(
+    log_level: str,
+    source_type: str,
+    source_dir: str,
+    template_dir: str,
+    output_type: str,
+    cache_dir: Optional[str],
+    no_cache: bool,
+    interval: float,
+    debounce: float,
+) -> None:
+    """
+    Watch the source and template files, and regenerate the outputs
+    affected by each change until interrupted.
+
+    Args:\n
+        log_level: The severity logging level for all events. Valid
+        options: "debug", "info", "warning", "error" and "critical".
+        source_type: The source file type to read the inventory/group
+        data from. Valid options: "csv", "feather", "json", "parquet",
+        "sqlite", "workbook" and "xlsx".\n
+        source_dir: The source directory to find the files in.\n
+        template_dir: The template directory to find the templates in.\n
+        output_type: What file type(s) you would like to be outputted
+        as a result of running the function. Valid options: "all", "ansible",
+        "ansible_json", "csv", "feather", "json", "nornir", "parquet", "pyats",
+        "sqlite" and "xlsx".\n
+        cache_dir: The cache directory for the on-disk caches.\n
+        no_cache: Disable the on-disk caches.\n
+        interval: How often to check the files for changes, in seconds.\n
+        debounce: How long the files must be unchanged before regenerating
+        the outputs, in seconds.\n
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Import colorama, the cache defaults and the watcher, only when watching
+    from colorama import init
+    from motherstarter.cache import DEFAULT_CACHE_DIR
+    from motherstarter.watch import SourceWatcher
+
+    # Auto-reset colorama colours back after each print statement
+    init(autoreset=True)
+    # Use the default template and source directories, relative to the
+    # absolute path of the file, when the user doesn't specify them
+    if template_dir == "motherstarter/templates/core/":
+        td = os.path.join(dirname, "templates/core/")
+    else:
+        td = template_dir
+    if source_dir == "motherstarter/inputs/":
+        sd = os.path.join(dirname, "inputs/")
+    else:
+        sd = source_dir
+    # If/else block to handle disabling the caches, or using the default
+    # cache directory when the user doesn't specify one
+    if no_cache:
+        cd = None
+    else:
+        cd = cache_dir or DEFAULT_CACHE_DIR
+    # Initialise the logger
+    logger = init_logger(log_level=log_level.upper(), log_name="motherstarter.log")
+    watcher = SourceWatcher(
+        logger=logger,
+        source_type=source_type,
+        output_type=output_type,
+        source_dir=sd,
+        template_dir=td,
+        cache_dir=cd,
+    )
+    try:
+        watcher.run(interval=interval, debounce=debounce)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        # Write the queued records, so the output is complete on return
+        flush_logger()
+
+
+@cli.command()
+@click.option(
+    "--log-level",
+    "-l",
+    help="Specify the logging level.",
+    default="info",
+    type=click.Choice(
+        ["debug", "info", "warning", "error", "critical"], case_sensitive=False
+    ),
+    show_default=True,
+)
+@click.option(
+    "--source-type",
+    "-st",
+    help="Specify the source file type.",
+    default="json",
+    type=click.Choice(
+        ["csv", "feather", "json", "parquet", "sqlite", "workbook", "xlsx"],
+        case_sensitive=False,
+    ),
+    show_default=True,
+)
+@click.option(
+    "--source-dir",
+    "-sd",
+    help="Specify the source directory for the source files.",  # noqa (pylama ignore)
+    default="motherstarter/inputs/",
+    show_default=True,
+)
+@click.option(
+    "--template-dir",
+    "-td",
+    help="Specify the template directory for the template files.",  # noqa (pylama ignore)
+    default="motherstarter/templates/core/",
+    show_default=True,
+)
+@click.option(
+    "--cache-dir",
+    "-cd",
+    help="Specify the cache directory for the on-disk caches.  [default: "
+    "$XDG_CACHE_HOME/motherstarter or ~/.cache/motherstarter]",
+    default=None,
+)
+@click.option(
+    "--no-cache",
+    help="Disable the on-disk caches.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--host",
+    "-H",
+    help="Specify the host address to listen on.",
+    default="127.0.0.1",
+    show_default=True,
+)
+@click.option(
+    "--port",
+    "-p",
+    help="Specify the TCP port to listen on.",
+    default=8000,
+    type=click.IntRange(min=0, max=65535),
+    show_default=True,
+)
+@click.option(
+    "--socket",
+    "-so",
+    "socket_path",
+    help="Specify a Unix socket path to listen on, instead of the host and port.",
+    default=None,
+)
+def serve(
+    log_level: str,
+    source_type: str,
+    source_dir: str,
+    template_dir: str,
+    cache_dir: Optional[str],
+    no_cache: bool,
+    host: str,
+    port: int,
+    socket_path: Optional[str],
+) -> None:
+    """
+    Serve the outputs over HTTP, rendering each output type on demand
+    until interrupted.
+
+    For example:
+        GET /nornir/hosts.yaml
+
+    Args:\n
+        log_level: The severity logging level for all events. Valid
+        options: "debug", "info", "warning", "error" and "critical".
+        source_type: The source file type to read the inventory/group
+        data from. Valid options: "csv", "feather", "json", "parquet",
+        "sqlite", "workbook" and "xlsx".\n
+        source_dir: The source directory to find the files in.\n
+        template_dir: The template directory to find the templates in.\n
+        cache_dir: The cache directory for the on-disk caches.\n
+        no_cache: Disable the on-disk caches.\n
+        host: The host address to listen on.\n
+        port: The TCP port to listen on.\n
+        socket_path: The Unix socket path to listen on, instead of the host
+        and port.\n
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Import colorama, the cache defaults and the service, only when serving
+    from colorama import init
+    from motherstarter.cache import DEFAULT_CACHE_DIR
+    from motherstarter.serve import RenderServer, RenderService, make_server
+
+    # Auto-reset colorama colours back after each print statement
+    init(autoreset=True)
+    # Use the default template and source directories, relative to the
+    # absolute path of the file, when the user doesn't specify them
+    if template_dir == "motherstarter/templates/core/":
+        td = os.path.join(dirname, "templates/core/")
+    else:
+        td = template_dir
+    if source_dir == "motherstarter/inputs/":
+        sd = os.path.join(dirname, "inputs/")
+    else:
+        sd = source_dir
+    # If/else block to handle disabling the caches, or using the default
+    # cache directory when the user doesn't specify one
+    if no_cache:
+        cd = None
+    else:
+        cd = cache_dir or DEFAULT_CACHE_DIR
+    # Initialise the logger
+    logger = init_logger(log_level=log_level.upper(), log_name="motherstarter.log")
+    # Render the outputs to a temporary directory, which is removed on exit
+    with tempfile.TemporaryDirectory() as output_dir:
+        service = RenderService(
+            logger=logger,
+            source_type=source_type,
+            source_dir=sd,
+            template_dir=td,
+            output_dir=output_dir,
+            cache_dir=cd,
+        )
+        with make_server(
+            service, host=host, port=port, socket_path=socket_path
+        ) as server:
+            if isinstance(server, RenderServer):
+                address = f"http://{host}:{server.server_port}"
+            else:
+                address = str(socket_path)
+            logger.info(f"Serving the outputs on: {address}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                logger.info("Stopped serving")
+            finally:
+                # Write the queued records, so the output is complete on return
+                flush_logger()
+        # Remove the Unix socket, so it isn't left behind
+        if socket_path is not None and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class StderrHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """
+    A stream handler which writes to the current sys.stderr, rather than
+    the sys.stderr when it was created. This keeps the console output
+    visible when sys.stderr is replaced after the logger is initialised,
+    such as by colorama or the click test runner.
+    """
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self) -> Any:
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value: Any) -> None:
+        pass
+
+
+# Specify the state of the logging queue and listener of this process. The
+# file and console handlers are executed by the listener in a background
+# thread, so that log I/O is kept off the hot path.
+LOG_STATE: Dict[str, Any] = {
+    "pid": None,
+    "queue": None,
+    "listener": None,
+    "log_name": None,
+}
 
 
 def init_logger(log_level: str, log_name: str = "ms.log") -> Logger:
@@ -163,6 +837,11 @@ def init_logger(log_level: str, log_name: str = "ms.log") -> Logger:
     The log_level is passed into the function and used to set
     the logging level.
 
+    The logger puts each record on a queue, and a background listener
+    writes the queued records to the log file and the console. Calling
+    this function again only changes the logging level and, when it is
+    different, the log file, so the records are never written twice.
+
     Args:
         log_level: The severity logging level for all events
         log_name: The name of the log file.
@@ -173,17 +852,12 @@ def init_logger(log_level: str, log_name: str = "ms.log") -> Logger:
     Raises:
         N/A
     """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
     # Create a logger object
     logger = logging.getLogger(__name__)
-    # Setup the logging formatters for log and stream outputs
-    log_fmt = logging.Formatter("%(asctime)s - " "%(levelname)s - " "%(message)s")
-    stream_fmt = logging.Formatter("%(levelname)s - " "%(message)s")
-    # Setup file handler and use a different log format for output
-    f_handler = logging.FileHandler(log_name)
-    f_handler.setFormatter(log_fmt)
-    # Setup stream handler and use a different log format for output
-    s_handler = logging.StreamHandler()
-    s_handler.setFormatter(stream_fmt)
     # Create a dictionary of log_level mappings
     logger_map = {
         "INFO": logging.INFO,
@@ -196,18 +870,99 @@ def init_logger(log_level: str, log_name: str = "ms.log") -> Logger:
     # taken from the user using argparse and the log_level dictionary map above
     # NOTE: This will be an integer value
     # https://docs.python.org/3/library/logging.html#logging-levels
-    log_integer = logger_map.get(log_level)
-    logger.setLevel(level=log_integer)  # type: ignore
-    f_handler.setLevel(level=log_integer)  # type: ignore
-    s_handler.setLevel(level=log_integer)  # type: ignore
-    # Add these handlers to the logger objects
-    logger.addHandler(f_handler)
-    logger.addHandler(s_handler)
+    log_integer = logger_map.get(log_level, logging.NOTSET)
+    logger.setLevel(level=log_integer)
+    listener = LOG_STATE["listener"]
+    # Only set up the handlers when they weren't set up by this process, or the
+    # log file changed. NOTE: A forked process inherits the handlers, but not
+    # the listener thread, so it sets up its own.
+    if LOG_STATE["pid"] != os.getpid() or LOG_STATE["log_name"] != os.path.abspath(
+        log_name
+    ):
+        # Stop the previous listener, writing any records which are queued
+        if listener is not None and LOG_STATE["pid"] == os.getpid():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        # Setup file handler and use a different log format for output
+        f_handler = logging.FileHandler(log_name)
+        f_handler.setFormatter(
+            logging.Formatter("%(asctime)s - " "%(levelname)s - " "%(message)s")
+        )
+        # Setup stream handler and use a different log format for output
+        s_handler = StderrHandler()
+        s_handler.setFormatter(logging.Formatter("%(levelname)s - " "%(message)s"))
+        # Add the queue handler to the logger object, and start the listener
+        # which executes the file and stream handlers
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        listener = QueueListener(log_queue, f_handler, s_handler)
+        listener.start()
+        logger.addHandler(QueueHandler(log_queue))
+        # Stop the listener when the process exits, writing any queued records
+        if LOG_STATE["pid"] != os.getpid():
+            atexit.register(stop_logger)
+        LOG_STATE.update(
+            pid=os.getpid(),
+            queue=log_queue,
+            listener=listener,
+            log_name=os.path.abspath(log_name),
+        )
+    for handler in listener.handlers:
+        handler.setLevel(level=log_integer)
     return logger
 
 
+def flush_logger() -> None:
+    """
+    Wait until the listener has written every queued record to the log file
+    and the console. Used before returning to the caller, so the output of a
+    command is complete when it finishes.
+
+    Args:
+        N/A
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    if LOG_STATE["listener"] is not None and LOG_STATE["pid"] == os.getpid():
+        LOG_STATE["queue"].join()
+
+
+def stop_logger() -> None:
+    """
+    Stop the listener, once it has written every queued record, and close
+    the file and console handlers.
+
+    Args:
+        N/A
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    listener = LOG_STATE["listener"]
+    if listener is not None and LOG_STATE["pid"] == os.getpid():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        for handler in list(logging.getLogger(__name__).handlers):
+            logging.getLogger(__name__).removeHandler(handler)
+        LOG_STATE.update(pid=None, queue=None, listener=None, log_name=None)
+
+
 def init_inventory(
-    logger: Logger, source_dir: str = "", source_type: str = "json"
+    logger: Logger,
+    source_dir: str = "",
+    source_type: str = "json",
+    cache_dir: Optional[str] = None,
+    where: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Initialise the inventory data based on the source_type and from the source
@@ -217,6 +972,10 @@ def init_inventory(
         logger: The initialised Logger object.
         source_dir: The source directory to find the files in.
         source_type: The source file type to read the inventory data from.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
+        where: The SQL WHERE clause to filter the rows by, or None to read
+        all the rows. Only supported by the sqlite source type.
 
     Returns:
         df: The pandas dataframe object for further processing.
@@ -225,7 +984,7 @@ def init_inventory(
         ValueError: When a non-valid input is specified.
     """
     # Provide debugging output if needed.
-    logger.debug(f"Inventory source type is {source_type}")
+    logger.debug("Inventory source type is %s", source_type)
     # If/Else block to execute the applicable function, based on the
     # source file type
     if source_type == "json":
@@ -233,10 +992,23 @@ def init_inventory(
         df = init_inventory_json(source_dir)
     elif source_type == "xlsx":
         # Execute the xlsx specific init inventory
-        df = init_inventory_xlsx(source_dir)
+        df = init_inventory_xlsx(source_dir, cache_dir=cache_dir)
+    elif source_type == "workbook":
+        # Execute the workbook specific init, for the inventory sheet only
+        dfs = init_workbook(source_dir, sheet_names=["inventory"], cache_dir=cache_dir)
+        df = dfs["inventory"]
     elif source_type == "csv":
         # Execute the xlsx specific init inventory
         df = init_inventory_csv(source_dir)
+    elif source_type == "parquet":
+        # Execute the parquet specific init inventory
+        df = init_inventory_parquet(source_dir)
+    elif source_type == "feather":
+        # Execute the feather specific init inventory
+        df = init_inventory_feather(source_dir)
+    elif source_type == "sqlite":
+        # Execute the sqlite specific init inventory
+        df = init_inventory_sqlite(source_dir, where=where)
     else:
         # Output and raise ValueError error. NOTE: Due to using argparse options, we should
         # never hit this error but just in case we do.
@@ -248,7 +1020,10 @@ def init_inventory(
 
 
 def init_groups(
-    logger: Logger, source_dir: str = "", source_type: str = "json"
+    logger: Logger,
+    source_dir: str = "",
+    source_type: str = "json",
+    cache_dir: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Initialise the group data based on the source_type and from the source
@@ -258,6 +1033,8 @@ def init_groups(
         logger: The initialised logger object
         source_dir: The source directory to find the inventory files in.
         source_type: The source file type to read the group data from.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
 
     Returns:
         df: The pandas dataframe object for further processing.
@@ -266,7 +1043,7 @@ def init_groups(
         ValueError: When a non-valid input is specified.
     """
     # Provide debugging output if needed.
-    logger.debug(f"Inventory source type is {source_type}")
+    logger.debug("Inventory source type is %s", source_type)
     # If/Else block to execute the applicable function, based on the
     # source file type
     if source_type == "json":
@@ -274,10 +1051,23 @@ def init_groups(
         df = init_groups_json(source_dir)
     elif source_type == "xlsx":
         # Execute the xlsx specific init group
-        df = init_groups_xlsx(source_dir)
+        df = init_groups_xlsx(source_dir, cache_dir=cache_dir)
+    elif source_type == "workbook":
+        # Execute the workbook specific init, for the groups sheet only
+        dfs = init_workbook(source_dir, sheet_names=["groups"], cache_dir=cache_dir)
+        df = dfs["groups"]
     elif source_type == "csv":
         # Execute the csv specific init group
         df = init_groups_csv(source_dir)
+    elif source_type == "parquet":
+        # Execute the parquet specific init group
+        df = init_groups_parquet(source_dir)
+    elif source_type == "feather":
+        # Execute the feather specific init group
+        df = init_groups_feather(source_dir)
+    elif source_type == "sqlite":
+        # Execute the sqlite specific init group
+        df = init_groups_sqlite(source_dir)
     else:
         # Output and raise ValueError error. NOTE: Due to using argparse options, we should
         # never hit this error but just in case we do.
@@ -288,22 +1078,25 @@ def init_groups(
     return df
 
 
-def init_inventory_json(
-    source_dir: Optional[str] = "motherstarter/inputs",
-) -> Union[pd.DataFrame, Any]:
+def read_xlsx(
+    xlsx_file: str,
+    sheet_name: str,
+    cache_dir: Optional[str] = None,
+    schema: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
     """
-    Initialise a pandas dataframe by using pandas read_json
-    function by reading in the "inventory.json" file from the
-    applicable source directory
-
-    NOTE: Whilst this function exposes the ability to change the source_dir,
-    it's probably not something you want to be doing. Most people can just
-    place the files in template folder structure supplied in the 'motherstarter/inputs/'
-    directory. We would recommend just sticking with that, unless you want
-    to write your own custom workflow.
+    Initialise a pandas dataframe by using pandas read_excel function
+    by reading in the sheet of the xlsx file. Parsing xlsx files is slow,
+    so when a cache directory is supplied the parsed dataframe is cached
+    and loaded from the cache until the xlsx file changes.
 
     Args:
-        source_dir: The source directory to find the inventory files in.
+        xlsx_file: The xlsx file to read.
+        sheet_name: The name of the sheet to read.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
+        schema: The dictionary of column names to dtypes to apply, or None
+        to leave the dtypes as they were read.
 
     Returns:
         df: The pandas dataframe object for further processing.
@@ -311,22 +1104,335 @@ def init_inventory_json(
     Raises:
         N/A
     """
-    # Read in source file. NOTE: The source filename is hardcoded
-    df = pd.read_json(f"{source_dir}/inventory.json")
-    # Return dataframe
-    return df
+    # Read in the single sheet of the xlsx file
+    return read_xlsx_sheets(
+        xlsx_file, schemas={sheet_name: schema}, cache_dir=cache_dir
+    )[sheet_name]
 
 
-def init_inventory_xlsx(
-    source_dir: Optional[str] = "motherstarter/inputs",
-) -> Union[pd.DataFrame, Any]:
+def read_xlsx_sheets(
+    xlsx_file: str,
+    schemas: Dict[str, Optional[Dict[str, str]]],
+    cache_dir: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
     """
-    Initialise a pandas dataframe by using pandas read_excel
-    function by reading in the "inventory.xlsx" file from the
-    applicable source directory
+    Initialise a pandas dataframe for each of the sheets of the xlsx file,
+    by using pandas read_excel function. The workbook is only opened once,
+    in read-only mode, to read all the sheets which are not already cached.
+
+    Args:
+        xlsx_file: The xlsx file to read.
+        schemas: The dictionary of sheet names to read, to the dictionary of
+        column names to dtypes to apply to that sheet, or None to leave the
+        dtypes as they were read.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
+
+    Returns:
+        dfs: The dictionary of pandas dataframe objects, keyed by sheet name.
+
+    Raises:
+        N/A
+    """
+    import pandas as pd
+
+    # Retrieve the logger, for diagnostic information
+    logger = logging.getLogger(__name__)
+    dfs: Dict[str, pd.DataFrame] = {}
+    # Load the dataframes from the cache, when it is enabled and cached
+    source_cache = None
+    if cache_dir is not None:
+        from motherstarter.cache import SourceCache
+
+        source_cache = SourceCache(cache_dir=cache_dir)
+        for sheet_name, schema in schemas.items():
+            cached_df = source_cache.load(
+                xlsx_file, sheet_name=sheet_name, schema=schema
+            )
+            if cached_df is not None:
+                logger.debug("Source cache hit: %s (%s)", xlsx_file, sheet_name)
+                dfs[sheet_name] = cached_df
+            else:
+                logger.debug("Source cache miss: %s (%s)", xlsx_file, sheet_name)
+    # Return early when every sheet was cached, so the workbook isn't opened
+    sheet_names = [sheet_name for sheet_name in schemas if sheet_name not in dfs]
+    if not sheet_names:
+        return dfs
+    # Open the workbook once and read in the sheets which weren't cached.
+    # NOTE: The openpyxl engine opens the workbook in read-only mode
+    with pd.ExcelFile(xlsx_file, engine="openpyxl") as xlsx:
+        for sheet_name in sheet_names:
+            df = pd.read_excel(xlsx, sheet_name=sheet_name)
+            # Apply the schema before caching, so the cached dataframe has
+            # the dtypes
+            schema = schemas[sheet_name]
+            if schema is not None:
+                df = apply_schema(df, schema=schema)
+            # Save the dataframe to the cache, when it is enabled
+            if source_cache is not None:
+                source_cache.save(xlsx_file, df, sheet_name=sheet_name, schema=schema)
+            dfs[sheet_name] = df
+    return dfs
+
+
+def read_json(json_file: str) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe from a json file of records. When the
+    optional orjson dependency is installed, the raw bytes of the file are
+    parsed by orjson, which is far faster than pandas read_json on large
+    files. Otherwise, the file is read using pandas read_json.
+
+    Both parsers keep the values as they are written in the json file, so
+    numeric strings such as "0042" stay strings and dates are not inferred
+    from the column names, whichever parser is used.
+
+    Args:
+        json_file: The json file to read.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        ValueError: When the json file is not valid json.
+    """
+    import pandas as pd
+
+    def read_pandas() -> pd.DataFrame:
+        # Read the file without the dtype and date conversions, which the
+        # orjson parser doesn't apply
+        return pd.read_json(
+            json_file, dtype=False, convert_dates=False, precise_float=True
+        )
+
+    try:
+        import orjson
+    except ImportError:
+        # Fall back to pandas, when orjson is not installed
+        return read_pandas()
+    # Parse the raw bytes of the file
+    with open(json_file, "rb") as f:
+        records = orjson.loads(f.read())
+    # Fall back to pandas for any layout other than a list of records, so the
+    # other layouts supported by read_json are still supported
+    if not isinstance(records, list):
+        return read_pandas()
+    return pd.DataFrame(records)
+
+
+def import_pyarrow(file_format: str) -> Any:
+    """
+    Import and return the optional pyarrow dependency, which the parquet
+    and feather formats require.
+
+    Args:
+        file_format: The file format which requires pyarrow, used in the
+        error message.
+
+    Returns:
+        pa: The pyarrow module.
+
+    Raises:
+        ImportError: When pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError as e:
+        raise ImportError(
+            f"The {file_format} format requires pyarrow, which can be installed "
+            "with: pip install motherstarter[arrow]"
+        ) from e
+    return pa
+
+
+def read_arrow(
+    arrow_file: str, file_format: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe from a parquet or feather file, using
+    pyarrow. The file is memory-mapped rather than read into a buffer, and
+    only the columns which are requested are read from it. The string
+    columns are converted to Arrow-backed strings, so they aren't copied
+    into Python string objects.
+
+    NOTE: The parquet and feather formats require the optional pyarrow
+    dependency.
+
+    Args:
+        arrow_file: The parquet or feather file to read.
+        file_format: The file format, either "parquet" or "feather".
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        ImportError: When pyarrow is not installed.
+    """
+    import pandas as pd
+
+    pa = import_pyarrow(file_format)
+    # Read in the requested columns of the memory-mapped file
+    if file_format == "parquet":
+        import pyarrow.parquet as pq  # type: ignore
+
+        table = pq.read_table(arrow_file, columns=columns, memory_map=True)
+    else:
+        import pyarrow.feather as feather  # type: ignore
+
+        table = feather.read_table(arrow_file, columns=columns, memory_map=True)
+    # Convert the Arrow strings to Arrow-backed pandas strings
+    string_dtype = pd.StringDtype("pyarrow")
+    types = {pa.string(): string_dtype, pa.large_string(): string_dtype}
+    return table.to_pandas(types_mapper=types.get)
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Return the table or column name quoted as a SQL identifier, so that it
+    can be used in a query without being interpreted as SQL. The name is
+    wrapped in double quotes and each double quote inside of it is doubled,
+    which is how sqlite escapes them, so a name such as 'a"b' is quoted as
+    '"a""b"'.
+
+    Args:
+        name: The table or column name to quote.
+
+    Returns:
+        identifier: The quoted SQL identifier.
+
+    Raises:
+        ValueError: When the name contains a null character, which cannot
+        be quoted and would end the SQL statement.
+    """
+    if "\x00" in name:
+        raise ValueError(f"SQL identifier contains a null character: {name!r}")
+    return '"' + name.replace('"', '""') + '"'
+
+
+def read_sqlite(
+    sqlite_file: str,
+    table_name: str,
+    columns: Optional[List[str]] = None,
+    where: Optional[str] = None,
+    params: Sequence[Any] = (),
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe from a table of a sqlite database, by
+    using pandas read_sql_query. The database is opened read-only, and the
+    WHERE clause is run by sqlite, so only the matching rows are read and
+    an index of the filtered columns is used when there is one.
+
+    Args:
+        sqlite_file: The sqlite database file to read.
+        table_name: The name of the table to read.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+        where: The SQL WHERE clause to filter the rows by, such as
+        "operating_system = ?", or None to read all the rows. The clause is
+        run as it is, so it must be trusted input.
+        params: The parameters of the placeholders in the WHERE clause.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        FileNotFoundError: When the sqlite database file doesn't exist.
+        ValueError: When the table or a column name contains a null character.
+    """
+    from contextlib import closing
+    import pandas as pd
+    import sqlite3
+
+    # Ensure the file exists, as sqlite would otherwise create an empty database
+    if not os.path.isfile(sqlite_file):
+        raise FileNotFoundError(f"No such file: {sqlite_file}")
+    # Assign the query to a variable, selecting the requested columns. NOTE:
+    # The table and column names are quoted as identifiers, and the WHERE
+    # clause is trusted input from the user running motherstarter, like the
+    # source directory. It is run against the read-only database, as a single
+    # statement, and its values should be passed as parameters.
+    select = ", ".join(quote_identifier(c) for c in columns) if columns else "*"
+    query = f"SELECT {select} FROM {quote_identifier(table_name)}"  # nosec B608
+    if where:
+        query += f" WHERE {where}"  # nosec B608
+    # Open the database read-only, and read in the rows of the query
+    uri = f"{pl.Path(sqlite_file).resolve().as_uri()}?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        return pd.read_sql_query(query, conn, params=list(params))
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Take a pandas dataframe and return it with the dtypes of the schema
+    applied to the columns, to reduce the memory used by the dataframe and
+    speed up grouping and filtering it.
+
+    Args:
+        df: The pandas dataframe object.
+        schema: The dictionary of column names to dtypes. Columns which are
+        not in the dataframe are ignored.
+
+    Returns:
+        df: The pandas dataframe object, with the schema applied.
+
+    Raises:
+        N/A
+    """
+    import importlib.util
+
+    # Skip the Arrow-backed dtypes, when pyarrow is not installed
+    arrow = importlib.util.find_spec("pyarrow") is not None
+    dtypes = {
+        column: dtype
+        for column, dtype in schema.items()
+        if column in df.columns and (arrow or "pyarrow" not in dtype)
+    }
+    return df.astype(dtypes)
+
+
+def init_inventory_json(
+    source_dir: Optional[str] = "motherstarter/inputs",
+) -> Union[pd.DataFrame, Any]:
+    """
+    Initialise a pandas dataframe by using the read_json
+    function by reading in the "inventory.json" file from the
+    applicable source directory
+
+    NOTE: Whilst this function exposes the ability to change the source_dir,
+    it's probably not something you want to be doing. Most people can just
+    place the files in template folder structure supplied in the 'motherstarter/inputs/'
+    directory. We would recommend just sticking with that, unless you want
+    to write your own custom workflow.
+
+    Args:
+        source_dir: The source directory to find the inventory files in.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        N/A
+    """
+    # Read in source file. NOTE: The source filename is hardcoded
+    df = read_json(f"{source_dir}/inventory.json")
+    # Return dataframe, with the inventory schema applied
+    return apply_schema(df, schema=INVENTORY_SCHEMA)
+
+
+def init_inventory_xlsx(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    cache_dir: Optional[str] = None,
+) -> Union[pd.DataFrame, Any]:
+    """
+    Initialise a pandas dataframe by using pandas read_excel
+    function by reading in the "inventory.xlsx" file from the
+    applicable source directory
 
     Args:
         source_dir: The source directory to find the inventory files in.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
 
     Returns:
         df: The pandas dataframe object for further processing.
@@ -335,10 +1441,13 @@ def init_inventory_xlsx(
         N/A
     """
     # Read in source file. NOTE: The source filename and sheet name are hardcoded
-    df = pd.read_excel(  # type: ignore
-        f"{source_dir}/inventory.xlsx", sheet_name="inventory", engine="openpyxl"
+    df = read_xlsx(
+        f"{source_dir}/inventory.xlsx",
+        sheet_name="inventory",
+        cache_dir=cache_dir,
+        schema=INVENTORY_SCHEMA,
     )
-    # Return dataframe
+    # Return dataframe. NOTE: The inventory schema is applied when it is read
     return df
 
 
@@ -360,17 +1469,229 @@ def init_inventory_csv(
     Raises:
         N/A
     """
+    import pandas as pd
+
     # Read in source file. NOTE: The source filename is hardcoded
     df = pd.read_csv(f"{source_dir}/inventory.csv")
-    # Return dataframe
-    return df
+    # Return dataframe, with the inventory schema applied
+    return apply_schema(df, schema=INVENTORY_SCHEMA)
+
+
+def init_inventory_parquet(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe by using pyarrow by reading in
+    the "inventory.parquet" file from the applicable source directory
+
+    Args:
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        N/A
+    """
+    # Read in source file. NOTE: The source filename is hardcoded
+    df = read_arrow(f"{source_dir}/inventory.parquet", "parquet", columns=columns)
+    # Return dataframe, with the inventory schema applied
+    return apply_schema(df, schema=INVENTORY_SCHEMA)
+
+
+def init_inventory_feather(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe by using pyarrow by reading in
+    the "inventory.feather" file from the applicable source directory
+
+    Args:
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        N/A
+    """
+    # Read in source file. NOTE: The source filename is hardcoded
+    df = read_arrow(f"{source_dir}/inventory.feather", "feather", columns=columns)
+    # Return dataframe, with the inventory schema applied
+    return apply_schema(df, schema=INVENTORY_SCHEMA)
+
+
+def init_inventory_sqlite(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+    where: Optional[str] = None,
+    params: Sequence[Any] = (),
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe by using pandas read_sql_query
+    by reading in the "inventory" table of the "inventory.sqlite"
+    file from the applicable source directory
+
+    Args:
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+        where: The SQL WHERE clause to filter the rows by, or None to read
+        all the rows.
+        params: The parameters of the placeholders in the WHERE clause.
+
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        N/A
+    """
+    # Read in source file. NOTE: The source filename and table name are hardcoded
+    df = read_sqlite(
+        f"{source_dir}/inventory.sqlite",
+        table_name="inventory",
+        columns=columns,
+        where=where,
+        params=params,
+    )
+    # Return dataframe, with the inventory schema applied
+    return apply_schema(df, schema=INVENTORY_SCHEMA)
+
+
+class ChunkedFrame:
+    """
+    A read-only view of a csv file, which reads the file in chunks of a fixed
+    number of rows each time it is iterated. This allows very large inventories
+    to be processed, without the entire inventory being held in memory.
+
+    The parts of the pandas dataframe API which are used by the template and
+    csv writers are implemented, so it can be passed to them in place of a
+    pandas dataframe.
+
+    Args:
+        csv_file: The csv file to read.
+        chunk_size: The number of rows to read in each chunk.
+
+    Attributes:
+        csv_file: The csv file to read.
+        chunk_size: The number of rows to read in each chunk.
+    """
+
+    def __init__(self, csv_file: str, chunk_size: int) -> None:
+        self.csv_file = csv_file
+        self.chunk_size = chunk_size
+
+    @property
+    def columns(self) -> pd.Index:
+        """
+        Return the column labels of the csv file, by reading the header only.
+        """
+        import pandas as pd
+
+        return pd.read_csv(self.csv_file, nrows=0).columns
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        import pandas as pd
+
+        # Read in source file, one chunk at a time
+        with pd.read_csv(self.csv_file, chunksize=self.chunk_size) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def to_dict(self, orient: str = "records") -> Iterator[Dict[str, Any]]:
+        """
+        Return an iterator of the records in the csv file, which only holds
+        one chunk of records in memory at a time.
+        """
+        for chunk in self:
+            yield from chunk.to_dict(orient=orient)
+
+    def records(self) -> "ChunkedRecords":
+        """
+        Return a re-iterable view of the records in the csv file, which only
+        holds one chunk of records in memory at a time.
+        """
+        return ChunkedRecords(self)
+
+    def to_csv(self, csv_file: Union[str, TextIO], index: bool = False) -> None:
+        """
+        Save the csv file to another csv file, or a text file object, one
+        chunk at a time.
+        """
+        import pandas as pd
+
+        # Write the header with the first chunk, and append the rest
+        written = False
+        for chunk in self:
+            chunk.to_csv(
+                csv_file, index=index, mode="a" if written else "w", header=not written
+            )
+            written = True
+        # Write the header only, when there are no rows
+        if not written:
+            pd.read_csv(self.csv_file, nrows=0).to_csv(csv_file, index=index)
+
+    def group_by(self, column: str, spool_dir: str) -> Dict[Any, "ChunkedFrame"]:
+        """
+        Group the rows by the value of the column in a single pass over the
+        csv file. Each group is spooled to its own csv file in the spool
+        directory, so the groups are never held in memory either. The rows
+        with a missing value are grouped under None.
+        """
+        import pandas as pd
+
+        spool_files: Dict[Any, str] = {}
+        for chunk in self:
+            for value, group in chunk.groupby(column, sort=False, dropna=False):
+                # Group every missing value under the same key, as NaN keys
+                # from different chunks aren't equal
+                value = None if pd.isna(value) else value
+                # Write the header when the spool file is created
+                header = value not in spool_files
+                if header:
+                    spool_files[value] = os.path.join(
+                        spool_dir, f"{len(spool_files)}.csv"
+                    )
+                group.to_csv(spool_files[value], index=False, mode="a", header=header)
+        return {
+            value: ChunkedFrame(csv_file=spool_file, chunk_size=self.chunk_size)
+            for value, spool_file in spool_files.items()
+        }
+
+
+def init_inventory_csv_chunks(
+    source_dir: Optional[str] = "motherstarter/inputs", chunk_size: int = 10000
+) -> ChunkedFrame:
+    """
+    Initialise a chunked view of the "inventory.csv" file from the
+    applicable source directory, which is read in chunks of rows when
+    the outputs are written.
+
+    Args:
+        source_dir: The source directory to find the inventory files in.
+        chunk_size: The number of rows to read in each chunk.
+
+    Returns:
+        chunked_df: The chunked view of the inventory file.
+
+    Raises:
+        N/A
+    """
+    # NOTE: The source filename is hardcoded
+    return ChunkedFrame(csv_file=f"{source_dir}/inventory.csv", chunk_size=chunk_size)
 
 
 def init_groups_json(
     source_dir: Optional[str] = "motherstarter/inputs",
 ) -> Union[pd.DataFrame, Any]:
     """
-    Initialise a pandas dataframe by using pandas read_json
+    Initialise a pandas dataframe by using the read_json
     function by reading in the "groups.json" file from the
     applicable source directory
 
@@ -384,13 +1705,14 @@ def init_groups_json(
         N/A
     """
     # Read in source file. NOTE: The source filename is hardcoded
-    df = pd.read_json(f"{source_dir}/groups.json")
-    # Return dataframe
-    return df
+    df = read_json(f"{source_dir}/groups.json")
+    # Return dataframe, with the groups schema applied
+    return apply_schema(df, schema=GROUPS_SCHEMA)
 
 
 def init_groups_xlsx(
     source_dir: Optional[str] = "motherstarter/inputs",
+    cache_dir: Optional[str] = None,
 ) -> Union[pd.DataFrame, Any]:
     """
     Initialise a pandas dataframe by using pandas read_excel
@@ -399,6 +1721,8 @@ def init_groups_xlsx(
 
     Args:
         source_dir: The source directory to find the inventory files in.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
 
     Returns:
         df: The pandas dataframe object for further processing.
@@ -407,10 +1731,13 @@ def init_groups_xlsx(
         N/A
     """
     # Read in source file. NOTE: The source filename and sheet name are hardcoded
-    df = pd.read_excel(  # type: ignore
-        f"{source_dir}/groups.xlsx", sheet_name="groups", engine="openpyxl"
+    df = read_xlsx(
+        f"{source_dir}/groups.xlsx",
+        sheet_name="groups",
+        cache_dir=cache_dir,
+        schema=GROUPS_SCHEMA,
     )
-    # Return dataframe
+    # Return dataframe. NOTE: The groups schema is applied when it is read
     return df
 
 
@@ -429,114 +1756,869 @@ def init_groups_csv(source_dir: Optional[str] = "motherstarter/inputs") -> pd.Da
     Raises:
         N/A
     """
+    import pandas as pd
+
     # Read in source file. NOTE: The source filename is hardcoded
     df = pd.read_csv(f"{source_dir}/groups.csv")
-    return df
+    # Return dataframe, with the groups schema applied
+    return apply_schema(df, schema=GROUPS_SCHEMA)
 
 
-def dataframe_to_dict(df: pd.DataFrame) -> List[Dict[str, Any]]:
+def init_groups_parquet(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """
-    Helper function to return a Pandas dataframe into
-    a dictionary so that it can be used for further
-    processing throughout the application
+    Initialise a pandas dataframe by using pyarrow by reading in
+    the "groups.parquet" file from the applicable source directory
 
     Args:
-        df: The pandas dataframe object.
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
 
     Returns:
-        df: A list of dictionaries of the dataframe object.
+        df: The pandas dataframe object for further processing.
 
     Raises:
         N/A
     """
-    return df.to_dict(orient="records")
+    # Read in source file. NOTE: The source filename is hardcoded
+    df = read_arrow(f"{source_dir}/groups.parquet", "parquet", columns=columns)
+    # Return dataframe, with the groups schema applied
+    return apply_schema(df, schema=GROUPS_SCHEMA)
 
 
-def prep_templates(
-    tmpl_dir: Any = "motherstarter/templates/outputs/core",
-) -> Environment:
+def init_groups_feather(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """
-    Take the template directory and load a Jinja2 environment
-    with those templates and other settings enabled
+    Initialise a pandas dataframe by using pyarrow by reading in
+    the "groups.feather" file from the applicable source directory
 
-    For example:
-     .
-     |
-     └── templates
-            └── core
-                └── outputs <---- Set tmpl_dir to here
-                    ├── pyats
-                    │     └── testbed.j2
-                    └── nornir
-                        ├── hosts.j2
-                        └── groups.j2
+    Args:
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
 
-    NOTE: Whilst this function exposes the ability to change the tmpl_dir,
-    it's probably not something you want to be doing. Most people can just
-    place the files in template folder structure supplied in the
-    'motherstarter/templates/outputs/core' directory. We would recommend just sticking with
-    that, unless you want to write your own custom workflow.
+    Returns:
+        df: The pandas dataframe object for further processing.
+
+    Raises:
+        N/A
+    """
+    # Read in source file. NOTE: The source filename is hardcoded
+    df = read_arrow(f"{source_dir}/groups.feather", "feather", columns=columns)
+    # Return dataframe, with the groups schema applied
+    return apply_schema(df, schema=GROUPS_SCHEMA)
+
+
+def init_groups_sqlite(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    columns: Optional[List[str]] = None,
+    where: Optional[str] = None,
+    params: Sequence[Any] = (),
+) -> pd.DataFrame:
+    """
+    Initialise a pandas dataframe by using pandas read_sql_query
+    by reading in the "groups" table of the "groups.sqlite"
+    file from the applicable source directory
 
     Args:
-        tmpl_dir: The template directory one-level above where the Jinja2
-    templates are stored.
+        source_dir: The source directory to find the inventory files in.
+        columns: The names of the columns to read, or None to read all of
+        the columns.
+        where: The SQL WHERE clause to filter the rows by, or None to read
+        all the rows.
+        params: The parameters of the placeholders in the WHERE clause.
 
     Returns:
-        env: The loaded jinja2 environment.
+        df: The pandas dataframe object for further processing.
 
     Raises:
         N/A
     """
-    # Load template directory where Jinja2 templates are located
-    templates = FileSystemLoader(tmpl_dir)
-    # Load environment and setting autoescape to True
-    # to prevent XSS attacks
-    env = Environment(
-        loader=templates, autoescape=True, trim_blocks=True, lstrip_blocks=True
+    # Read in source file. NOTE: The source filename and table name are hardcoded
+    df = read_sqlite(
+        f"{source_dir}/groups.sqlite",
+        table_name="groups",
+        columns=columns,
+        where=where,
+        params=params,
     )
-    return env
+    # Return dataframe, with the groups schema applied
+    return apply_schema(df, schema=GROUPS_SCHEMA)
 
 
-def to_nr_hosts(
-    logger: Logger, env: Environment, df: pd.DataFrame, output_dir: str = ""
-) -> TextIO:
+def init_workbook(
+    source_dir: Optional[str] = "motherstarter/inputs",
+    sheet_names: Optional[List[str]] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
     """
-    Take the pandas dataframe, convert it to a dictionary
-    and render that dictionary through a Jinja2 template to
-    create an nornir hosts inventory file.
+    Initialise a pandas dataframe for each of the "inventory" and
+    "groups" sheets of the "workbook.xlsx" file from the applicable
+    source directory. Both sheets are read with a single workbook parse,
+    rather than parsing a separate xlsx file for each of them.
 
     Args:
-        logger: The initialised Logger object.
-        env: The loaded Jinja2 environment, used to retrieve
-        templates from.
-        df: The pandas dataframe object, initialised from the
-        inventory data source
-        output_dir: The output directory.
+        source_dir: The source directory to find the workbook file in.
+        sheet_names: The names of the sheets to read, or None to read both
+        the "inventory" and "groups" sheets.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
 
     Returns:
-        nr_h_file : The nornir hosts file object.
+        dfs: The dictionary of pandas dataframe objects, keyed by sheet name.
+
+    Raises:
+        N/A
+    """
+    # Assign the schema of each of the sheets to a dictionary
+    schemas = {"inventory": INVENTORY_SCHEMA, "groups": GROUPS_SCHEMA}
+    if sheet_names is None:
+        sheet_names = list(schemas)
+    # Read in source file. NOTE: The source filename and sheet names are hardcoded
+    return read_xlsx_sheets(
+        f"{source_dir}/workbook.xlsx",
+        schemas={sheet_name: schemas[sheet_name] for sheet_name in sheet_names},
+        cache_dir=cache_dir,
+    )
+
+
+def dataframe_to_dict(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Helper function to return a Pandas dataframe into
+    a dictionary so that it can be used for further
+    processing throughout the application
+
+    Args:
+        df: The pandas dataframe object.
+
+    Returns:
+        df: A list of dictionaries of the dataframe object.
+
+    Raises:
+        N/A
+    """
+    return df.to_dict(orient="records")
+
+
+def column_to_list(series: pd.Series) -> List[Any]:
+    """
+    Helper function to return a column of a Pandas dataframe as a list,
+    with every missing value replaced with None. The missing values of
+    Arrow-backed strings (pd.NA), categories and numbers (NaN) are all
+    rendered the same way.
+
+    Args:
+        series: The pandas series object of the column.
+
+    Returns:
+        values: The list of column values.
+
+    Raises:
+        N/A
+    """
+    import pandas as pd
+
+    values: List[Any] = series.tolist()
+    if series.hasnans:
+        values = [None if pd.isna(v) else v for v in values]
+    return values
+
+
+def group_indices(df: pd.DataFrame, column: str) -> Dict[Any, Any]:
+    """
+    Helper function to return the positions of the rows of a Pandas
+    dataframe, grouped by the value of the column in the order each value
+    is first seen. The rows with a missing value are grouped under None,
+    as the groupby indices of a category column drop them.
+
+    Args:
+        df: The pandas dataframe object.
+        column: The name of the column to group the rows by.
+
+    Returns:
+        indices: The dictionary of row position arrays, keyed by value.
+
+    Raises:
+        N/A
+    """
+    import numpy as np
+
+    series = df[column]
+    indices: Dict[Any, Any] = dict(
+        series.groupby(series, sort=False, observed=True).indices
+    )
+    if series.hasnans:
+        indices[None] = np.flatnonzero(series.isna().to_numpy())
+    return indices
+
+
+class Record(Mapping):  # type: ignore
+    """
+    A read-only record of a single row of a dataframe, which supports both
+    attribute access (record.name) and key access (record["name"]) so it
+    can be used in templates in place of a dictionary.
+
+    Only the row values are stored on each record. The mapping of column
+    names to value positions is shared by every record of a dataframe, on
+    the record class created for it by RecordView.
+
+    Args:
+        values: The tuple of row values, in column order.
+    """
+
+    __slots__ = ("_values",)
+    _fields: Dict[str, int] = {}
+
+    def __init__(self, values: Tuple[Any, ...]) -> None:
+        self._values = values
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[self._fields[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._fields[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f"Record({dict(self)!r})"
+
+
+class RecordView:
+    """
+    A re-iterable view of the rows of a pandas dataframe as records, which
+    is built once and shared by every template writer.
+
+    The columns are stored as lists and each record is only created while
+    it is being iterated over, so the view uses far less memory than a
+    list of dictionaries with the column names repeated in every row.
+
+    Args:
+        df: The pandas dataframe object.
+        positions: The row positions included in the view, or None to
+        include every row.
+
+    Attributes:
+        df: The pandas dataframe object.
+        record_class: The Record class for the dataframe columns.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        positions: Optional[Sequence[int]] = None,
+        _columns: Optional[List[List[Any]]] = None,
+    ) -> None:
+        self.df = df
+        self.positions = positions
+        # Create a record class with the shared column name mapping
+        fields = {str(column): i for i, column in enumerate(df.columns)}
+        self.record_class = type(
+            "Record", (Record,), {"__slots__": (), "_fields": fields}
+        )
+        # Convert each column to a list once, unless the columns are shared.
+        # NOTE: The missing values are replaced with None
+        if _columns is None:
+            _columns = [column_to_list(df[column]) for column in df.columns]
+        self._columns = _columns
+
+    def __iter__(self) -> Iterator[Record]:
+        if self.positions is None:
+            return map(self.record_class, zip(*self._columns))
+        return (
+            self.record_class(tuple(column[i] for column in self._columns))
+            for i in self.positions
+        )
+
+    def __len__(self) -> int:
+        if self.positions is None:
+            return len(self.df)
+        return len(self.positions)
+
+    def group_by(self, column: str) -> Dict[Any, "RecordView"]:
+        """
+        Group the records by the value of the column, using a single
+        pandas groupby. Each group is a view of the same column lists. The
+        records with a missing value are grouped under None.
+        """
+        return {
+            value: RecordView(self.df, positions=idx, _columns=self._columns)
+            for value, idx in group_indices(self.df, column).items()
+        }
+
+
+class ChunkedRecords:
+    """
+    A re-iterable view of the records of a chunked csv file. The csv file
+    is read again, one chunk at a time, each time the view is iterated, so
+    templates which loop over the inventory more than once see every row.
+
+    Args:
+        frame: The chunked csv file.
+
+    Attributes:
+        frame: The chunked csv file.
+    """
+
+    def __init__(self, frame: ChunkedFrame) -> None:
+        self.frame = frame
+
+    def __iter__(self) -> Iterator[Record]:
+        for chunk in self.frame:
+            yield from RecordView(chunk)
+
+
+def dataframe_to_records(df: Union[pd.DataFrame, Any]) -> Iterable[Record]:
+    """
+    Helper function to return a Pandas dataframe as an iterable
+    of records, so that it can be rendered through the templates
+    without converting every row to a dictionary.
+
+    Args:
+        df: The pandas dataframe object, chunked csv file or existing
+        record view.
+
+    Returns:
+        records: The iterable of records.
+
+    Raises:
+        N/A
+    """
+    # Return existing record views, so they are only built once
+    if isinstance(df, RecordView):
+        return df
+    # Return the records of each chunk, when reading the file in chunks
+    if isinstance(df, ChunkedFrame):
+        return df.records()
+    return RecordView(df)
+
+
+def count_rows(df: Union[pd.DataFrame, Any]) -> Optional[int]:
+    """
+    Take a pandas dataframe, record view or chunked csv file and return
+    the number of rows in it, for the metrics.
+
+    Args:
+        df: The pandas dataframe object, record view or chunked csv file.
+
+    Returns:
+        rows: The number of rows, or None when it is read in chunks and the
+        number of rows is unknown.
+
+    Raises:
+        N/A
+    """
+    if isinstance(df, ChunkedFrame):
+        return None
+    return len(df)
+
+
+def prep_templates(
+    tmpl_dir: Any = "motherstarter/templates/outputs/core",
+    cache_dir: Optional[str] = None,
+) -> Environment:
+    """
+    Take the template directory and load a Jinja2 environment
+    with those templates and other settings enabled
+
+    For example:
+     .
+     |
+     └── templates
+            └── core
+                └── outputs <---- Set tmpl_dir to here
+                    ├── pyats
+                    │     └── testbed.j2
+                    └── nornir
+                        ├── hosts.j2
+                        └── groups.j2
+
+    NOTE: Whilst this function exposes the ability to change the tmpl_dir,
+    it's probably not something you want to be doing. Most people can just
+    place the files in template folder structure supplied in the
+    'motherstarter/templates/outputs/core' directory. We would recommend just sticking with
+    that, unless you want to write your own custom workflow.
+
+    Args:
+        tmpl_dir: The template directory one-level above where the Jinja2
+    templates are stored.
+        cache_dir: The cache directory to store the compiled templates in, so
+    they are only compiled when they change. Set to None to disable the cache.
+
+    Returns:
+        env: The loaded jinja2 environment.
+
+    Raises:
+        N/A
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    # Load template directory where Jinja2 templates are located
+    templates = FileSystemLoader(tmpl_dir)
+    # Load the bytecode cache, when a cache directory is supplied
+    bcc = None
+    if cache_dir is not None:
+        from motherstarter.cache import TemplateBytecodeCache, get_cache_dir
+
+        bcc = TemplateBytecodeCache(directory=get_cache_dir(cache_dir, "templates"))
+    # Load environment and setting autoescape to True
+    # to prevent XSS attacks
+    env = Environment(
+        loader=templates,
+        autoescape=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bcc,
+    )
+    return env
+
+
+def log_template_cache(logger: Logger, env: Environment) -> None:
+    """
+    Log the hit and miss counters of the template bytecode cache, when
+    the Jinja2 environment has one and it has been used.
+
+    Args:
+        logger: The initialised Logger object.
+        env: The loaded Jinja2 environment.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    from motherstarter.cache import TemplateBytecodeCache
+
+    bcc = env.bytecode_cache
+    if isinstance(bcc, TemplateBytecodeCache) and bcc.hits + bcc.misses:
+        logger.debug(
+            "Template bytecode cache hits: %s, misses: %s", bcc.hits, bcc.misses
+        )
+
+
+def render_nr_hosts(f: TextIO, env: Environment, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe, convert it to records and render those
+    records through a Jinja2 template to a nornir hosts inventory, written
+    to the file object.
+
+    Args:
+        f: The text file object to write the rendered inventory to.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Convert pandas dataframe to records and assign to the
+    # 'inv' variable
+    inv = dataframe_to_records(df)
+    # Get template and assign to a variable
+    template = env.get_template("nornir/hosts.j2")
+    # Render the inventory dictionary through a template and stream the
+    # rendered chunks to the file, so the whole output is never held in memory
+    template.stream(inventory=inv).dump(f)  # type: ignore
+
+
+def render_nr_groups(f: TextIO, env: Environment, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe, convert it to records and render those
+    records through a Jinja2 template to a nornir groups inventory, written
+    to the file object.
+
+    Args:
+        f: The text file object to write the rendered inventory to.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
+        df: The pandas dataframe object, initialised from the
+        groups data source.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Convert pandas dataframe to records and assign to the
+    # 'grp' variable
+    grp = dataframe_to_records(df)
+    # Get template and assign to a variable
+    template = env.get_template("nornir/groups.j2")
+    # Render the groups dictionary through a template and stream the
+    # rendered chunks to the file, so the whole output is never held in memory
+    template.stream(groups=grp).dump(f)  # type: ignore
+
+
+def render_pyats(f: TextIO, env: Environment, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe, convert it to records and render those
+    records through a Jinja2 template to a pyATS testbed, written to the
+    file object.
+
+    Args:
+        f: The text file object to write the rendered testbed to.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Convert pandas dataframe to records and assign to the
+    # 'inv' variable
+    inv = dataframe_to_records(df)
+    # Get template and assign to a variable
+    template = env.get_template("pyats/testbed.j2")
+    # Render the inventory dictionary through a template and stream the
+    # rendered chunks to the file, so the whole output is never held in memory
+    template.stream(inventory=inv).dump(f)  # type: ignore
+
+
+def render_ansible(f: TextIO, env: Environment, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe, convert it to records and render those
+    records through a Jinja2 template to an Ansible inventory, written to
+    the file object.
+
+    The inventory is grouped by operating system in a single pass and
+    passed to the template as the 'os_groups' dictionary, alongside the
+    full 'inventory' list. Devices without an operating system are placed
+    in the 'ungrouped' group.
+
+    Args:
+        f: The text file object to write the rendered inventory to.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Convert pandas dataframe to records and assign to the
+    # 'inv' variable
+    inv = dataframe_to_records(df)
+    # Assign the grouped inventory records to the 'os_groups' variable,
+    # with the default operating systems first
+    os_groups: Dict[Any, Any] = {g: [] for g in ANSIBLE_OS_GROUPS}
+    # Create a spool directory, used when grouping a chunked inventory
+    with tempfile.TemporaryDirectory() as spool_dir:
+        if isinstance(df, ChunkedFrame):
+            # Group the chunks by operating system, spooling them to disk
+            for os_name, group in df.group_by("operating_system", spool_dir).items():
+                os_groups[os_name] = dataframe_to_records(group)
+        elif isinstance(inv, RecordView):
+            # Group the records by operating system
+            os_groups.update(inv.group_by("operating_system"))
+        # Place the devices without an operating system in the 'ungrouped'
+        # group, as in the Ansible JSON inventory
+        if None in os_groups:
+            os_groups["ungrouped"] = os_groups.pop(None)
+        # Get template and assign to a variable
+        template = env.get_template("ansible/hosts.j2")
+        # Render the inventory dictionary through a template and stream the
+        # rendered chunks to the file, so the whole output is never held in memory
+        stream = template.stream(inventory=inv, os_groups=os_groups)
+        stream.dump(f)  # type: ignore
+
+
+def render_csv(f: TextIO, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe and write it to the file object as CSV.
+
+    Args:
+        f: The text file object to write the CSV to.
+        df: The pandas dataframe object, or chunked csv file.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    df.to_csv(f, index=False)
+
+
+def render_json(f: TextIO, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe and write it to the file object as json.
+
+    Args:
+        f: The text file object to write the json to.
+        df: The pandas dataframe object.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    df.to_json(f, indent=4, orient="records")
+
+
+def write_sqlite(
+    sqlite_file: Union[str, BinaryIO],
+    df: pd.DataFrame,
+    table_name: str,
+    index_columns: Sequence[str] = SQLITE_INDEX_COLUMNS,
+) -> None:
+    """
+    Take the pandas dataframe and save it to a table of a new sqlite
+    database. The rows are inserted in bulk in a single transaction, and
+    then the index columns are indexed, which is faster than updating the
+    indexes as each row is inserted.
+
+    Args:
+        sqlite_file: The sqlite database file to write, or a binary file
+        object to write the sqlite database to.
+        df: The pandas dataframe object.
+        table_name: The name of the table to write.
+        index_columns: The names of the columns to index, when they are in
+        the dataframe.
+
+    Returns:
+        N/A
+
+    Raises:
+        ValueError: When the table or a column name contains a null character.
+    """
+    import pandas as pd
+    import shutil
+    import sqlite3
+
+    # sqlite can only write to a file, so write a file object's database to a
+    # temporary file and then copy it to the file object
+    if not isinstance(sqlite_file, str):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, f"{table_name}.sqlite")
+            write_sqlite(tmp_file, df, table_name, index_columns=index_columns)
+            with open(tmp_file, "rb") as f:
+                shutil.copyfileobj(f, sqlite_file)
+        return
+    # Assign the declared type of each column to a variable
+    column_types = []
+    types = pd.api.types
+    for column, dtype in df.dtypes.items():
+        if types.is_bool_dtype(dtype) or types.is_integer_dtype(dtype):
+            column_type = "INTEGER"
+        elif types.is_float_dtype(dtype):
+            column_type = "REAL"
+        else:
+            column_type = "TEXT"
+        column_types.append(f"{quote_identifier(str(column))} {column_type}")
+    # Assign the statements to variables. NOTE: Only the quoted table and
+    # column names are formatted into them, and the values are parameters
+    table = quote_identifier(table_name)
+    placeholders = ", ".join("?" for _ in df.columns)
+    create = f"CREATE TABLE {table} ({', '.join(column_types)})"
+    insert = f"INSERT INTO {table} VALUES ({placeholders})"  # nosec B608
+    # Convert each column to a list of Python objects, with None for the missing
+    # values, and zip the columns into rows as they are inserted
+    columns = [
+        df[column].astype(object).where(df[column].notna(), None).tolist()
+        for column in df.columns
+    ]
+    rows = zip(*columns)
+    # Write to a temporary file and then rename, so the database is never
+    # read while it is partially written
+    tmp_file = f"{sqlite_file}.tmp"
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+    conn = sqlite3.connect(tmp_file, isolation_level=None)
+    try:
+        # Disable the journal, as the temporary file is discarded on failure
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("BEGIN")
+        conn.execute(create)
+        conn.executemany(insert, rows)
+        for column in index_columns:
+            if column in df.columns:
+                index = quote_identifier(f"ix_{table_name}_{column}")
+                conn.execute(
+                    f"CREATE INDEX {index} ON {table} ({quote_identifier(column)})"
+                )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    os.replace(tmp_file, sqlite_file)
+
+
+def render_parquet(f: BinaryIO, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe and write it to the binary file object as
+    parquet.
+
+    Args:
+        f: The binary file object to write the parquet to.
+        df: The pandas dataframe object.
+
+    Returns:
+        N/A
+
+    Raises:
+        ImportError: When pyarrow is not installed.
+    """
+    import_pyarrow("parquet")
+    df.to_parquet(f, index=False)
+
+
+def render_feather(f: BinaryIO, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe and write it to the binary file object as
+    feather.
+
+    Args:
+        f: The binary file object to write the feather to.
+        df: The pandas dataframe object.
+
+    Returns:
+        N/A
+
+    Raises:
+        ImportError: When pyarrow is not installed.
+    """
+    import_pyarrow("feather")
+    # Reset the index, as feather only supports the default index
+    df.reset_index(drop=True).to_feather(f)
+
+
+def ansible_inventory(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Take the pandas dataframe and return the Ansible dynamic inventory,
+    with the same groups, group vars and host vars as the ansible/hosts.j2
+    template.
+
+    The hosts are grouped by operating system with a single pandas groupby,
+    and the host vars of every host are returned in the '_meta' block, so
+    that Ansible doesn't look up the host vars of each host separately.
+    Hosts without an operating system are in the 'ungrouped' group, and
+    hosts without a management IP address have no 'ansible_host' var, so
+    Ansible connects to them by name.
+
+    Args:
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        inventory: The Ansible dynamic inventory dictionary.
+
+    Raises:
+        N/A
+    """
+    # Assign the host names to a variable, as an array so the names of each
+    # group can be selected in one step
+    names = df["name"].to_numpy()
+    # Assign the group positions, keyed by operating system
+    indices = group_indices(df, "operating_system")
+    # Create the "all" group and the groups of the default operating systems
+    # first, in the same order as the ansible/hosts.j2 template
+    inventory: Dict[str, Any] = {
+        "all": {"children": [], "vars": ANSIBLE_GROUP_VARS["all"]}
+    }
+    for os_name in ANSIBLE_OS_GROUPS:
+        inventory[os_name] = {"hosts": []}
+    for os_name, idx in indices.items():
+        os_name = "ungrouped" if os_name is None else str(os_name)
+        inventory.setdefault(os_name, {"hosts": []})
+        inventory[os_name]["hosts"].extend(names[idx].tolist())
+    # Add the group vars and list every group as a child of the "all" group
+    for os_name, group in inventory.items():
+        if os_name == "all":
+            continue
+        if os_name in ANSIBLE_GROUP_VARS:
+            group["vars"] = ANSIBLE_GROUP_VARS[os_name]
+        inventory["all"]["children"].append(os_name)
+    # Assign the host vars of every host, in one pass over the columns. The
+    # missing values are None, as NA isn't JSON serialisable
+    inventory["_meta"] = {
+        "hostvars": {
+            name: {} if mgmt_ip is None else {"ansible_host": mgmt_ip}
+            for name, mgmt_ip in zip(names.tolist(), column_to_list(df["mgmt_ip"]))
+        }
+    }
+    return inventory
+
+
+def render_ansible_json(f: TextIO, df: pd.DataFrame) -> None:
+    """
+    Take the pandas dataframe and write it to the file object as an
+    Ansible dynamic inventory, in json.
+
+    Args:
+        f: The text file object to write the json to.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    json.dump(ansible_inventory(df), f, indent=4)
+    f.write("\n")
+
+
+def to_nr_hosts(
+    logger: Logger, env: Environment, df: pd.DataFrame, output_dir: str = ""
+) -> TextIO:
+    """
+    Take the pandas dataframe, convert it to a dictionary
+    and render that dictionary through a Jinja2 template to
+    create an nornir hosts inventory file.
+
+    Args:
+        logger: The initialised Logger object.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        nr_h_file : The nornir hosts file object.
 
     Raises:
         N/A
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/nr/inventory"
+        output_dir = OUTPUT_DIRS["to_nr_hosts"]
     # # Temp hack TODO
     # output_dir = "motherstarter/outputs/nr/inventory"
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Convert pandas dataframe to a dictionary and assign to the
-    # 'inv' variable
-    inv = dataframe_to_dict(df)
-    # Get template and assign to a variable
-    template = env.get_template("nornir/hosts.j2")
-    # Render inventory dictionary through a template and assign and output
-    # to a variable
-    output = template.render(inventory=inv)
-    # Create file and write contents to file
-    with open(f"{output_dir}/hosts.yaml", "w+") as nr_h_file:
-        nr_h_file.write(output)
+    # Render the inventory to the file
+    with open(
+        f"{output_dir}/{OUTPUT_FILES['to_nr_hosts']}", "w+", buffering=WRITE_BUFFER_SIZE
+    ) as nr_h_file:
+        render_nr_hosts(nr_h_file, env=env, df=df)
     # Log diagnostic information
     logger.info(f"File output location: {nr_h_file.name}")
     return nr_h_file
@@ -566,20 +2648,16 @@ def to_nr_groups(
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/nr/inventory"
+        output_dir = OUTPUT_DIRS["to_nr_groups"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Convert pandas dataframe to a dictionary and assign to the
-    # 'grp' variable
-    grp = dataframe_to_dict(df)
-    # Get template and assign to a variable
-    template = env.get_template("nornir/groups.j2")
-    # Render groups dictionary through a template and assign and output
-    # to a variable
-    output = template.render(groups=grp)
-    # Create file and write contents to file
-    with open(f"{output_dir}/groups.yaml", "w+") as nr_g_file:
-        nr_g_file.write(output)
+    # Render the groups to the file
+    with open(
+        f"{output_dir}/{OUTPUT_FILES['to_nr_groups']}",
+        "w+",
+        buffering=WRITE_BUFFER_SIZE,
+    ) as nr_g_file:
+        render_nr_groups(nr_g_file, env=env, df=df)
     # Log diagnostic information
     logger.info(f"File output location: {nr_g_file.name}")
     return nr_g_file
@@ -598,39 +2676,433 @@ def to_pyats(
         env : The loaded Jinja2 environment, used to retrieve
         templates from.
         df: The pandas dataframe object, initialised from the
-        inventory data source.
+        inventory data source.
+        output_dir: The output directory.
+
+    Returns:
+        tb_file : The pyATS testbed file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_pyats"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Render the inventory to the file
+    with open(
+        f"{output_dir}/{OUTPUT_FILES['to_pyats']}", "w+", buffering=WRITE_BUFFER_SIZE
+    ) as tb_file:
+        render_pyats(tb_file, env=env, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {tb_file.name}")
+    return tb_file
+
+
+def to_csv_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a CSV file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        csv_file: The CSV file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_csv_inventory"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign CSV file name to a variable
+    csv_file = f"{output_dir}/{OUTPUT_FILES['to_csv_inventory']}"
+    # Output the dataframe to CSV, save in CSV file
+    with open(csv_file, "w", newline="") as f:
+        render_csv(f, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {csv_file}")
+    return csv_file
+
+
+def xlsx_header(ws: Any, columns: List[str]) -> List[Any]:
+    """
+    Take the worksheet and the column names and return the header row
+    cells, styled with a bold font, thin borders and centred text, as
+    pandas to_excel styles the header row.
+
+    Args:
+        ws: The write-only worksheet to write the header row to.
+        columns: The list of column names.
+
+    Returns:
+        cells: The list of styled header cells.
+
+    Raises:
+        N/A
+    """
+    from openpyxl.cell import WriteOnlyCell  # type: ignore
+    from openpyxl.styles import Alignment, Border, Font, Side  # type: ignore
+
+    side = Side(style="thin")
+    cells = []
+    for column in columns:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = Font(bold=True)
+        cell.border = Border(left=side, right=side, top=side, bottom=side)
+        cell.alignment = Alignment(horizontal="center", vertical="top")
+        cells.append(cell)
+    return cells
+
+
+def xlsx_rows(
+    ws: Any, chunk: pd.DataFrame, formats: Dict[int, str]
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Take a chunk of the pandas dataframe and return an iterator of its rows,
+    ready to be appended to a write-only worksheet. Missing values are
+    replaced with None, so they are written as empty cells, and the values
+    of the formatted columns are written as cells with the number format.
+
+    Args:
+        ws: A write-only worksheet of the workbook, which the formatted
+        cells are created for.
+        chunk: The pandas dataframe object, or a chunk of the csv file.
+        formats: The dictionary of column positions to number formats.
+
+    Returns:
+        rows: The iterator of row tuples.
+
+    Raises:
+        N/A
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    # Convert each column to a list once, replacing missing values
+    # with None so they are written as empty cells
+    values = [column_to_list(chunk[column]) for column in chunk.columns]
+    if not formats:
+        yield from zip(*values)
+        return
+    for row in zip(*values):
+        cells: List[Any] = list(row)
+        for i, number_format in formats.items():
+            cell = WriteOnlyCell(ws, value=cells[i])
+            cell.number_format = number_format
+            cells[i] = cell
+        yield tuple(cells)
+
+
+def write_xlsx(
+    xlsx_file: Union[str, BinaryIO],
+    df: pd.DataFrame,
+    sheet_name: str,
+    column_widths: Optional[Dict[str, float]] = None,
+    column_formats: Optional[Dict[str, str]] = None,
+    max_rows: int = XLSX_MAX_ROWS,
+) -> List[str]:
+    """
+    Take the pandas dataframe and save it to a xlsx file, using an openpyxl
+    write-only workbook. The rows are written to the worksheet as they are
+    appended, so memory use does not grow with the number of rows. When
+    there are more rows than fit in one worksheet, the rows are split across
+    multiple worksheets, each with the header row, which is styled as pandas
+    to_excel styles it.
+
+    Args:
+        xlsx_file: The xlsx file to write, or a binary file object to write
+        the xlsx file to.
+        df: The pandas dataframe object, or chunked csv file.
+        sheet_name: The name of the first worksheet. The names of the other
+        worksheets are suffixed with the worksheet number, e.g. "inventory_2".
+        column_widths: The dictionary of column names to column widths, or
+        None to use the default column widths.
+        column_formats: The dictionary of column names to number formats, such
+        as "0.00", or None to use the default number formats.
+        max_rows: The maximum number of rows in each worksheet, including the
+        header row.
+
+    Returns:
+        sheet_names: The list of worksheet names which were written.
+
+    Raises:
+        N/A
+    """
+    from openpyxl import Workbook  # type: ignore
+    from openpyxl.utils import get_column_letter  # type: ignore
+
+    # Read the entire dataframe at once, unless it is read in chunks
+    chunks = df if isinstance(df, ChunkedFrame) else [df]
+    columns = [str(column) for column in df.columns]
+    column_widths = column_widths or {}
+    column_formats = column_formats or {}
+    wb = Workbook(write_only=True)
+    sheet_names: List[str] = []
+
+    def create_sheet() -> Any:
+        # Create the next worksheet and write the header row to it.
+        # NOTE: Column widths must be set before any rows are appended
+        name = sheet_name if not sheet_names else f"{sheet_name}_{len(sheet_names) + 1}"
+        ws = wb.create_sheet(title=name)
+        sheet_names.append(name)
+        for i, column in enumerate(columns, start=1):
+            if column in column_widths:
+                ws.column_dimensions[get_column_letter(i)].width = column_widths[column]
+        ws.append(xlsx_header(ws, columns))
+        return ws
+
+    ws = create_sheet()
+    rows_left = max_rows - 1
+    # Assign the positions of the formatted columns to a dictionary
+    formats = {
+        i: column_formats[column]
+        for i, column in enumerate(columns)
+        if column in column_formats
+    }
+    for chunk in chunks:
+        for row in xlsx_rows(ws, chunk, formats):
+            # Split the rows across another worksheet, when this one is full
+            if rows_left == 0:
+                ws = create_sheet()
+                rows_left = max_rows - 1
+            ws.append(row)
+            rows_left -= 1
+    wb.save(xlsx_file)
+    return sheet_names
+
+
+def to_xlsx_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a xlsx file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+        output_dir: The output directory.
+
+    Returns:
+        xlsx_file: The xlsx file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_xlsx_inventory"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign xlsx file name to a variable
+    xlsx_file = f"{output_dir}/{OUTPUT_FILES['to_xlsx_inventory']}"
+    # Output the dataframe to Excel, save in xlsx file
+    sheet_names = write_xlsx(xlsx_file, df=df, sheet_name="inventory")
+    # Log diagnostic information
+    if len(sheet_names) > 1:
+        logger.debug("Output split across sheets: %s", ", ".join(sheet_names))
+    logger.info(f"File output location: {xlsx_file}")
+    return xlsx_file
+
+
+def to_json_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a json file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        json_file: The json file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_json_inventory"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign json file name to a variable
+    json_file = f"{output_dir}/{OUTPUT_FILES['to_json_inventory']}"
+    # Output the dataframe to json, save in json file
+    with open(json_file, "w") as f:
+        render_json(f, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {json_file}")
+    return json_file
+
+
+def to_csv_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a CSV file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        csv_file: The CSV file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_csv_groups"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign CSV file name to a variable
+    csv_file = f"{output_dir}/{OUTPUT_FILES['to_csv_groups']}"
+    # Output the dataframe to CSV, save in CSV file
+    with open(csv_file, "w", newline="") as f:
+        render_csv(f, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {csv_file}")
+    return csv_file
+
+
+def to_xlsx_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a xlsx file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+        output_dir: The output directory.
+
+    Returns:
+        xlsx_file: The xlsx file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_xlsx_groups"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign xlsx file name to a variable
+    xlsx_file = f"{output_dir}/{OUTPUT_FILES['to_xlsx_groups']}"
+    # Output the dataframe to Excel, save in xlsx file
+    sheet_names = write_xlsx(xlsx_file, df=df, sheet_name="groups")
+    # Log diagnostic information
+    if len(sheet_names) > 1:
+        logger.debug("Output split across sheets: %s", ", ".join(sheet_names))
+    logger.info(f"File output location: {xlsx_file}")
+    return xlsx_file
+
+
+def to_json_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a json file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        json_file: The json file object.
+
+    Raises:
+        N/A
+    """
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_json_groups"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign json file name to a variable
+    json_file = f"{output_dir}/{OUTPUT_FILES['to_json_groups']}"
+    # Output the dataframe to json, save in json file
+    with open(json_file, "w") as f:
+        render_json(f, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {json_file}")
+    return json_file
+
+
+def to_parquet_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a parquet file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        inventory data source
+        output_dir: The output directory.
+
+    Returns:
+        parquet_file: The parquet file object.
+
+    Raises:
+        ImportError: When pyarrow is not installed.
+    """
+    # Check that pyarrow is installed, before the file is created
+    import_pyarrow("parquet")
+    # Specify the output dir when it is not supplied
+    if not output_dir:
+        output_dir = OUTPUT_DIRS["to_parquet_inventory"]
+    # Create entry directory and/or check that it exists
+    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Assign parquet file name to a variable
+    parquet_file = f"{output_dir}/{OUTPUT_FILES['to_parquet_inventory']}"
+    # Output the dataframe to parquet, save in parquet file
+    with open(parquet_file, "wb") as f:
+        render_parquet(f, df=df)
+    # Log diagnostic information
+    logger.info(f"File output location: {parquet_file}")
+    return parquet_file
+
+
+def to_parquet_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+    """
+    Take the pandas dataframe and save it to a parquet file.
+
+    Args:
+        logger: The initialised Logger object.
+        df: The pandas dataframe object, initialised from the
+        groups data source
         output_dir: The output directory.
 
     Returns:
-        tb_file : The pyATS testbed file object.
+        parquet_file: The parquet file object.
 
     Raises:
-        N/A
+        ImportError: When pyarrow is not installed.
     """
+    # Check that pyarrow is installed, before the file is created
+    import_pyarrow("parquet")
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/pyats"
+        output_dir = OUTPUT_DIRS["to_parquet_groups"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Convert pandas dataframe to a dictionary and assign to the
-    # 'inv' variable
-    inv = dataframe_to_dict(df)
-    # Get template and assign to a variable
-    template = env.get_template("pyats/testbed.j2")
-    # Render inventory dictionary through a template and assign and output
-    # to a variable
-    output = template.render(inventory=inv)
-    # Create file and write contents to file
-    with open(f"{output_dir}/mother_starter_tb.yaml", "w+") as tb_file:
-        tb_file.write(output)
+    # Assign parquet file name to a variable
+    parquet_file = f"{output_dir}/{OUTPUT_FILES['to_parquet_groups']}"
+    # Output the dataframe to parquet, save in parquet file
+    with open(parquet_file, "wb") as f:
+        render_parquet(f, df=df)
     # Log diagnostic information
-    logger.info(f"File output location: {tb_file.name}")
-    return tb_file
+    logger.info(f"File output location: {parquet_file}")
+    return parquet_file
 
 
-def to_csv_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_feather_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
     """
-    Take the pandas dataframe and save it to a CSV file.
+    Take the pandas dataframe and save it to a feather file.
 
     Args:
         logger: The initialised Logger object.
@@ -639,58 +3111,65 @@ def to_csv_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") ->
         output_dir: The output directory.
 
     Returns:
-        csv_file: The CSV file object.
+        feather_file: The feather file object.
 
     Raises:
-        N/A
+        ImportError: When pyarrow is not installed.
     """
+    # Check that pyarrow is installed, before the file is created
+    import_pyarrow("feather")
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/csv"
+        output_dir = OUTPUT_DIRS["to_feather_inventory"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Assign CSV file name to a variable
-    csv_file = f"{output_dir}/inventory.csv"
-    # Output the dataframe to CSV, save in CSV file
-    df.to_csv(csv_file, index=False)
+    # Assign feather file name to a variable
+    feather_file = f"{output_dir}/{OUTPUT_FILES['to_feather_inventory']}"
+    # Output the dataframe to feather, save in feather file
+    with open(feather_file, "wb") as f:
+        render_feather(f, df=df)
     # Log diagnostic information
-    logger.info(f"File output location: {csv_file}")
-    return csv_file
+    logger.info(f"File output location: {feather_file}")
+    return feather_file
 
 
-def to_xlsx_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_feather_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
     """
-    Take the pandas dataframe and save it to a xlsx file.
+    Take the pandas dataframe and save it to a feather file.
 
     Args:
         logger: The initialised Logger object.
         df: The pandas dataframe object, initialised from the
-        inventory data source.
+        groups data source
         output_dir: The output directory.
 
     Returns:
-        xlsx_file: The xlsx file object.
+        feather_file: The feather file object.
 
     Raises:
-        N/A
+        ImportError: When pyarrow is not installed.
     """
+    # Check that pyarrow is installed, before the file is created
+    import_pyarrow("feather")
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/xlsx"
+        output_dir = OUTPUT_DIRS["to_feather_groups"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Assign xlsx file name to a variable
-    xlsx_file = f"{output_dir}/inventory.xlsx"
-    # Output the dataframe to Excel, save in xlsx file
-    df.to_excel(xlsx_file, index=False, sheet_name="inventory")  # type: ignore
+    # Assign feather file name to a variable
+    feather_file = f"{output_dir}/{OUTPUT_FILES['to_feather_groups']}"
+    # Output the dataframe to feather, save in feather file
+    with open(feather_file, "wb") as f:
+        render_feather(f, df=df)
     # Log diagnostic information
-    logger.info(f"File output location: {xlsx_file}")
-    return xlsx_file
+    logger.info(f"File output location: {feather_file}")
+    return feather_file
 
 
-def to_json_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_sqlite_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
     """
-    Take the pandas dataframe and save it to a json file.
+    Take the pandas dataframe and save it to the "inventory" table of a
+    sqlite database file.
 
     Args:
         logger: The initialised Logger object.
@@ -699,88 +3178,101 @@ def to_json_inventory(logger: Logger, df: pd.DataFrame, output_dir: str = "") ->
         output_dir: The output directory.
 
     Returns:
-        json_file: The json file object.
+        sqlite_file: The sqlite file object.
 
     Raises:
         N/A
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/json"
+        output_dir = OUTPUT_DIRS["to_sqlite_inventory"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Assign json file name to a variable
-    json_file = f"{output_dir}/inventory.json"
-    # Output the dataframe to json, save in json file
-    df.to_json(json_file, indent=4, orient="records")  # type: ignore
+    # Assign sqlite file name to a variable
+    sqlite_file = f"{output_dir}/{OUTPUT_FILES['to_sqlite_inventory']}"
+    # Output the dataframe to sqlite, save in sqlite file
+    write_sqlite(sqlite_file, df=df, table_name="inventory")
     # Log diagnostic information
-    logger.info(f"File output location: {json_file}")
-    return json_file
+    logger.info(f"File output location: {sqlite_file}")
+    return sqlite_file
 
 
-def to_csv_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_sqlite_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
     """
-    Take the pandas dataframe and save it to a CSV file.
+    Take the pandas dataframe and save it to the "groups" table of a
+    sqlite database file.
 
     Args:
         logger: The initialised Logger object.
         df: The pandas dataframe object, initialised from the
-        inventory data source
+        groups data source
         output_dir: The output directory.
 
     Returns:
-        csv_file: The CSV file object.
+        sqlite_file: The sqlite file object.
 
     Raises:
         N/A
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/csv"
+        output_dir = OUTPUT_DIRS["to_sqlite_groups"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Assign CSV file name to a variable
-    csv_file = f"{output_dir}/groups.csv"
-    # Output the dataframe to CSV, save in CSV file
-    df.to_csv(csv_file, index=False)
+    # Assign sqlite file name to a variable
+    sqlite_file = f"{output_dir}/{OUTPUT_FILES['to_sqlite_groups']}"
+    # Output the dataframe to sqlite, save in sqlite file
+    write_sqlite(sqlite_file, df=df, table_name="groups")
     # Log diagnostic information
-    logger.info(f"File output location: {csv_file}")
-    return csv_file
+    logger.info(f"File output location: {sqlite_file}")
+    return sqlite_file
 
 
-def to_xlsx_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_ansible(
+    logger: Logger, env: Environment, df: pd.DataFrame, output_dir: str = ""
+) -> TextIO:
     """
-    Take the pandas dataframe and save it to a xlsx file.
+    Take the pandas dataframe, convert it to a dictionary
+    and render that dictionary through a Jinja2 template to
+    create an Ansible inventory file.
+
+    The inventory is grouped by operating system in a single pass and
+    passed to the template as the 'os_groups' dictionary, alongside the
+    full 'inventory' list.
 
     Args:
         logger: The initialised Logger object.
+        env: The loaded Jinja2 environment, used to retrieve
+        templates from.
         df: The pandas dataframe object, initialised from the
-        inventory data source.
+        inventory data source
         output_dir: The output directory.
 
     Returns:
-        xlsx_file: The xlsx file object.
+        ans_h_file : The Ansible inventory file object.
 
     Raises:
         N/A
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/xlsx"
+        output_dir = OUTPUT_DIRS["to_ansible"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Assign xlsx file name to a variable
-    xlsx_file = f"{output_dir}/groups.xlsx"
-    # Output the dataframe to Excel, save in xlsx file
-    df.to_excel(xlsx_file, index=False, sheet_name="groups")  # type: ignore
+    # Render the inventory to the file
+    with open(
+        f"{output_dir}/{OUTPUT_FILES['to_ansible']}", "w+", buffering=WRITE_BUFFER_SIZE
+    ) as ans_h_file:
+        render_ansible(ans_h_file, env=env, df=df)
     # Log diagnostic information
-    logger.info(f"File output location: {xlsx_file}")
-    return xlsx_file
+    logger.info(f"File output location: {ans_h_file.name}")
+    return ans_h_file
 
 
-def to_json_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
+def to_ansible_json(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> str:
     """
-    Take the pandas dataframe and save it to a json file.
+    Take the pandas dataframe and save it to an Ansible dynamic inventory
+    json file.
 
     Args:
         logger: The initialised Logger object.
@@ -796,59 +3288,706 @@ def to_json_groups(logger: Logger, df: pd.DataFrame, output_dir: str = "") -> st
     """
     # Specify the output dir when it is not supplied
     if not output_dir:
-        output_dir = "motherstarter/outputs/json"
+        output_dir = OUTPUT_DIRS["to_ansible_json"]
     # Create entry directory and/or check that it exists
     pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
     # Assign json file name to a variable
-    json_file = f"{output_dir}/groups.json"
-    # Output the dataframe to json, save in json file
-    df.to_json(json_file, indent=4, orient="records")  # type: ignore
+    json_file = f"{output_dir}/{OUTPUT_FILES['to_ansible_json']}"
+    # Output the Ansible dynamic inventory, save in json file
+    with open(json_file, "w", buffering=WRITE_BUFFER_SIZE) as f:
+        render_ansible_json(f, df=df)
     # Log diagnostic information
     logger.info(f"File output location: {json_file}")
     return json_file
 
 
-def to_ansible(
-    logger: Logger, env: Environment, df: pd.DataFrame, output_dir: str = ""
-) -> TextIO:
+def get_writers(output_type: str) -> List[WriterSpec]:
     """
-    Take the pandas dataframe, convert it to a dictionary
-    and render that dictionary through a Jinja2 template to
-    create an Ansible inventory file.
+    Take the output type and return the writers which need to be executed
+    to produce it, in the order that they are executed serially.
+
+    Each writer is returned as a tuple of the writer function, the source
+    it is passed ("inventory" or "groups") and the name of the Jinja2
+    template it renders, or None when it doesn't render a template.
+
+    Args:
+        output_type: What file type(s) you would like to be outputted.
+
+    Returns:
+        writers: The list of writer tuples for the output type.
+
+    Raises:
+        N/A
+    """
+    # Assign the writers for each output type to a variable
+    nornir: List[WriterSpec] = [
+        (to_nr_hosts, "inventory", "nornir/hosts.j2"),
+        (to_nr_groups, "groups", "nornir/groups.j2"),
+    ]
+    pyats: List[WriterSpec] = [(to_pyats, "inventory", "pyats/testbed.j2")]
+    ansible: List[WriterSpec] = [(to_ansible, "inventory", "ansible/hosts.j2")]
+    ansible_json: List[WriterSpec] = [(to_ansible_json, "inventory", None)]
+    parquet: List[WriterSpec] = [
+        (to_parquet_inventory, "inventory", None),
+        (to_parquet_groups, "groups", None),
+    ]
+    feather: List[WriterSpec] = [
+        (to_feather_inventory, "inventory", None),
+        (to_feather_groups, "groups", None),
+    ]
+    csv: List[WriterSpec] = [
+        (to_csv_inventory, "inventory", None),
+        (to_csv_groups, "groups", None),
+    ]
+    xlsx: List[WriterSpec] = [
+        (to_xlsx_inventory, "inventory", None),
+        (to_xlsx_groups, "groups", None),
+    ]
+    json: List[WriterSpec] = [
+        (to_json_inventory, "inventory", None),
+        (to_json_groups, "groups", None),
+    ]
+    sqlite: List[WriterSpec] = [
+        (to_sqlite_inventory, "inventory", None),
+        (to_sqlite_groups, "groups", None),
+    ]
+    # Create a dictionary of output type to writer mappings. NOTE: The order of
+    # the "all" output type is preserved from previous releases. The
+    # ansible_json, parquet, feather and sqlite output types aren't part of
+    # it, so "all" keeps writing the same files.
+    writer_map: Dict[str, List[WriterSpec]] = {
+        "all": nornir + [csv[0], xlsx[0], csv[1], xlsx[1]] + pyats + ansible + json,
+        "nornir": nornir,
+        "csv": csv,
+        "xlsx": xlsx,
+        "pyats": pyats,
+        "ansible": ansible,
+        "ansible_json": ansible_json,
+        "json": json,
+        "parquet": parquet,
+        "feather": feather,
+        "sqlite": sqlite,
+    }
+    return writer_map.get(output_type, [])
+
+
+def get_source_files(source_dir: str, source_type: str, source: str) -> List[str]:
+    """
+    Take the source directory, source type and source name and return
+    the source files which are read to initialise that source.
+
+    Args:
+        source_dir: The source directory to find the files in.
+        source_type: The source file type.
+        source: The name of the source, either "inventory" or "groups".
+
+    Returns:
+        source_files: The list of source file paths.
+
+    Raises:
+        N/A
+    """
+    # NOTE: The source filenames are hardcoded, as per the init functions
+    if source_type == "workbook":
+        return [f"{source_dir}/workbook.xlsx"]
+    return [f"{source_dir}/{source}.{source_type}"]
+
+
+def get_writer_digest(
+    writer: WriterSpec,
+    output_type: str,
+    source_dir: str,
+    source_type: str,
+    template_dir: str,
+    shard_by: Optional[str] = None,
+    where: Optional[str] = None,
+) -> str:
+    """
+    Take a writer and return a digest of everything which its output
+    depends on. This is the motherstarter version, the output type, the
+    writer, the shard column, the WHERE clause and the content of the source
+    files and template it reads.
+
+    Args:
+        writer: The writer tuple, as returned by get_writers.
+        output_type: What file type(s) you would like to be outputted.
+        source_dir: The source directory to find the files in.
+        source_type: The source file type.
+        template_dir: The template directory to find the templates in.
+        shard_by: The inventory column the outputs are sharded by, or None
+        when they aren't sharded.
+        where: The SQL WHERE clause the inventory is filtered by, or None
+        when it isn't filtered.
+
+    Returns:
+        digest: The hex digest of the writer inputs.
+
+    Raises:
+        N/A
+    """
+    from motherstarter.cache import file_digest, text_digest
+
+    func, source, template = writer
+    # Assign the parts of the digest to a list, in a stable order
+    parts = [__version__, output_type, func.__name__, source_type]
+    parts += [file_digest(f) for f in get_source_files(source_dir, source_type, source)]
+    if template is not None:
+        parts.append(file_digest(os.path.join(template_dir, template)))
+    # Only add the shard column when sharding, so unsharded digests are unchanged
+    if shard_by is not None:
+        parts.append(f"shard_by={shard_by}")
+    # Only add the WHERE clause of a filtered inventory, for the same reason
+    if where is not None and source == "inventory":
+        parts.append(f"where={where}")
+    return text_digest("|".join(parts))
+
+
+def init_writer_process(log_level: str, log_name: str) -> None:
+    """
+    Initialise the logger inside a writer process, so that the writers
+    executed in that process can log their diagnostic information.
+
+    NOTE: When the process is forked, the queue handler is inherited from the
+    parent process, but its listener thread isn't, so a listener is started
+    for this process.
+
+    Args:
+        log_level: The severity logging level for all events
+        log_name: The name of the log file.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    init_logger(log_level=log_level, log_name=log_name)
+
+
+def execute_writer(
+    writer: Callable[..., Any],
+    df: pd.DataFrame,
+    template_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    output_dir: str = "",
+) -> Tuple[str, float]:
+    """
+    Execute a single writer inside a writer process. The Jinja2 environment
+    cannot be shared between processes, so it is prepared from the template
+    directory when the writer renders a template.
+
+    Args:
+        writer: The writer function to execute.
+        df: The pandas dataframe object passed to the writer.
+        template_dir: The template directory of the template files, or None
+        when the writer does not render a template.
+        cache_dir: The cache directory for the compiled templates.
+        output_dir: The output directory, or an empty string for the
+        default output directory of the writer.
+
+    Returns:
+        output: The output file location. NOTE: The file objects returned by
+        the template writers cannot be sent back to the parent process, so
+        only their name is returned.
+        seconds: The duration of the writer, in seconds.
+
+    Raises:
+        N/A
+    """
+    import time
+
+    # Retrieve the logger initialised for this process
+    logger = logging.getLogger(__name__)
+    # Only pass the output directory when it is supplied
+    kwargs = {"output_dir": output_dir} if output_dir else {}
+    start = time.perf_counter()
+    if template_dir is None:
+        result = writer(logger=logger, df=df, **kwargs)
+    else:
+        # Prepare the jinja2 template environment
+        env = prep_templates(tmpl_dir=template_dir, cache_dir=cache_dir)
+        result = writer(logger=logger, env=env, df=df, **kwargs)
+        log_template_cache(logger=logger, env=env)
+    # Write the queued records, as the process may exit without doing so
+    flush_logger()
+    return str(getattr(result, "name", result)), time.perf_counter() - start
+
+
+def shard_name(value: Any) -> str:
+    """
+    Take a value of the shard column and return the name of the shard,
+    which is safe to use as a directory name.
+
+    Args:
+        value: The value of the shard column.
+
+    Returns:
+        name: The shard name.
+
+    Raises:
+        N/A
+    """
+    import pandas as pd
+
+    # Name the shard of the missing values "none"
+    if pd.isna(value):
+        return "none"
+    # Replace any characters which are unsafe in a directory name
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", str(value))
+    return "_" if name in ["", ".", ".."] else name
+
+
+def shard_frame(df: pd.DataFrame, shard_by: str) -> Dict[str, pd.DataFrame]:
+    """
+    Take the pandas dataframe and split it into a dataframe per value of
+    the shard column, using a single pandas groupby.
+
+    Args:
+        df: The pandas dataframe object, initialised from the inventory
+        data source.
+        shard_by: The column to shard the dataframe by.
+
+    Returns:
+        shards: The dictionary of shard dataframes, keyed by shard name,
+        in the order of the shard values.
+
+    Raises:
+        ValueError: When the shard column doesn't exist in the dataframe.
+    """
+    import pandas as pd
+
+    if shard_by not in df.columns:
+        raise ValueError(f"Shard column not found in the inventory: {shard_by}")
+    shards: Dict[str, pd.DataFrame] = {}
+    for value, group in df.groupby(shard_by, sort=True, observed=True, dropna=False):
+        name = shard_name(value)
+        group = group.reset_index(drop=True)
+        # Combine the values which have the same shard name, such as "a/b"
+        # and "a_b", into one shard
+        if name in shards:
+            group = pd.concat([shards[name], group], ignore_index=True)
+        shards[name] = group
+    return shards
+
+
+def get_writer_tasks(
+    writers: List[WriterSpec], shards: List[str], output_dir: Optional[str] = None
+) -> List[WriterTask]:
+    """
+    Take the writers and return the writer tasks to execute, with the output
+    directory of each task, where an empty string is the default output
+    directory of the writer and isn't passed to it. When sharding, each
+    inventory writer has a task per shard, writing to a directory named after
+    the shard in the writer's output directory.
+
+    Args:
+        writers: The list of writer tuples, as returned by get_writers.
+        shards: The list of shard names, or an empty list when not sharding.
+        output_dir: The directory to write the outputs to, in a directory
+        per writer, or None for the default output directories.
+
+    Returns:
+        tasks: The list of writer task tuples.
+
+    Raises:
+        N/A
+    """
+    tasks: List[WriterTask] = []
+    for writer, source, template in writers:
+        name = writer.__name__
+        writer_dir = os.path.join(output_dir, name) if output_dir else ""
+        if not shards or source != "inventory":
+            tasks.append((name, writer, source, template, writer_dir))
+            continue
+        # Write each shard to a directory in the writer's output directory
+        shard_root = writer_dir or OUTPUT_DIRS.get(
+            name, f"motherstarter/outputs/{name}"
+        )
+        for shard in shards:
+            shard_dir = os.path.join(shard_root, shard)
+            tasks.append(
+                (f"{name}/{shard}", writer, f"{source}/{shard}", template, shard_dir)
+            )
+    return tasks
+
+
+def run_tasks_serial(
+    logger: Logger,
+    tasks: List[WriterTask],
+    dfs: Dict[str, pd.DataFrame],
+    env: Environment,
+    metrics: Metrics,
+) -> Tuple[Dict[str, str], Dict[str, BaseException]]:
+    """
+    Execute the writer tasks one after another, in this process. Each source
+    is only converted to records once and shared by the template writers.
+
+    NOTE: Chunked sources are read again by each writer instead.
 
     Args:
         logger: The initialised Logger object.
-        env: The loaded Jinja2 environment, used to retrieve
-        templates from.
-        df: The pandas dataframe object, initialised from the
-        inventory data source
-        output_dir: The output directory.
+        tasks: The list of writer task tuples, as returned by get_writer_tasks.
+        dfs: The dictionary of pandas dataframe objects, keyed by source name.
+        env: The loaded Jinja2 environment.
+        metrics: The metrics to record the duration, rows and bytes of each
+        writer in.
 
     Returns:
-        ans_h_file : The Ansible inventory file object.
+        outputs: The dictionary of output file locations, keyed by task name.
+        errors: The dictionary of writer errors, keyed by task name.
 
     Raises:
         N/A
     """
-    # Specify the output dir when it is not supplied
-    if not output_dir:
-        output_dir = "motherstarter/outputs/ansible/inventory"
-    # Create entry directory and/or check that it exists
-    pl.Path(output_dir).mkdir(parents=True, exist_ok=True)
-    # Convert pandas dataframe to a dictionary and assign to the
-    # 'inv' variable
-    inv = dataframe_to_dict(df)
-    # Get template and assign to a variable
-    template = env.get_template("ansible/hosts.j2")
-    # Render groups dictionary through a template and assign and output
-    # to a variable
-    output = template.render(inventory=inv)
-    # Create file and write contents to file
-    with open(f"{output_dir}/hosts", "w+") as ans_h_file:
-        ans_h_file.write(output)
-    # Log diagnostic information
-    logger.info(f"File output location: {ans_h_file.name}")
-    return ans_h_file
+    from motherstarter.metrics import file_size
+
+    outputs: Dict[str, str] = {}
+    errors: Dict[str, BaseException] = {}
+    records: Dict[str, RecordView] = {}
+    for name, writer, source, template, writer_dir in tasks:
+        try:
+            df = dfs[source]
+            kwargs: Dict[str, Any] = {"output_dir": writer_dir} if writer_dir else {}
+            if template is not None:
+                kwargs["env"] = env
+                if not isinstance(df, ChunkedFrame) and source not in records:
+                    with metrics.stage(f"records {source}", rows=count_rows(df)):
+                        records[source] = RecordView(df)
+                df = records.get(source, df)
+            # NOTE: The templates are streamed to the output file as they are
+            # rendered, so rendering and writing are measured together
+            with metrics.stage(f"write {name}", count_rows(df)) as stage:
+                result = writer(logger=logger, df=df, **kwargs)
+                outputs[name] = str(getattr(result, "name", result))
+                stage["bytes"] = file_size(outputs[name])
+        except Exception as err:
+            errors[name] = err
+    return outputs, errors
+
+
+def run_tasks_parallel(
+    logger: Logger,
+    tasks: List[WriterTask],
+    dfs: Dict[str, pd.DataFrame],
+    template_dir: str,
+    jobs: int,
+    cache_dir: Optional[str],
+    metrics: Metrics,
+) -> Tuple[Dict[str, str], Dict[str, BaseException]]:
+    """
+    Execute the writer tasks in parallel on a pool of processes, each of
+    which prepares its own Jinja2 environment and logger.
+
+    Args:
+        logger: The initialised Logger object.
+        tasks: The list of writer task tuples, as returned by get_writer_tasks.
+        dfs: The dictionary of pandas dataframe objects, keyed by source name.
+        template_dir: The template directory of the template files.
+        jobs: The number of parallel processes used to write the outputs.
+        cache_dir: The cache directory for the compiled templates.
+        metrics: The metrics to record the duration, rows and bytes of each
+        writer in.
+
+    Returns:
+        outputs: The dictionary of output file locations, keyed by task name.
+        errors: The dictionary of writer errors, keyed by task name.
+
+    Raises:
+        N/A
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    outputs: Dict[str, str] = {}
+    errors: Dict[str, BaseException] = {}
+    # Retrieve the logging setup, so it can be replicated in each process
+    log_level = logging.getLevelName(logger.getEffectiveLevel())
+    log_name = LOG_STATE["log_name"] or "ms.log"
+    workers = min(jobs, len(tasks))
+    logger.debug("Executing %s writers across %s processes", len(tasks), workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_writer_process,
+        initargs=(log_level, log_name),
+    ) as executor:
+        futures: List[Tuple[str, str, Future[Tuple[str, float]]]] = [
+            (
+                name,
+                source,
+                executor.submit(
+                    execute_writer,
+                    writer,
+                    dfs[source],
+                    None if template is None else template_dir,
+                    cache_dir,
+                    writer_dir,
+                ),
+            )
+            for name, writer, source, template, writer_dir in tasks
+        ]
+        # Wait for each writer in submission order and collect any errors
+        for name, source, future in futures:
+            try:
+                outputs[name], seconds = future.result()
+                metrics.add(
+                    f"write {name}",
+                    seconds=seconds,
+                    rows=count_rows(dfs[source]),
+                    output=outputs[name],
+                )
+            except Exception as err:
+                errors[name] = err
+    return outputs, errors
+
+
+def run_writers(
+    logger: Logger,
+    writers: List[WriterSpec],
+    dfs: Dict[str, pd.DataFrame],
+    env: Environment,
+    template_dir: str,
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    metrics: Optional[Metrics] = None,
+    output_dir: Optional[str] = None,
+    shard_by: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Execute the writers, either one after another or in parallel on a pool
+    of processes. The writers are independent of each other, so one failed
+    writer does not stop the remaining writers. All failures are collected
+    and reported together once every writer has finished.
+
+    When sharding, the inventory is split into a shard per value of the
+    shard column, and each inventory writer is executed once per shard,
+    writing to a directory named after the shard value. The shards are
+    executed in parallel on the same pool of processes as the writers.
+
+    Args:
+        logger: The initialised Logger object.
+        writers: The list of writer tuples, as returned by get_writers.
+        dfs: The dictionary of pandas dataframe objects, keyed by the
+        source name of the writer tuples.
+        env: The loaded Jinja2 environment, used when executing serially.
+        template_dir: The template directory of the template files, used
+        to prepare the Jinja2 environment in each writer process.
+        jobs: The number of parallel processes used to write the outputs.
+        cache_dir: The cache directory for the compiled templates.
+        metrics: The metrics to record the duration, rows and bytes of each
+        writer in, or None to not record them.
+        output_dir: The directory to write the outputs to, in a directory
+        per writer, or None for the default output directories.
+        shard_by: The inventory column to shard the inventory writers by, or
+        None to not shard them.
+
+    Returns:
+        outputs: The dictionary of output file locations, keyed by the
+        writer name, or by the writer name and shard name separated by a
+        "/" when sharding.
+
+    Raises:
+        ValueError: When the shard column doesn't exist in the inventory.
+        RuntimeError: When one or more of the writers failed.
+    """
+    from motherstarter.metrics import Metrics
+
+    # Record the metrics in a throwaway collection, when they aren't needed
+    metrics = metrics if metrics is not None else Metrics()
+    # Split the inventory into shards, with a single groupby, and add each
+    # shard to a copy of the dataframes dictionary, keyed by "inventory/<shard>"
+    shards: Dict[str, pd.DataFrame] = {}
+    if shard_by is not None and any(source == "inventory" for _, source, _ in writers):
+        with metrics.stage(f"shard inventory by {shard_by}"):
+            shards = shard_frame(dfs["inventory"], shard_by=shard_by)
+        logger.debug("Inventory split into %s shards by: %s", len(shards), shard_by)
+        dfs = {**dfs, **{f"inventory/{shard}": df for shard, df in shards.items()}}
+    # Assign the writer tasks, and execute them one after another, when
+    # parallelism is not useful, or in parallel
+    tasks = get_writer_tasks(
+        writers=writers, shards=list(shards), output_dir=output_dir
+    )
+    if jobs <= 1 or len(tasks) <= 1:
+        outputs, errors = run_tasks_serial(
+            logger=logger, tasks=tasks, dfs=dfs, env=env, metrics=metrics
+        )
+    else:
+        outputs, errors = run_tasks_parallel(
+            logger=logger,
+            tasks=tasks,
+            dfs=dfs,
+            template_dir=template_dir,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            metrics=metrics,
+        )
+    # Report all writer errors together, if there are any
+    if errors:
+        for name, error in errors.items():
+            logger.error(f"Writer {name} failed: {error!r}")
+        error_msg = f"{len(errors)} writer(s) failed: {', '.join(errors)}"
+        raise RuntimeError(error_msg)
+    return outputs
+
+
+def validate_options(
+    logger: Logger,
+    source_type: str,
+    output_type: str,
+    chunk_size: Optional[int] = None,
+    shard_by: Optional[str] = None,
+    where: Optional[str] = None,
+) -> None:
+    """
+    Ensure that the options of a run are supported together, before any of
+    the sources are read.
+
+    Args:
+        logger: The initialised Logger object.
+        source_type: The source file type to read the inventory
+        and group data in from.
+        output_type: What file type(s) you would like to be outputted.
+        chunk_size: The number of rows in each chunk, or None when the
+        inventory isn't read in chunks.
+        shard_by: The inventory column to shard the inventory outputs by, or
+        None when they aren't sharded.
+        where: The SQL WHERE clause to filter the sqlite inventory rows by, or
+        None to read all the rows.
+
+    Returns:
+        N/A
+
+    Raises:
+        ValueError: When chunking is not supported by the source or output type,
+        or is used with sharding, or a WHERE clause is used with a source type
+        other than sqlite.
+    """
+    # Ensure that the source and output types support chunking, when it is used
+    if chunk_size is not None:
+        if source_type != "csv" or output_type not in CHUNKED_OUTPUT_TYPES:
+            invalid_error = (
+                f"Chunk size is not supported with source type: {source_type} and "
+                f"output type: {output_type}. Use source type: csv and output type: "
+                f"{', '.join(CHUNKED_OUTPUT_TYPES)}"
+            )
+            logger.error(invalid_error)
+            raise ValueError(invalid_error)
+        logger.debug("Inventory chunk size is: %s", chunk_size)
+    # Ensure that chunking isn't used with sharding, which needs the entire
+    # inventory to split it
+    if shard_by is not None:
+        if chunk_size is not None:
+            invalid_error = "Chunk size is not supported when sharding the inventory"
+            logger.error(invalid_error)
+            raise ValueError(invalid_error)
+        logger.debug("Shard column is: %s", shard_by)
+    # Ensure that the WHERE clause is only used with the sqlite source type
+    if where is not None:
+        if source_type != "sqlite":
+            invalid_error = (
+                f"WHERE clause is not supported with source type: {source_type}. "
+                "Use source type: sqlite"
+            )
+            logger.error(invalid_error)
+            raise ValueError(invalid_error)
+        logger.debug("Inventory WHERE clause is: %s", where)
+
+
+def read_sources(
+    logger: Logger,
+    sources: Set[str],
+    source_dir: str,
+    source_type: str,
+    cache_dir: Optional[str],
+    chunk_size: Optional[int],
+    metrics: Metrics,
+    where: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Initialise the dataframes of the sources, based on the source_dir and
+    source_type. A workbook is read with a single parse for all of its
+    sheets, and a chunked inventory is read as each writer iterates it.
+
+    Args:
+        logger: The initialised Logger object.
+        sources: The names of the sources the writers need, "inventory"
+        and/or "groups".
+        source_dir: The source directory of the input files.
+        source_type: The source file type to read the sources from.
+        cache_dir: The cache directory for parsed source files, or None to
+        disable the cache.
+        chunk_size: Read the csv inventory in chunks of this many rows, or
+        None to read the entire inventory at once.
+        metrics: The metrics to record the duration and rows of each read in.
+        where: The SQL WHERE clause to filter the sqlite inventory rows by, or
+        None to read all the rows.
+
+    Returns:
+        dfs: The dictionary of pandas dataframe objects, keyed by source name.
+
+    Raises:
+        N/A
+    """
+    dfs: Dict[str, pd.DataFrame] = {}
+    if source_type == "workbook":
+        # Read in all the sheets which the writers need, with one workbook parse
+        with metrics.stage("read workbook") as stage:
+            dfs = init_workbook(
+                source_dir=source_dir, sheet_names=sorted(sources), cache_dir=cache_dir
+            )
+            stage["rows"] = sum(len(df) for df in dfs.values())
+    elif "inventory" in sources and chunk_size is not None:
+        dfs["inventory"] = init_inventory_csv_chunks(
+            source_dir=source_dir, chunk_size=chunk_size
+        )
+    elif "inventory" in sources:
+        with metrics.stage("read inventory") as stage:
+            dfs["inventory"] = init_inventory(
+                logger=logger,
+                source_dir=source_dir,
+                source_type=source_type,
+                cache_dir=cache_dir,
+                where=where,
+            )
+            stage["rows"] = len(dfs["inventory"])
+    if "groups" in sources and "groups" not in dfs:
+        with metrics.stage("read groups") as stage:
+            dfs["groups"] = init_groups(
+                logger=logger,
+                source_dir=source_dir,
+                source_type=source_type,
+                cache_dir=cache_dir,
+            )
+            stage["rows"] = len(dfs["groups"])
+    return dfs
+
+
+def check_shard_column(
+    logger: Logger, dfs: Dict[str, pd.DataFrame], shard_by: Optional[str] = None
+) -> None:
+    """
+    Ensure that the shard column exists in the inventory, when sharding.
+
+    Args:
+        logger: The initialised Logger object.
+        dfs: The dictionary of pandas dataframe objects, keyed by source name.
+        shard_by: The inventory column to shard the inventory outputs by, or
+        None when they aren't sharded.
+
+    Returns:
+        N/A
+
+    Raises:
+        ValueError: When the shard column doesn't exist in the inventory.
+    """
+    # Ensure that the shard column exists in the inventory
+    if shard_by is None or "inventory" not in dfs:
+        return
+    if shard_by not in dfs["inventory"].columns:
+        invalid_error = (
+            f"Shard column not found in the inventory: {shard_by}. Use one of: "
+            f"{', '.join(dfs['inventory'].columns)}"
+        )
+        logger.error(invalid_error)
+        raise ValueError(invalid_error)
 
 
 def main(
@@ -857,6 +3996,13 @@ def main(
     output_type: str,
     source_dir: str = "motherstarter/inputs/",
     template_dir: str = "motherstarter/templates/core/",
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    incremental: bool = False,
+    chunk_size: Optional[int] = None,
+    metrics: Optional[Metrics] = None,
+    shard_by: Optional[str] = None,
+    where: Optional[str] = None,
 ) -> None:
     """
     Main workflow function used to execute the entire workflow
@@ -869,63 +4015,121 @@ def main(
         as a result of running the function.
         source_dir: The source directory of the input files.
         template_dir: The template directory of the template files.
+        jobs: The number of parallel processes used to write the outputs.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+        incremental: Skip the outputs whose source files, templates,
+        motherstarter version and output type are unchanged since they
+        were last written. Requires the cache directory.
+        chunk_size: Read the csv inventory in chunks of this many rows, so that
+        memory use does not grow with the inventory size. Set to None to read
+        the entire inventory at once.
+        metrics: The metrics to record the duration, rows and bytes of each
+        stage in, or None to not record them.
+        shard_by: The inventory column to shard the inventory outputs by, so
+        that each value of the column is written to its own directory. Set to
+        None to write a single output of the entire inventory.
+        where: The SQL WHERE clause to filter the sqlite inventory rows by, or
+        None to read all the rows.
     Returns:
         N/A
 
     Raises:
-        N/A
+        ValueError: When chunking is not supported by the source or output type,
+        or the shard column is not supported or doesn't exist, or a WHERE
+        clause is used with a source type other than sqlite.
+        RuntimeError: When one or more of the writers failed.
     """
     # Debug logging
-    logger.debug(f"Source directory is: {source_dir}")
-    logger.debug(f"Source template directory is: {template_dir}")
-    # Initialise inventory dataframe, based on the source_dir and source_type
-    inv_df = init_inventory(
-        logger=logger, source_dir=source_dir, source_type=source_type
+    logger.debug("Source directory is: %s", source_dir)
+    logger.debug("Source template directory is: %s", template_dir)
+    logger.debug("Output type is: %s", output_type)
+    validate_options(
+        logger=logger,
+        source_type=source_type,
+        output_type=output_type,
+        chunk_size=chunk_size,
+        shard_by=shard_by,
+        where=where,
     )
-    # Initialise group dataframe, based on the source_dir and source_type
-    group_df = init_groups(
-        logger=logger, source_dir=source_dir, source_type=source_type
+    # Retrieve the writers for the desired output_type
+    writers = get_writers(output_type=output_type)
+    # When building incrementally, remove the writers whose output is up to date
+    manifest = None
+    digests: Dict[str, str] = {}
+    if incremental and cache_dir is None:
+        logger.warning("Incremental builds require the cache, writing all outputs")
+    elif incremental:
+        from motherstarter.cache import BuildManifest
+
+        manifest = BuildManifest(cache_dir=cache_dir)
+        digests = {
+            w[0].__name__: get_writer_digest(
+                writer=w,
+                output_type=output_type,
+                source_dir=source_dir,
+                source_type=source_type,
+                template_dir=template_dir,
+                shard_by=shard_by,
+                where=where,
+            )
+            for w in writers
+        }
+        # Log and remove the writers whose recorded digest is unchanged
+        current = [
+            w
+            for w in writers
+            if manifest.is_current(w[0].__name__, digests[w[0].__name__])
+        ]
+        for w in current:
+            logger.info(f"Output is up to date, skipping: {w[0].__name__}")
+        writers = [w for w in writers if w not in current]
+        if not writers:
+            logger.info("All outputs are up to date")
+            return
+    from motherstarter.metrics import Metrics
+
+    # Record the metrics in a throwaway collection, when they aren't needed
+    metrics = metrics if metrics is not None else Metrics()
+    # Initialise the dataframes for the sources which the writers need, based
+    # on the source_dir and source_type
+    dfs = read_sources(
+        logger=logger,
+        sources={source for _, source, _ in writers},
+        source_dir=source_dir,
+        source_type=source_type,
+        cache_dir=cache_dir,
+        chunk_size=chunk_size,
+        metrics=metrics,
+        where=where,
     )
+    check_shard_column(logger=logger, dfs=dfs, shard_by=shard_by)
     # Prepare the jinja2 template environment
-    env = prep_templates(tmpl_dir=template_dir)
-    # Diagnostic outputs
-    logger.debug(f"Output type is: {output_type}")
-    # If/Else block to execute the desired output_type based on
-    # what is passed in from argparse
-    # If output type is all, output all file types
-    if output_type == "all":
-        to_nr_hosts(logger=logger, env=env, df=inv_df)
-        to_nr_groups(logger=logger, env=env, df=group_df)
-        to_csv_inventory(logger=logger, df=inv_df)
-        to_xlsx_inventory(logger=logger, df=inv_df)
-        to_csv_groups(logger=logger, df=group_df)
-        to_xlsx_groups(logger=logger, df=group_df)
-        to_pyats(logger=logger, env=env, df=inv_df)
-        to_ansible(logger=logger, env=env, df=inv_df)
-        to_json_inventory(logger=logger, df=inv_df)
-        to_json_groups(logger=logger, df=group_df)
-    # If output type is nornir, output all nornir types
-    elif output_type == "nornir":
-        to_nr_hosts(logger=logger, env=env, df=inv_df)
-        to_nr_groups(logger=logger, env=env, df=group_df)
-    # If output type is csv, output all CSV types
-    elif output_type == "csv":
-        to_csv_inventory(logger=logger, df=inv_df)
-        to_csv_groups(logger=logger, df=group_df)
-    # If output type is xlsx, output all xlsx types
-    elif output_type == "xlsx":
-        to_xlsx_inventory(logger=logger, df=inv_df)
-        to_xlsx_groups(logger=logger, df=group_df)
-    # If output type is pyats, output all pyATS types
-    elif output_type == "pyats":
-        to_pyats(logger=logger, env=env, df=inv_df)
-    # If output type is ansible, output all ansible types
-    elif output_type == "ansible":
-        to_ansible(logger=logger, env=env, df=inv_df)
-    # If output type is json, output all ansible types
-    elif output_type == "json":
-        to_json_inventory(logger=logger, df=inv_df)
-        to_json_groups(logger=logger, df=group_df)
+    with metrics.stage("templates"):
+        env = prep_templates(tmpl_dir=template_dir, cache_dir=cache_dir)
+    # Execute the writers
+    outputs = run_writers(
+        logger=logger,
+        writers=writers,
+        dfs=dfs,
+        env=env,
+        template_dir=template_dir,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        metrics=metrics,
+        shard_by=shard_by,
+    )
+    log_template_cache(logger=logger, env=env)
+    # Record the digests of the outputs which were written. NOTE: The outputs
+    # of a sharded writer are keyed by "<writer name>/<shard name>", so every
+    # shard output is recorded against the writer.
+    if manifest is not None:
+        writer_outputs: Dict[str, List[str]] = {}
+        for name, output in outputs.items():
+            writer_outputs.setdefault(name.split("/")[0], []).append(output)
+        for name, paths in writer_outputs.items():
+            manifest.update(name=name, digest=digests[name], outputs=paths)
+        manifest.save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+"""
+This module provides a nornir inventory plugin, which builds the nornir
+hosts and groups directly from the motherstarter sources, rather than
+parsing the hosts.yaml and groups.yaml files written by motherstarter.
+
+The hosts and groups have the same fields as the nornir templates in the
+"templates/core/nornir" directory. The plugin is registered with nornir as
+"MotherStarterInventory", and is used as follows:
+
+    from nornir import InitNornir
+
+    nr = InitNornir(
+        inventory={
+            "plugin": "MotherStarterInventory",
+            "options": {"source_dir": "inputs", "source_type": "csv"},
+        }
+    )
+"""
+
+# Import modules
+from __future__ import annotations
+from motherstarter import motherstarter as ms
+from motherstarter.api import load_sources
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Specify the scrapli platform of each group platform, as per the groups.j2
+# template. Other platforms are used as the scrapli platform unchanged.
+SCRAPLI_PLATFORMS = {
+    "ios": "cisco_iosxe",
+    "iosxe": "cisco_iosxe",
+    "junos": "juniper_junos",
+    "nxos": "cisco_nxos",
+    "nxos_ssh": "cisco_nxos",
+    "eos": "arista_eos",
+}
+
+
+def to_bool(value: Any) -> Any:
+    """
+    Take a value and return it as a boolean when it is the text "true" or
+    "false", in any case, as it would be parsed from the rendered YAML.
+    Other values are returned unchanged.
+    """
+    if isinstance(value, str) and value.lower() in ["true", "false"]:
+        return value.lower() == "true"
+    return value
+
+
+def nornir_hosts(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Take the pandas dataframe of the inventory and return the nornir hosts,
+    with the same fields as the hosts.j2 template.
+
+    Args:
+        df: The pandas dataframe object, initialised from the
+        inventory data source.
+
+    Returns:
+        hosts: The dictionary of host dictionaries, keyed by host name.
+
+    Raises:
+        N/A
+    """
+    # Convert each column to a list once, rather than accessing each row, with
+    # the missing values replaced with None
+    columns = ["name", "mgmt_ip", "vendor", "device_type", "operating_system"]
+    rows = zip(*(ms.column_to_list(df[column]) for column in columns))
+    return {
+        name: {
+            "hostname": name,
+            "groups": [operating_system],
+            "data": {
+                "mgmt_ip": mgmt_ip,
+                "vendor": str(vendor).lower(),
+                "type": device_type,
+            },
+        }
+        for name, mgmt_ip, vendor, device_type, operating_system in rows
+    }
+
+
+def nornir_groups(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Take the pandas dataframe of the groups and return the nornir groups,
+    with the same fields and scrapli platform mapping as the groups.j2
+    template.
+
+    Args:
+        df: The pandas dataframe object, initialised from the
+        groups data source.
+
+    Returns:
+        groups: The dictionary of group dictionaries, keyed by group name.
+
+    Raises:
+        N/A
+    """
+    # Convert each column to a list once, rather than accessing each row, with
+    # the missing values replaced with None
+    columns = ["name", "platform", "port", "auth_strict_key"]
+    rows = zip(*(ms.column_to_list(df[column]) for column in columns))
+    return {
+        name: {
+            "platform": platform,
+            "connection_options": {
+                "scrapli": {
+                    "platform": SCRAPLI_PLATFORMS.get(platform, platform),
+                    "port": port,
+                    "extras": {"auth_strict_key": to_bool(auth_strict_key)},
+                }
+            },
+        }
+        for name, platform, port, auth_strict_key in rows
+    }
+
+
+class MotherStarterInventory:
+    """
+    A nornir inventory plugin, which builds the nornir inventory from the
+    motherstarter sources. Hosts which are in a group that isn't in the
+    groups source are added to an empty group of that name.
+
+    Args:
+        source_dir: The source directory of the input files, or None for the
+        sample input files.
+        source_type: The source file type to read the inventory and group
+        data from.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+        inventory: The pandas dataframe object of the inventory, or None to
+        read it from the source files.
+        groups: The pandas dataframe object of the groups, or None to read
+        it from the source files.
+    """
+
+    def __init__(
+        self,
+        source_dir: Optional[str] = None,
+        source_type: str = "json",
+        cache_dir: Optional[str] = None,
+        inventory: Optional[pd.DataFrame] = None,
+        groups: Optional[pd.DataFrame] = None,
+    ) -> None:
+        self.source_dir = source_dir
+        self.source_type = source_type
+        self.cache_dir = cache_dir
+        self.inventory = inventory
+        self.groups = groups
+
+    def load(self) -> Any:
+        """
+        Read the sources and return the nornir inventory, with the hosts
+        and groups built in the same way as the nornir SimpleInventory
+        plugin builds them from the YAML files.
+        """
+        # Import nornir, only when the plugin is loaded by nornir
+        from nornir.core.inventory import (  # type: ignore
+            ConnectionOptions,
+            Defaults,
+            Group,
+            Groups,
+            Host,
+            Hosts,
+            Inventory,
+            ParentGroups,
+        )
+
+        dfs = load_sources(
+            inventory=self.inventory,
+            groups=self.groups,
+            source_dir=self.source_dir,
+            source_type=self.source_type,
+            cache_dir=self.cache_dir,
+        )
+        defaults = Defaults()
+
+        def create(element_type: Any, name: str, data: Dict[str, Any]) -> Any:
+            # Create the host or group, with its connection options
+            return element_type(
+                name=name,
+                hostname=data.get("hostname"),
+                platform=data.get("platform"),
+                data=data.get("data"),
+                defaults=defaults,
+                connection_options={
+                    connection: ConnectionOptions(
+                        port=options.get("port"),
+                        platform=options.get("platform"),
+                        extras=options.get("extras"),
+                    )
+                    for connection, options in data.get(
+                        "connection_options", {}
+                    ).items()
+                },
+            )
+
+        groups = Groups()
+        for name, data in nornir_groups(dfs["groups"]).items():
+            groups[name] = create(Group, name, data)
+        hosts = Hosts()
+        for name, data in nornir_hosts(dfs["inventory"]).items():
+            host = create(Host, name, data)
+            # Add the groups which aren't in the groups source
+            for group in data["groups"]:
+                if group not in groups:
+                    groups[group] = Group(name=group, defaults=defaults)
+            host.groups = ParentGroups([groups[group] for group in data["groups"]])
+            hosts[name] = host
+        return Inventory(hosts=hosts, groups=groups, defaults=defaults)
@@ -0,0 +1,316 @@
+"""
+This module provides the local render service used by the motherstarter
+serve command, which keeps the templates and sources loaded between
+requests and renders each output type on demand over HTTP.
+"""
+
+# Import modules
+from __future__ import annotations
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger
+from motherstarter import motherstarter as ms
+from motherstarter.watch import SourceWatcher
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import unquote, urlsplit
+import json
+import logging
+import os
+import shutil
+import socketserver
+import stat
+import threading
+
+# Specify the content type of each output file extension. Outputs with other
+# extensions, such as the Ansible inventory, are plain text.
+CONTENT_TYPES = {
+    ".csv": "text/csv; charset=utf-8",
+    ".feather": "application/vnd.apache.arrow.file",
+    ".json": "application/json",
+    ".parquet": "application/vnd.apache.parquet",
+    ".sqlite": "application/vnd.sqlite3",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".yaml": "application/yaml",
+}
+DEFAULT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+# Specify the output types which can be requested, in the order they are listed
+OUTPUT_TYPES: List[str] = [
+    "all",
+    "ansible",
+    "ansible_json",
+    "csv",
+    "feather",
+    "json",
+    "nornir",
+    "parquet",
+    "pyats",
+    "sqlite",
+    "xlsx",
+]
+
+# Specify the size of the chunks which the output files are streamed in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class RenderService(SourceWatcher):
+    """
+    A render service which keeps the Jinja2 environment and the parsed
+    sources loaded between requests, and renders each output type on
+    demand.
+
+    Every request checks the source and template files for changes. The
+    sources which changed are read again when they are next needed, and
+    only the outputs affected by a change are rendered again. Unaffected
+    outputs are served from the previous render.
+
+    NOTE: The outputs are rendered and streamed while holding a lock, so
+    that an output is never rewritten while it is being streamed. Requests
+    are therefore served one after another.
+
+    Args:
+        logger: The initialised Logger object.
+        source_type: The source file type to read the inventory and group
+        data from.
+        source_dir: The source directory of the input files.
+        template_dir: The template directory of the template files.
+        output_dir: The directory to render the outputs to.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+
+    Attributes:
+        stale: The set of names of the writers whose outputs must be
+        rendered again before they are served.
+        outputs: The dictionary of the rendered output file locations, keyed
+        by writer name.
+        lock: The lock held while rendering and streaming the outputs.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        source_type: str,
+        source_dir: str,
+        template_dir: str,
+        output_dir: str,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            logger=logger,
+            source_type=source_type,
+            output_type="all",
+            source_dir=source_dir,
+            template_dir=template_dir,
+            cache_dir=cache_dir,
+            output_dir=output_dir,
+        )
+        # Watch the writers of every output type which can be requested, as
+        # some of them aren't part of the "all" output type
+        self.writers = list(
+            dict.fromkeys(
+                w for ot in OUTPUT_TYPES for w in ms.get_writers(output_type=ot)
+            )
+        )
+        self.stale = {w[0].__name__ for w in self.writers}
+        self.outputs: Dict[str, str] = {}
+        self.lock = threading.Lock()
+        self.snapshot = self.take_snapshot()
+
+    def render(self, output_type: str) -> Dict[str, str]:
+        """
+        Render the outputs of the output type which are stale, and return
+        the file location of each output of the output type.
+
+        NOTE: The lock must be held by the caller.
+
+        Args:
+            output_type: What file type(s) you would like to be outputted.
+
+        Returns:
+            outputs: The dictionary of output file locations, keyed by the
+            output file name.
+
+        Raises:
+            KeyError: When the output type doesn't exist.
+            RuntimeError: When one or more of the writers failed.
+        """
+        writers = ms.get_writers(output_type=output_type)
+        if not writers:
+            raise KeyError(output_type)
+        # Forget the changed sources, so they are read again when needed, and
+        # mark the affected outputs as stale
+        changed = self.changed_files()
+        if changed:
+            self.logger.info(f"Change detected: {', '.join(sorted(changed))}")
+            sources, affected = self.affected(changed)
+            for source in sources:
+                self.dfs.pop(source, None)
+            self.stale.update(w[0].__name__ for w in affected)
+        # Render the stale outputs, reading any sources which are needed
+        stale = [w for w in writers if w[0].__name__ in self.stale]
+        if stale:
+            self.read_sources({s for _, s, _ in stale if s not in self.dfs})
+            outputs = ms.run_writers(
+                logger=self.logger,
+                writers=stale,
+                dfs=self.dfs,
+                env=self.env,
+                template_dir=self.template_dir,
+                cache_dir=self.cache_dir,
+                output_dir=self.output_dir,
+            )
+            self.outputs.update(outputs)
+            self.stale.difference_update(outputs)
+        return {
+            os.path.basename(self.outputs[w[0].__name__]): self.outputs[w[0].__name__]
+            for w in writers
+        }
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """
+    A handler of the requests to the render service. The routes are:
+
+        GET /                          The list of output types.
+        GET /<output_type>             The list of output files of the type.
+        GET /<output_type>/<file_name> The rendered output file.
+    """
+
+    # Keep connections open between requests, to avoid reconnecting
+    protocol_version = "HTTP/1.1"
+    server: Union[RenderServer, UnixRenderServer]
+
+    def do_GET(self) -> None:
+        """
+        Render and send the requested output, or a list of the outputs.
+        """
+        service = self.server.service
+        parts = [unquote(p) for p in urlsplit(self.path).path.split("/") if p]
+        if not parts:
+            self.send_json({"output_types": OUTPUT_TYPES})
+            return
+        if len(parts) > 2 or parts[0] not in OUTPUT_TYPES:
+            self.send_error(404, f"Unknown output: {self.path}")
+            return
+        with service.lock:
+            try:
+                outputs = service.render(parts[0])
+            except Exception as err:
+                service.logger.error(f"Failed to render {parts[0]}: {err!r}")
+                # Send the error detail in the escaped body only, as the
+                # status line can't hold newlines or non latin-1 text
+                self.send_error(
+                    500,
+                    "Failed to render output",
+                    f"Failed to render {parts[0]}: {err}",
+                )
+                return
+            if len(parts) == 1:
+                self.send_json({"files": sorted(outputs)})
+            elif parts[1] in outputs:
+                self.send_file(outputs[parts[1]])
+            else:
+                self.send_error(404, f"Unknown output: {self.path}")
+
+    def send_json(self, data: Dict[str, Any]) -> None:
+        """
+        Send the dictionary as a json response.
+        """
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_file(self, path: str) -> None:
+        """
+        Stream the file as the response, in chunks.
+        """
+        extension = os.path.splitext(path)[1]
+        with open(path, "rb") as f:
+            self.send_response(200)
+            self.send_header(
+                "Content-Type", CONTENT_TYPES.get(extension, DEFAULT_CONTENT_TYPE)
+            )
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile, STREAM_CHUNK_SIZE)
+
+    def address_string(self) -> str:
+        """
+        Return the client address, which is empty for Unix socket clients.
+        """
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """
+        Log each request to the motherstarter logger, rather than stderr.
+        """
+        logger = self.server.service.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """
+    A HTTP server of the render service, listening on a TCP port.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service: RenderService, host: str, port: int) -> None:
+        self.service = service
+        super().__init__((host, port), RenderHandler)
+
+
+# NOTE: Unix sockets are not available on every platform, such as Windows
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class UnixRenderServer(socketserver.ThreadingUnixStreamServer):
+        """
+        A HTTP server of the render service, listening on a Unix socket.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, service: RenderService, socket_path: str) -> None:
+            self.service = service
+            # Remove the socket left behind by a previous service
+            if os.path.exists(socket_path) and stat.S_ISSOCK(
+                os.stat(socket_path).st_mode
+            ):
+                os.unlink(socket_path)
+            super().__init__(socket_path, RenderHandler)
+
+
+def make_server(
+    service: RenderService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[str] = None,
+) -> Union[RenderServer, UnixRenderServer]:
+    """
+    Create a server of the render service, listening on the Unix socket
+    when it is supplied, or otherwise the host and TCP port.
+
+    Args:
+        service: The render service.
+        host: The host address to listen on.
+        port: The TCP port to listen on, or 0 for any free port.
+        socket_path: The Unix socket path to listen on, or None to listen on
+        the host and TCP port.
+
+    Returns:
+        server: The server, which is started with serve_forever.
+
+    Raises:
+        OSError: When the address cannot be listened on, or Unix sockets
+        are not supported on the platform.
+    """
+    if socket_path is not None:
+        if "UnixRenderServer" not in globals():
+            raise OSError("Unix sockets are not supported on this platform")
+        return UnixRenderServer(service, socket_path)
+    return RenderServer(service, host, port)
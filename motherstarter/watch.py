@@ -0,0 +1,258 @@
+"""
+This module provides the watcher used by the motherstarter watch command,
+which regenerates the outputs affected by each change to the source and
+template files, keeping the templates and sources loaded between changes.
+"""
+
+# Import modules
+from __future__ import annotations
+from logging import Logger
+from motherstarter import motherstarter as ms
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import os
+import pathlib as pl
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SourceWatcher:
+    """
+    A watcher of the source and template files of the writers for the
+    output type, which polls the files for changes and regenerates only
+    the outputs which are affected by the changed files.
+
+    The Jinja2 environment and the parsed sources are kept between changes,
+    so only the changed sources are read again. The environment reloads
+    changed templates automatically.
+
+    Args:
+        logger: The initialised Logger object.
+        source_type: The source file type to read the inventory and group
+        data from.
+        output_type: What file type(s) you would like to be outputted.
+        source_dir: The source directory of the input files.
+        template_dir: The template directory of the template files.
+        cache_dir: The cache directory for the on-disk caches, or None to
+        disable them.
+        output_dir: The directory to write the outputs to, in a directory per
+        writer, or None for the default output directories.
+
+    Attributes:
+        writers: The list of writer tuples for the output type.
+        dfs: The dictionary of the parsed sources, keyed by source name.
+        snapshot: The dictionary of the modification time and size of each
+        watched file, keyed by file path.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        source_type: str,
+        output_type: str,
+        source_dir: str,
+        template_dir: str,
+        cache_dir: Optional[str] = None,
+        output_dir: Optional[str] = None,
+    ) -> None:
+        self.logger = logger
+        self.source_type = source_type
+        self.source_dir = source_dir
+        self.template_dir = template_dir
+        self.cache_dir = cache_dir
+        self.output_dir = output_dir
+        self.writers = ms.get_writers(output_type=output_type)
+        self.dfs: Dict[str, pd.DataFrame] = {}
+        self.snapshot: Dict[str, Tuple[int, int]] = {}
+        # Prepare the jinja2 template environment, once for every change
+        self.env = ms.prep_templates(tmpl_dir=template_dir, cache_dir=cache_dir)
+
+    def source_files(self) -> Dict[str, Set[str]]:
+        """
+        Return the source file paths of each source which the writers need,
+        keyed by source name.
+        """
+        sources = {source for _, source, _ in self.writers}
+        return {
+            source: {
+                os.path.normpath(f)
+                for f in ms.get_source_files(self.source_dir, self.source_type, source)
+            }
+            for source in sources
+        }
+
+    def take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Return the modification time and size of each source file and each
+        file in the template directory. Missing files are left out, so a
+        file which is removed and written again is detected as changed.
+        """
+        files = set().union(*self.source_files().values())
+        files.update(
+            os.path.normpath(path)
+            for path in pl.Path(self.template_dir).rglob("*")
+            if path.is_file()
+        )
+        snapshot = {}
+        for f in files:
+            try:
+                stat = os.stat(f)
+            except OSError:
+                continue
+            snapshot[f] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changed_files(self) -> Set[str]:
+        """
+        Take a new snapshot of the watched files and return the files which
+        were added, changed or removed since the previous snapshot.
+        """
+        snapshot = self.take_snapshot()
+        changed = {
+            f
+            for f in snapshot.keys() | self.snapshot.keys()
+            if snapshot.get(f) != self.snapshot.get(f)
+        }
+        self.snapshot = snapshot
+        return changed
+
+    def affected(self, changed: Set[str]) -> Tuple[Set[str], List[ms.WriterSpec]]:
+        """
+        Return the sources which must be read again and the writers which
+        must be executed again, because of the changed files. A changed
+        template which isn't rendered by any writer may be included by the
+        other templates, so every template writer is executed again.
+        """
+        source_files = self.source_files()
+        sources = {source for source, files in source_files.items() if files & changed}
+        # Assign the template path of each template writer to a dictionary
+        templates = {
+            w[0].__name__: os.path.normpath(os.path.join(self.template_dir, w[2]))
+            for w in self.writers
+            if w[2] is not None
+        }
+        other_changed = changed - set(templates.values())
+        other_changed -= set().union(*source_files.values())
+        writers = []
+        for w in self.writers:
+            name = w[0].__name__
+            if w[1] in sources:
+                writers.append(w)
+            elif name in templates and (other_changed or templates[name] in changed):
+                writers.append(w)
+        return sources, writers
+
+    def read_sources(self, sources: Set[str]) -> None:
+        """
+        Read the sources again, replacing the parsed sources.
+        """
+        if self.source_type == "workbook":
+            # Read in all the changed sheets, with one workbook parse
+            self.dfs.update(
+                ms.init_workbook(
+                    source_dir=self.source_dir,
+                    sheet_names=sorted(sources),
+                    cache_dir=self.cache_dir,
+                )
+            )
+            return
+        for source in sources:
+            init_source = ms.init_inventory if source == "inventory" else ms.init_groups
+            self.dfs[source] = init_source(
+                logger=self.logger,
+                source_dir=self.source_dir,
+                source_type=self.source_type,
+                cache_dir=self.cache_dir,
+            )
+
+    def regenerate(self, changed: Optional[Set[str]] = None) -> List[str]:
+        """
+        Read the sources again and execute the writers which are affected by
+        the changed files, or every writer when no changed files are supplied.
+        Errors are logged rather than raised, so that watching continues and
+        a source which is saved again is picked up.
+
+        Args:
+            changed: The set of changed file paths, or None to read every
+            source and execute every writer.
+
+        Returns:
+            names: The list of names of the writers which were executed.
+
+        Raises:
+            N/A
+        """
+        if changed is None:
+            sources, writers = set(self.source_files()), self.writers
+        else:
+            sources, writers = self.affected(changed)
+        if not writers:
+            return []
+        # Read any sources the writers need which failed to be read previously
+        sources |= {source for _, source, _ in writers if source not in self.dfs}
+        try:
+            self.read_sources(sources)
+            ms.run_writers(
+                logger=self.logger,
+                writers=writers,
+                dfs=self.dfs,
+                env=self.env,
+                template_dir=self.template_dir,
+                cache_dir=self.cache_dir,
+                output_dir=self.output_dir,
+            )
+        except Exception as err:
+            self.logger.error(f"Failed to regenerate the outputs: {err!r}")
+            # Forget the sources, so they are read again on the next change
+            for source in sources:
+                self.dfs.pop(source, None)
+            return []
+        return [w[0].__name__ for w in writers]
+
+    def run(
+        self,
+        interval: float = 1.0,
+        debounce: float = 0.5,
+        max_changes: Optional[int] = None,
+    ) -> None:
+        """
+        Generate every output, and then poll the watched files and regenerate
+        the affected outputs after each change. A burst of changes is only
+        regenerated once the files are unchanged for the debounce time.
+
+        Args:
+            interval: How often to poll the watched files, in seconds.
+            debounce: How long the files must be unchanged, in seconds.
+            max_changes: Stop after regenerating this many changes, or None to
+            watch until interrupted.
+
+        Returns:
+            N/A
+
+        Raises:
+            N/A
+        """
+        self.snapshot = self.take_snapshot()
+        self.regenerate()
+        self.logger.info(
+            f"Watching for changes: {self.source_dir}, {self.template_dir}"
+        )
+        changes = 0
+        while max_changes is None or changes < max_changes:
+            time.sleep(interval)
+            changed = self.changed_files()
+            if not changed:
+                continue
+            # Wait for the files to stop changing, so a burst of saves is
+            # only regenerated once
+            while True:
+                time.sleep(debounce)
+                more_changed = self.changed_files()
+                if not more_changed:
+                    break
+                changed |= more_changed
+            self.logger.info(f"Change detected: {', '.join(sorted(changed))}")
+            names = self.regenerate(changed)
+            self.logger.info(f"Regenerated outputs: {', '.join(names) or 'none'}")
+            changes += 1
@@ -163,3 +163,24 @@ def tests(session):
     """
     session.install("-r", "requirements.txt")
     session.run("pytest", "--cov=./", "--cov-report=xml")
+
+
+@nox.session(python=["3.8", "3.9"])
+def benchmark(session):
+    """
+    Nox run the benchmarks, saving the results to a json file.
+    Any arguments are passed to the benchmarks, for example:
+    nox -s benchmark -- --size 1000 --baseline results.json
+
+    Args:
+        session: nox session
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+
+    """
+    session.install("-r", "requirements.txt")
+    session.run("python", "-m", "benchmarks.run", *session.posargs)
@@ -25,7 +25,7 @@ setup(
     license="Apache License 2.0",
     version=__version__,
     author=__author__,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3",
@@ -37,8 +37,11 @@ setup(
     python_requires=">=3.8",
     include_package_data=True,
     install_requires=requirements,
+    extras_require={"arrow": ["pyarrow"], "json": ["orjson"], "nornir": ["nornir>=3"]},
     entry_points="""
         [console_scripts]
         motherstarter=motherstarter.motherstarter:cli
+        [nornir.plugins.inventory]
+        MotherStarterInventory=motherstarter.nornir_plugin:MotherStarterInventory
     """,
 )
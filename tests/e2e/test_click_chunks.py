@@ -0,0 +1,178 @@
+"""
+This is where I am testing chunked csv inputs via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+from tests.e2e.test_click_jobs import read_outputs
+import os
+import traceback
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+@pytest.mark.parametrize("ot", ["ansible", "csv", "nornir", "pyats", "xlsx"])
+def test_convert_chunk_size_matches(runner, tmp_path, monkeypatch, ot):
+    """
+    Test that the motherstarter convert with a chunked csv inventory
+    produces the same outputs as reading the entire inventory.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+        ot: The output type.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    outputs = []
+    for chunk_args in [[], ["-cs", "2"]]:
+        # Execute command in a separate working directory for each run
+        run_dir = tmp_path / f"run-{len(chunk_args)}"
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        result = runner.invoke(ms.convert, ["-st", "csv", "-o", ot] + chunk_args)
+        if result.exception:
+            traceback.print_exception(*result.exc_info)  # noqa
+        assert result.exit_code == 0
+        outputs.append(read_outputs(run_dir / "motherstarter"))
+    # Perform assertion tests to ensure the outputs are identical
+    assert outputs[0]
+    assert outputs[0] == outputs[1]
+
+
+def test_convert_chunk_size_bad_source_type(runner):
+    """
+    Test that the motherstarter convert with a chunk size and a
+    source type other than csv fails as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-st", "json", "-o", "nornir", "-cs", "2"])
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 1
+    assert "ERROR - Chunk size is not supported with source type: json" in (
+        result.output
+    )
+
+
+def test_convert_chunk_size_multi_loop_template(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with a chunked csv inventory
+    renders every host through a template which loops over the inventory
+    once per operating system.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Create a template which loops over the inventory once per group
+    template_dir = tmp_path / "templates"
+    (template_dir / "ansible").mkdir(parents=True)
+    (template_dir / "ansible" / "hosts.j2").write_text(
+        "{% for os in ['ios', 'nxos', 'iosxr', 'junos', 'eos'] %}\n"
+        "[{{ os }}]\n"
+        "{% for dev in inventory %}"
+        "{% if dev.operating_system == os %}{{ dev.name }}\n{% endif %}"
+        "{% endfor %}"
+        "{% endfor %}"
+    )
+    source_dir = os.path.abspath("motherstarter/inputs")
+    expected = ms.init_inventory_csv(source_dir=source_dir)["name"].tolist()
+    outputs = []
+    for chunk_args in [[], ["-cs", "2"]]:
+        # Execute command in a separate working directory for each run
+        run_dir = tmp_path / f"run-{len(chunk_args)}"
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        result = runner.invoke(
+            ms.convert,
+            ["-st", "csv", "-sd", source_dir, "-td", str(template_dir), "-o", "ansible"]
+            + chunk_args,
+        )
+        if result.exception:
+            traceback.print_exception(*result.exc_info)  # noqa
+        assert result.exit_code == 0
+        outputs.append(read_outputs(run_dir / "motherstarter"))
+    # Perform assertion tests to ensure every host is rendered in each run
+    for output in outputs:
+        hosts = output["outputs/ansible/inventory/hosts"].decode().split()
+        assert sorted(name for name in hosts if not name.startswith("[")) == sorted(
+            expected
+        )
+    assert outputs[0] == outputs[1]
+
+
+def test_convert_chunk_size_missing_os(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with a chunked csv inventory
+    keeps the devices without an operating system, in the same group
+    as reading the entire inventory.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Create an inventory with a missing operating system in two chunks
+    source_dir = tmp_path / "inputs"
+    source_dir.mkdir()
+    lines = open("motherstarter/inputs/inventory.csv").read().splitlines()
+    for i in [1, 4]:
+        lines[i] = lines[i].rsplit(",", 1)[0] + ","
+    (source_dir / "inventory.csv").write_text("\n".join(lines) + "\n")
+    blank = [lines[i].split(",")[0] for i in [1, 4]]
+    outputs = []
+    for chunk_args in [[], ["-cs", "2"]]:
+        # Execute command in a separate working directory for each run
+        run_dir = tmp_path / f"run-{len(chunk_args)}"
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        result = runner.invoke(
+            ms.convert,
+            ["-st", "csv", "-sd", str(source_dir), "-o", "ansible"] + chunk_args,
+        )
+        if result.exception:
+            traceback.print_exception(*result.exc_info)  # noqa
+        assert result.exit_code == 0
+        outputs.append(read_outputs(run_dir / "motherstarter"))
+    # Perform assertion tests to ensure the devices are rendered in each run
+    for output in outputs:
+        hosts = output["outputs/ansible/inventory/hosts"].decode()
+        ungrouped = hosts.split("[ungrouped]\n")[1].split("\n\n")[0]
+        assert [line.split()[0] for line in ungrouped.splitlines()] == blank
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,165 @@
+"""
+This is where I am testing incremental outputs via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+import traceback
+import shutil
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+def invoke_incremental(runner, source_dir, cache_dir, args=()):
+    """
+    Invoke motherstarter convert incrementally, with nornir outputs.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        source_dir: The source directory to find the files in.
+        cache_dir: The cache directory to store the manifest in.
+        args: The list of other command-line arguments.
+
+    Returns:
+        result: The result of the command.
+
+    Raises:
+        N/A
+    """
+    result = runner.invoke(
+        ms.convert,
+        ["-i", "-o", "nornir", "-sd", source_dir, "-cd", cache_dir] + list(args),
+    )
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    assert result.exit_code == 0
+    return result
+
+
+def test_convert_incremental(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert incrementally only writes
+    the outputs whose inputs have changed.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Copy the source files, so they can be changed
+    source_dir = tmp_path / "inputs"
+    shutil.copytree("tests/test_data/inputs/core", source_dir)
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.chdir(tmp_path)
+    # The first run writes all outputs
+    result = invoke_incremental(runner, str(source_dir), cache_dir)
+    assert "File output location: motherstarter/outputs/nr/inventory/hosts.yaml" in (
+        result.output
+    )
+    # The second run skips all outputs, without reading the sources
+    result = invoke_incremental(runner, str(source_dir), cache_dir)
+    assert "INFO - All outputs are up to date" in result.output
+    assert "Inventory source type is" not in result.output
+    # Changing the inventory only writes the outputs which read it
+    inventory = source_dir / "inventory.json"
+    inventory.write_text(inventory.read_text().replace("10.0.0.16", "10.0.0.99"))
+    result = invoke_incremental(runner, str(source_dir), cache_dir)
+    assert "File output location: motherstarter/outputs/nr/inventory/hosts.yaml" in (
+        result.output
+    )
+    assert "Output is up to date, skipping: to_nr_groups" in result.output
+    assert (
+        "10.0.0.99"
+        in (tmp_path / "motherstarter/outputs/nr/inventory/hosts.yaml").read_text()
+    )
+    # Removing an output writes it again
+    (tmp_path / "motherstarter/outputs/nr/inventory/groups.yaml").unlink()
+    result = invoke_incremental(runner, str(source_dir), cache_dir)
+    assert "Output is up to date, skipping: to_nr_hosts" in result.output
+    assert "File output location: motherstarter/outputs/nr/inventory/groups.yaml" in (
+        result.output
+    )
+
+
+def test_convert_incremental_shards(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert incrementally, with sharded
+    outputs, writes a sharded writer again when any one of its shard
+    outputs is removed or changed.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Copy the source files, as the working directory is changed
+    source_dir = str(tmp_path / "inputs")
+    shutil.copytree("tests/test_data/inputs/core", source_dir)
+    cache_dir = str(tmp_path / "cache")
+    args = ["-sb", "operating_system"]
+    monkeypatch.chdir(tmp_path)
+    # The first run writes all outputs, and the second run skips them
+    invoke_incremental(runner, source_dir, cache_dir, args)
+    result = invoke_incremental(runner, source_dir, cache_dir, args)
+    assert "INFO - All outputs are up to date" in result.output
+    shards = sorted((tmp_path / "motherstarter/outputs/nr/inventory").glob("*/"))
+    assert len(shards) > 1
+    # Removing the last shard output writes the sharded writer again
+    (shards[-1] / "hosts.yaml").unlink()
+    result = invoke_incremental(runner, source_dir, cache_dir, args)
+    assert "Output is up to date, skipping: to_nr_groups" in result.output
+    assert (shards[-1] / "hosts.yaml").exists()
+    # Changing the last shard output writes the sharded writer again
+    (shards[-1] / "hosts.yaml").write_text("changed")
+    result = invoke_incremental(runner, source_dir, cache_dir, args)
+    assert "Output is up to date, skipping: to_nr_groups" in result.output
+    assert (shards[-1] / "hosts.yaml").read_text() != "changed"
+    result = invoke_incremental(runner, source_dir, cache_dir, args)
+    assert "INFO - All outputs are up to date" in result.output
+
+
+def test_convert_incremental_no_cache(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert incrementally, with the cache
+    disabled, writes all outputs.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(ms.convert, ["-i", "--no-cache", "-o", "json"])
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert "WARNING - Incremental builds require the cache" in result.output
+    assert "File output location: motherstarter/outputs/json/inventory.json" in (
+        result.output
+    )
@@ -243,6 +243,94 @@ def test_convert_source_type_xlsx(runner):
     assert expected_block in result.output
 
 
+def test_convert_source_type_parquet(runner):
+    """
+    Test that the motherstarter convert with a source type
+    of parquet works as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # The parquet format requires the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    # Assign source_type of parquet to a variable
+    st = "parquet"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-st", st])
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    # Assign expected strings to variables, for further validation.
+    expected_block = f"DEBUG - Inventory source type is {st}"
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_block in result.output
+
+
+def test_convert_source_type_sqlite(runner):
+    """
+    Test that the motherstarter convert with a source type
+    of sqlite works as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Assign source_type of sqlite to a variable
+    st = "sqlite"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-st", st])
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    # Assign expected strings to variables, for further validation.
+    expected_block = f"DEBUG - Inventory source type is {st}"
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_block in result.output
+
+
+def test_convert_source_type_feather(runner):
+    """
+    Test that the motherstarter convert with a source type
+    of feather works as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # The feather format requires the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    # Assign source_type of feather to a variable
+    st = "feather"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-st", st])
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    # Assign expected strings to variables, for further validation.
+    expected_block = f"DEBUG - Inventory source type is {st}"
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_block in result.output
+
+
 def test_convert_source_type_bad(runner):
     """
     Test that the motherstarter convert with a source type
@@ -263,7 +351,7 @@ def test_convert_source_type_bad(runner):
     # Execute command and assign to variable
     result = runner.invoke(ms.convert, ["-st", st])
     # Assign expected strings to variables, for further validation.
-    expected_block = f"Error: Invalid value for '--source-type' / '-st': '{st}' is not one of 'csv', 'json', 'xlsx'."  # noqa
+    expected_block = f"Error: Invalid value for '--source-type' / '-st': '{st}' is not one of 'csv', 'feather', 'json', 'parquet', 'sqlite', 'workbook', 'xlsx'."  # noqa
     # Perform assertion tests to ensure variables are in the expected outputs
     assert result.exit_code == 2
     assert expected_block in result.output
@@ -642,6 +730,112 @@ def test_convert_output_type_json(runner):
     assert expected_output_groups_file in result.output
 
 
+def test_convert_output_type_parquet(runner):
+    """
+    Test that the motherstarter convert outputs parquet
+    files to the correct location.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # The parquet format requires the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    # Assign output_type to a variable
+    ot = "parquet"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-o", ot])
+    # Assign expected strings to variables, for further validation.
+    expected_output_type = f"DEBUG - Output type is: {ot}"
+    expected_output_inv_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/inventory.{ot}"
+    )
+    expected_output_groups_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/groups.{ot}"
+    )
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_output_type in result.output
+    assert expected_output_inv_file in result.output
+    assert expected_output_groups_file in result.output
+
+
+def test_convert_output_type_sqlite(runner):
+    """
+    Test that the motherstarter convert outputs sqlite
+    files to the correct location.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Assign output_type to a variable
+    ot = "sqlite"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-o", ot])
+    # Assign expected strings to variables, for further validation.
+    expected_output_type = f"DEBUG - Output type is: {ot}"
+    expected_output_inv_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/inventory.{ot}"
+    )
+    expected_output_groups_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/groups.{ot}"
+    )
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_output_type in result.output
+    assert expected_output_inv_file in result.output
+    assert expected_output_groups_file in result.output
+
+
+def test_convert_output_type_feather(runner):
+    """
+    Test that the motherstarter convert outputs feather
+    files to the correct location.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # The feather format requires the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    # Assign output_type to a variable
+    ot = "feather"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-o", ot])
+    # Assign expected strings to variables, for further validation.
+    expected_output_type = f"DEBUG - Output type is: {ot}"
+    expected_output_inv_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/inventory.{ot}"
+    )
+    expected_output_groups_file = (
+        f"INFO - File output location: motherstarter/outputs/{ot}/groups.{ot}"
+    )
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_output_type in result.output
+    assert expected_output_inv_file in result.output
+    assert expected_output_groups_file in result.output
+
+
 def test_convert_output_type_xlsx(runner):
     """
     Test that the motherstarter convert outputs xlsx
@@ -768,6 +962,34 @@ def test_convert_output_type_ansible(runner):
     assert expected_output_inv_file in result.output
 
 
+def test_convert_output_type_ansible_json(runner):
+    """
+    Test that the motherstarter convert outputs the ansible
+    dynamic inventory file to the correct location.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Assign output_type to a variable
+    ot = "ansible_json"
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-o", ot])
+    # Assign expected strings to variables, for further validation.
+    expected_output_type = f"DEBUG - Output type is: {ot}"
+    expected_output_inv_file = "INFO - File output location: motherstarter/outputs/ansible/inventory/hosts.json"  # noqa
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 0
+    assert expected_output_type in result.output
+    assert expected_output_inv_file in result.output
+
+
 def test_convert_output_type_all(runner):
     """
     Test that the motherstarter convert outputs all
@@ -817,6 +1039,10 @@ def test_convert_output_type_all(runner):
     expected_output_inv_ansible_file = (
         "INFO - File output location: motherstarter/outputs/ansible/inventory/hosts"
     )
+    unexpected_output_sqlite_file = (
+        "INFO - File output location: motherstarter/outputs/sqlite/"
+    )
+    unexpected_output_ansible_json_file = "INFO - File output location: motherstarter/outputs/ansible/inventory/hosts.json"  # noqa
     # Perform assertion tests to ensure variables are in the expected outputs
     assert result.exit_code == 0
     assert expected_output_type in result.output
@@ -830,11 +1056,13 @@ def test_convert_output_type_all(runner):
     assert expected_output_groups_nornir_file in result.output
     assert expected_output_pyats_inv_file in result.output
     assert expected_output_inv_ansible_file in result.output
+    assert unexpected_output_sqlite_file not in result.output
+    assert unexpected_output_ansible_json_file not in result.output
 
 
 def test_convert_output_type_bad(runner):
     ot = "bad"
     result = runner.invoke(ms.convert, ["-o", ot])
-    expected_block = f"Error: Invalid value for '--output-type' / '-o': '{ot}' is not one of 'all', 'ansible', 'csv', 'json', 'nornir', 'pyats', 'xlsx'."  # noqa
+    expected_block = f"Error: Invalid value for '--output-type' / '-o': '{ot}' is not one of 'all', 'ansible', 'ansible_json', 'csv', 'feather', 'json', 'nornir', 'parquet', 'pyats', 'sqlite', 'xlsx'."  # noqa
     assert result.exit_code == 2
     assert expected_block in result.output
@@ -0,0 +1,137 @@
+"""
+This is where I am testing parallel outputs via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+import traceback
+import pathlib as pl
+from openpyxl import load_workbook
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+def read_outputs(output_dir):
+    """
+    Read all the output files under the output directory into
+    a dictionary, keyed by the relative file path. Excel workbooks
+    store their creation time, so they are compared by cell values.
+
+    Args:
+        output_dir: The output directory to read the files from.
+
+    Returns:
+        outputs: The dictionary of file contents.
+
+    Raises:
+        N/A
+    """
+    outputs = {}
+    for path in sorted(pl.Path(output_dir).rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix == ".xlsx":
+            wb = load_workbook(filename=path)
+            outputs[str(path.relative_to(output_dir))] = [
+                list(row)
+                for ws in wb.worksheets
+                for row in ws.iter_rows(values_only=True)
+            ]
+        else:
+            outputs[str(path.relative_to(output_dir))] = path.read_bytes()
+    return outputs
+
+
+def test_convert_jobs_matches_serial(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with multiple jobs produces
+    the same outputs as the serial run.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    outputs = []
+    for jobs in ["1", "4"]:
+        # Execute command in a separate working directory for each run
+        run_dir = tmp_path / f"jobs-{jobs}"
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        result = runner.invoke(ms.convert, ["-j", jobs])
+        if result.exception:
+            traceback.print_exception(*result.exc_info)  # noqa
+        assert result.exit_code == 0
+        outputs.append(read_outputs(run_dir / "motherstarter/outputs"))
+    # Perform assertion tests to ensure all outputs were written identically
+    assert len(outputs[0]) == 10
+    assert outputs[0] == outputs[1]
+
+
+def test_convert_jobs_bad(runner):
+    """
+    Test that the motherstarter convert with an invalid number
+    of jobs fails as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command and assign to variable
+    result = runner.invoke(ms.convert, ["-j", "0"])
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 2
+    assert "Invalid value for '--jobs'" in result.output
+
+
+def test_run_writers_collects_errors():
+    """
+    Test that a failed writer does not stop the remaining writers
+    and that all failures are reported together.
+
+    Args:
+        N/A
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Initialise the logger
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    called = []
+
+    def bad_writer(logger, df):
+        raise OSError("disk full")
+
+    def good_writer(logger, df):
+        called.append(df)
+
+    writers = [(bad_writer, "inventory", None), (good_writer, "groups", None)]
+    dfs = {"inventory": "inv", "groups": "grp"}
+    with pytest.raises(RuntimeError) as run_err:
+        ms.run_writers(
+            logger=logger, writers=writers, dfs=dfs, env=None, template_dir=""
+        )
+    # Perform assertion tests to ensure all writers ran and the error is reported
+    assert called == ["grp"]
+    assert "1 writer(s) failed: bad_writer" in str(run_err.value)
@@ -0,0 +1,105 @@
+"""
+This is where I am testing the stage metrics via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import json
+import pytest
+from motherstarter import motherstarter as ms
+import traceback
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_convert_metrics_file(runner, tmp_path, monkeypatch, jobs):
+    """
+    Test that the motherstarter convert saves the metrics of each stage
+    to the metrics file, and outputs the metrics summary.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+        jobs: The number of parallel processes.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    monkeypatch.chdir(tmp_path)
+    # Execute command and assign to variable
+    result = runner.invoke(
+        ms.convert, ["-o", "nornir", "--no-cache", "-j", jobs, "-mf", "metrics.json"]
+    )
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    # Perform assertion tests to ensure the metrics were saved and summarised
+    assert result.exit_code == 0
+    assert "DEBUG - Stage metrics:" in result.output
+    assert "INFO - Metrics output location: metrics.json" in result.output
+    stages = {
+        stage["stage"]: stage
+        for stage in json.loads((tmp_path / "metrics.json").read_text())["stages"]
+    }
+    assert {"read inventory", "read groups", "templates"} <= set(stages)
+    assert stages["write to_nr_hosts"]["rows"] == stages["read inventory"]["rows"]
+    assert (
+        stages["write to_nr_hosts"]["bytes"]
+        == (tmp_path / "motherstarter/outputs/nr/inventory/hosts.yaml").stat().st_size
+    )
+
+
+def test_convert_profile(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with profiling enabled saves
+    the raw stats and the hotspot report, and records the peak memory
+    of each stage.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    import pstats
+
+    monkeypatch.chdir(tmp_path)
+    # Execute command and assign to variable
+    result = runner.invoke(
+        ms.convert,
+        [
+            "-o",
+            "nornir",
+            "--no-cache",
+            "--profile",
+            "--profile-memory",
+            "-mf",
+            "m.json",
+        ],
+    )
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    # Perform assertion tests to ensure the profile files were saved
+    assert result.exit_code == 0
+    assert f"INFO - Profile output location: {ms.PROFILE_REPORT_FILE}" in result.output
+    report = (tmp_path / ms.PROFILE_REPORT_FILE).read_text()
+    assert "Hotspots sorted by cumulative time:" in report
+    assert "(main)" in report
+    assert pstats.Stats(str(tmp_path / ms.PROFILE_STATS_FILE)).total_calls > 0
+    # Perform assertion tests to ensure the peak memory of each stage is recorded
+    stages = json.loads((tmp_path / "m.json").read_text())["stages"]
+    assert all(stage["peak_memory_bytes"] is not None for stage in stages)
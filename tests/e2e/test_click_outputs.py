@@ -306,3 +306,28 @@ def test_output_pyats(base_input_dir=base_input_dir, base_output_dir=base_output
         output_data = yaml.safe_load(output_f)
     # Check that the length is the same
     assert len(output_data["devices"]) == len(input_data)
+
+
+def test_output_ansible_json(
+    base_input_dir=base_input_dir, base_output_dir=base_output_dir
+):
+    """
+    Test that the json input file and ansible dynamic inventory
+    file match in length.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    with open(f"{base_input_dir}/inventory.json") as input_f:
+        input_data = json.load(input_f)
+    with open(f"{base_output_dir}/ansible/inventory/hosts.json") as output_f:
+        output_data = json.load(output_f)
+    # Check that the length is the same
+    assert len(output_data["_meta"]["hostvars"]) == len(input_data)
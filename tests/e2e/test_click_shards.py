@@ -0,0 +1,87 @@
+"""
+This is where I am testing sharded outputs via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+import traceback
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_convert_shard_by(runner, tmp_path, monkeypatch, jobs):
+    """
+    Test that the motherstarter convert with a shard column writes the
+    inventory outputs of each shard to its own directory, and the groups
+    outputs once.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+        jobs: The number of parallel processes.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command in a separate working directory
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        ms.convert,
+        ["-st", "csv", "-o", "all", "-sb", "operating_system", "-j", jobs],
+    )
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    assert result.exit_code == 0
+    outputs = tmp_path / "motherstarter/outputs"
+    # Perform assertion tests to ensure each shard only has its own devices
+    for os_name, devices in [("eos", 2), ("ios", 2), ("junos", 1), ("nxos", 1)]:
+        hosts = (outputs / f"nr/inventory/{os_name}/hosts.yaml").read_text()
+        assert hosts.count("hostname: ") == devices
+        assert hosts.count(f"- {os_name}\n") == devices
+        testbed = (outputs / f"pyats/{os_name}/mother_starter_tb.yaml").read_text()
+        assert testbed.count(f"os: {os_name}") == devices
+        csv_lines = (outputs / f"csv/{os_name}/inventory.csv").read_text().splitlines()
+        assert len(csv_lines) == devices + 1
+        assert (outputs / f"ansible/inventory/{os_name}/hosts").exists()
+        assert (outputs / f"json/{os_name}/inventory.json").exists()
+        assert (outputs / f"xlsx/{os_name}/inventory.xlsx").exists()
+    # Perform assertion tests to ensure the groups and inventory aren't sharded
+    assert (outputs / "nr/inventory/groups.yaml").exists()
+    assert (outputs / "csv/groups.csv").exists()
+    assert not (outputs / "nr/inventory/hosts.yaml").exists()
+
+
+def test_convert_shard_by_bad_column(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with a shard column which doesn't
+    exist in the inventory fails as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command and assign to variable
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(ms.convert, ["-o", "nornir", "-sb", "site"])
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 1
+    assert "ERROR - Shard column not found in the inventory: site" in result.output
@@ -0,0 +1,83 @@
+"""
+This is where I am testing the sqlite source and output via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+import traceback
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+def test_convert_where(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with a WHERE clause only writes
+    the sqlite inventory rows which match it, and writes them back to a
+    sqlite database with the same rows.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command in a separate working directory
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        ms.convert,
+        ["-st", "sqlite", "-o", "sqlite", "-w", "operating_system = 'ios'"],
+    )
+    if result.exception:
+        traceback.print_exception(*result.exc_info)  # noqa
+    assert result.exit_code == 0
+    assert (
+        "DEBUG - Inventory WHERE clause is: operating_system = 'ios'" in result.output
+    )
+    # Perform assertion tests to ensure only the matching rows were written
+    df = ms.init_inventory_sqlite(source_dir="motherstarter/outputs/sqlite")
+    assert sorted(df["name"]) == [
+        "dfjt-r001.lab.dfjt.local",
+        "lab-csr-01.lab.dfjt.local",
+    ]
+    groups = ms.init_groups_sqlite(source_dir="motherstarter/outputs/sqlite")
+    assert len(groups) == len(ms.init_groups_sqlite(source_dir=f"{ms.dirname}/inputs"))
+
+
+def test_convert_where_bad_source_type(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with a WHERE clause and a source
+    type other than sqlite fails as expected.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    # Execute command and assign to variable
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        ms.convert, ["-st", "csv", "-o", "nornir", "-w", "operating_system = 'ios'"]
+    )
+    # Perform assertion tests to ensure variables are in the expected outputs
+    assert result.exit_code == 1
+    assert (
+        "ERROR - WHERE clause is not supported with source type: csv" in result.output
+    )
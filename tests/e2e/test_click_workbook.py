@@ -0,0 +1,81 @@
+"""
+This is where I am testing the single workbook input via the CLI
+"""
+
+# Import modules
+from click.testing import CliRunner
+import pytest
+from motherstarter import motherstarter as ms
+from tests.e2e.test_click_jobs import read_outputs
+import traceback
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return CliRunner()
+
+
+def test_convert_workbook_matches_xlsx(runner, tmp_path, monkeypatch):
+    """
+    Test that the motherstarter convert with the single workbook
+    source produces the same outputs as the separate xlsx files.
+
+    Args:
+        runner: The runner which simulates command-line
+        inputs, replicating an end user.
+        tmp_path: The temporary directory to write the outputs to.
+        monkeypatch: The fixture used to change the working directory.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    outputs = []
+    for st in ["xlsx", "workbook"]:
+        # Execute command in a separate working directory for each run
+        run_dir = tmp_path / st
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        result = runner.invoke(ms.convert, ["-st", st, "--no-cache"])
+        if result.exception:
+            traceback.print_exception(*result.exc_info)  # noqa
+        assert result.exit_code == 0
+        outputs.append(read_outputs(run_dir / "motherstarter/outputs"))
+    # Perform assertion tests to ensure all outputs were written identically
+    assert len(outputs[0]) == 10
+    assert outputs[0] == outputs[1]
+
+
+def test_workbook_single_parse(monkeypatch):
+    """
+    Test that both sheets of the workbook are read with a single
+    workbook parse.
+
+    Args:
+        monkeypatch: The fixture used to count the workbook parses.
+
+    Returns:
+        N/A
+
+    Raises:
+        N/A
+    """
+    import openpyxl
+
+    # Count the calls to load the workbook, which is the expensive parse
+    calls = []
+    load_workbook = openpyxl.load_workbook
+
+    def counted_load_workbook(*args, **kwargs):
+        calls.append(kwargs)
+        return load_workbook(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, "load_workbook", counted_load_workbook)
+    dfs = ms.init_workbook(source_dir="motherstarter/inputs")
+    # Perform assertion tests to ensure the workbook was parsed once, read-only
+    assert len(calls) == 1
+    assert calls[0]["read_only"] is True
+    assert dfs["inventory"].equals(ms.init_inventory_xlsx())
+    assert dfs["groups"].equals(ms.init_groups_xlsx())
@@ -0,0 +1,99 @@
+"""
+Unit tests to ensure that the library API renders the same outputs as
+the writers, without writing any files.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+from motherstarter.api import render, render_streams
+from tests.e2e.test_click_jobs import read_outputs
+import io
+import os
+import pytest
+
+# Define the source and template directories globally for all tests.
+SD = "tests/test_data/inputs/core"
+TD = "tests/test_data/templates/core"
+
+
+def test_render_all(tmp_path, monkeypatch):
+    # Render every output in an empty working directory
+    sd, td = os.path.abspath(SD), os.path.abspath(TD)
+    monkeypatch.chdir(tmp_path)
+    outputs = render(output_type="all", source_dir=sd, template_dir=td)
+    # Perform assertion tests to ensure every output is rendered, in memory
+    writers = ms.get_writers(output_type="all")
+    assert sorted(outputs) == sorted(ms.OUTPUT_FILES[w.__name__] for w, _, _ in writers)
+    assert list(tmp_path.iterdir()) == []
+    assert outputs["inventory.xlsx"][:2] == b"PK"
+    assert outputs["inventory.csv"].startswith("name,mgmt_ip,")
+
+
+@pytest.mark.parametrize(
+    "output_type",
+    [
+        "nornir",
+        "pyats",
+        "ansible",
+        "ansible_json",
+        "csv",
+        "xlsx",
+        "json",
+        "sqlite",
+        "parquet",
+        "feather",
+    ],
+)
+def test_render_matches_writers(tmp_path, output_type):
+    # The parquet and feather formats require the optional pyarrow dependency
+    if output_type in ["feather", "parquet"]:
+        pytest.importorskip("pyarrow")
+    # Initialise the logger, dataframes and template environment
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    dfs = {
+        "inventory": ms.init_inventory_json(source_dir=SD),
+        "groups": ms.init_groups_json(source_dir=SD),
+    }
+    env = ms.prep_templates(tmpl_dir=TD)
+    # Write the outputs to files with the writers of the output type
+    writer_dir = tmp_path / "writers"
+    for writer, source, template in ms.get_writers(output_type=output_type):
+        kwargs = {"env": env} if template else {}
+        writer(logger=logger, df=dfs[source], output_dir=str(writer_dir), **kwargs)
+    # Render the same outputs from the dataframes and save them to files
+    outputs = render(
+        output_type=output_type,
+        inventory=dfs["inventory"],
+        groups=dfs["groups"],
+        template_dir=TD,
+    )
+    render_dir = tmp_path / "render"
+    render_dir.mkdir()
+    for output_file, content in outputs.items():
+        if isinstance(content, str):
+            (render_dir / output_file).write_text(content)
+        else:
+            (render_dir / output_file).write_bytes(content)
+    # Perform assertion tests to ensure the outputs are identical
+    writer_outputs = read_outputs(writer_dir)
+    assert sorted(writer_outputs) == sorted(outputs)
+    assert read_outputs(render_dir) == writer_outputs
+
+
+def test_render_streams():
+    # Perform assertion tests to ensure the streams are rewound file objects
+    streams = render_streams(output_type="xlsx", source_dir=SD)
+    assert sorted(streams) == ["groups.xlsx", "inventory.xlsx"]
+    assert isinstance(streams["groups.xlsx"], io.BytesIO)
+    assert streams["groups.xlsx"].read(2) == b"PK"
+    with pytest.raises(ValueError):
+        render_streams(output_type="yaml")
+
+
+def test_render_parquet():
+    # The parquet format requires the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    outputs = render(output_type="parquet", source_dir=SD)
+    # Perform assertion tests to ensure the outputs are parquet bytes
+    assert sorted(outputs) == ["groups.parquet", "inventory.parquet"]
+    assert outputs["inventory.parquet"][:4] == b"PAR1"
@@ -0,0 +1,54 @@
+"""
+Unit tests to ensure that the parquet and feather sources are read
+identically to the json sources, including when the columns are projected.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import pytest
+import sys
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+@pytest.mark.parametrize("source", ["inventory", "groups"])
+def test_arrow_source_matches_json(tmp_path, file_format, source):
+    # The parquet and feather formats require the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    json_df = getattr(ms, f"init_{source}_json")(source_dir=SD)
+    # Write the json source to the file format, and read it back in
+    with open(tmp_path / f"{source}.{file_format}", "wb") as f:
+        getattr(ms, f"render_{file_format}")(f, df=json_df)
+    init_func = getattr(ms, f"init_{source}_{file_format}")
+    df = init_func(source_dir=str(tmp_path))
+    # Perform assertion tests to ensure the dataframes are identical
+    assert df.equals(json_df)
+    assert df.dtypes.equals(json_df.dtypes)
+    # Perform assertion tests to ensure only the projected columns are read
+    projected_df = init_func(source_dir=str(tmp_path), columns=["name"])
+    assert list(projected_df.columns) == ["name"]
+    assert projected_df["name"].equals(json_df["name"])
+
+
+def test_arrow_source_without_pyarrow(monkeypatch):
+    # Hide pyarrow, so the parquet source can't be read
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    # Ensure that an ImportError is raised, naming the optional dependency
+    with pytest.raises(ImportError, match="motherstarter\\[arrow\\]"):
+        ms.init_inventory_parquet(source_dir=SD)
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_arrow_output_without_pyarrow(monkeypatch, tmp_path, file_format):
+    # Hide pyarrow, so the parquet and feather outputs can't be written
+    df = ms.init_inventory_json(source_dir=SD)
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    writer = getattr(ms, f"to_{file_format}_inventory")
+    # Ensure that an ImportError is raised, naming the optional dependency,
+    # and no empty file is left behind
+    with pytest.raises(ImportError, match="motherstarter\\[arrow\\]"):
+        writer(logger=logger, df=df, output_dir=str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,47 @@
+"""
+Unit tests to ensure that the benchmark suite generates valid sources
+and records a result for every reader, writer and workflow.
+"""
+
+# Import modules
+from benchmarks import generate, run
+from motherstarter import motherstarter as ms
+
+# Define the number of devices globally for all tests.
+SIZE = 20
+
+
+def test_generate_sources(tmp_path):
+    # Generate the source files for every source type
+    source_dir = str(tmp_path)
+    generate.write_sources(source_dir, size=SIZE)
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    # Perform assertion tests to ensure every source type reads the same data
+    for source_type in generate.SOURCE_TYPES:
+        inv = ms.init_inventory(logger, source_dir=source_dir, source_type=source_type)
+        grp = ms.init_groups(logger, source_dir=source_dir, source_type=source_type)
+        assert len(inv) == SIZE
+        assert inv["mgmt_ip"].is_unique
+        assert set(grp["name"]) == set(inv["operating_system"])
+
+
+def test_run_benchmarks(tmp_path, monkeypatch):
+    # Execute the benchmarks in a temporary directory, without measuring memory
+    monkeypatch.chdir(tmp_path)
+    results = run.run_benchmarks(
+        sizes=[SIZE], data_dir=str(tmp_path / "data"), memory=False
+    )
+    report = run.save_results(results, output_file=str(tmp_path / "results.json"))
+    # Perform assertion tests to ensure every benchmark has a result
+    names = {(r["group"], r["name"]) for r in report["results"]}
+    readers = {
+        ("reader", f.__name__) for st in generate.SOURCE_TYPES for f in run.READERS[st]
+    }
+    writers = {("writer", w[0].__name__) for w in ms.get_writers(output_type="all")}
+    parsers = {("parser", f.__name__) for f in run.JSON_PARSERS}
+    assert names == readers | writers | parsers | {("main", "main")}
+    assert all(r["seconds"] > 0 for r in report["results"])
+    # Perform assertion tests to ensure a slowdown is reported as a regression
+    baseline = {"results": [dict(r, seconds=r["seconds"] / 2) for r in results]}
+    assert len(run.compare_results(baseline, report)) == len(results)
+    assert not run.compare_results(report, report)
@@ -0,0 +1,82 @@
+"""
+Unit tests to ensure that the start up time of motherstarter
+does not regress.
+
+The heavy dependencies (pandas, jinja2, openpyxl and colorama) are
+imported inside the functions which use them, so importing the
+command-line interface should not import them at all.
+"""
+
+# Import modules
+import subprocess  # nosec
+import sys
+
+# Define the maximum cumulative import time of motherstarter, in microseconds.
+# NOTE: This is intentionally generous so slow CI runners do not fail, pandas
+# alone takes several times longer than this to import.
+IMPORT_BUDGET_US = 250000
+# Define the modules which must not be imported at start up
+HEAVY_MODULES = ["pandas", "jinja2", "openpyxl", "colorama", "numpy"]
+
+
+def import_times(code):
+    """
+    Execute python code with "-X importtime" enabled and return
+    the cumulative import time of every imported module.
+
+    Args:
+        code: The python code to execute.
+
+    Returns:
+        times: A dictionary of module name to cumulative import time in
+        microseconds.
+
+    Raises:
+        N/A
+    """
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines are in the format "import time: self | cumulative | module"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_skips_heavy_modules():
+    # Import the command-line interface module only
+    times = import_times("import motherstarter.motherstarter")
+    # Perform assertion tests to ensure no heavy modules were imported
+    for module in HEAVY_MODULES:
+        assert module not in times
+
+
+def test_import_time_budget():
+    # Import the command-line interface module only
+    times = import_times("import motherstarter.motherstarter")
+    # Perform assertion tests to ensure the import is within the budget
+    assert times["motherstarter.motherstarter"] < IMPORT_BUDGET_US
+
+
+def test_version_skips_heavy_modules():
+    # Execute the version command, as the command-line would
+    code = (
+        "import sys\n"
+        "from motherstarter import motherstarter as ms\n"
+        "sys.argv = ['motherstarter', '--version']\n"
+        "try:\n"
+        "    ms.cli()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    times = import_times(code)
+    # Perform assertion tests to ensure no heavy modules were imported
+    for module in HEAVY_MODULES:
+        assert module not in times
@@ -0,0 +1,69 @@
+"""
+Unit tests to ensure that the json sources are read identically,
+whether or not the optional orjson dependency is installed.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import pytest
+import sys
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+@pytest.mark.parametrize("init_func", [ms.init_inventory_json, ms.init_groups_json])
+def test_json_source_fallback(monkeypatch, init_func):
+    # The orjson parser requires the optional orjson dependency
+    pytest.importorskip("orjson")
+    df = init_func(source_dir=SD)
+    # Hide orjson, so the json source is read using pandas
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback_df = init_func(source_dir=SD)
+    # Perform assertion tests to ensure the dataframes are identical
+    assert df.equals(fallback_df)
+    assert df.dtypes.equals(fallback_df.dtypes)
+
+
+def test_json_source_fallback_conversions(monkeypatch, tmp_path):
+    # The orjson parser requires the optional orjson dependency
+    pytest.importorskip("orjson")
+    # Write a json file with a numeric string and a date-named column
+    json_file = tmp_path / "inventory.json"
+    json_file.write_text(
+        '[{"name": "r1", "site_code": "0042", "created_at": 1609459200000},'
+        ' {"name": "r2", "site_code": "0117", "created_at": 1609545600000}]'
+    )
+    df = ms.read_json(str(json_file))
+    # Hide orjson, so the json source is read using pandas
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback_df = ms.read_json(str(json_file))
+    # Perform assertion tests to ensure the dataframes are identical, and
+    # the values are kept as they are written in the json file
+    assert df.equals(fallback_df)
+    assert df.dtypes.equals(fallback_df.dtypes)
+    assert fallback_df["site_code"].tolist() == ["0042", "0117"]
+    assert fallback_df["created_at"].tolist() == [1609459200000, 1609545600000]
+
+
+@pytest.mark.parametrize("orjson", [True, False])
+def test_json_source_bad(monkeypatch, tmp_path, orjson):
+    # Hide orjson, so the json source is read using pandas
+    if not orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    # Write a json file which isn't valid json
+    json_file = tmp_path / "inventory.json"
+    json_file.write_text('[{"name": "lab-csr-01"')
+    # Ensure that a ValueError is raised when the json is not valid
+    with pytest.raises(ValueError):
+        ms.read_json(str(json_file))
+
+
+def test_json_source_columns(tmp_path):
+    # Write a json file where the records have different keys
+    json_file = tmp_path / "inventory.json"
+    json_file.write_text('[{"name": "r1", "port": 22}, {"name": "r2", "vrf": "mgmt"}]')
+    df = ms.read_json(str(json_file))
+    # Perform assertion tests to ensure the columns are in order of appearance
+    assert list(df.columns) == ["name", "port", "vrf"]
+    assert df["port"].isna().tolist() == [False, True]
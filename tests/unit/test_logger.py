@@ -0,0 +1,33 @@
+"""
+Unit tests to ensure that the logger can be initialised repeatedly
+without writing each record more than once.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import logging
+
+
+def test_init_logger_idempotent(tmp_path):
+    # Initialise the logger repeatedly, as a batch run or test session would
+    log_file = tmp_path / "ms.log"
+    for _ in range(3):
+        logger = ms.init_logger(log_level="INFO", log_name=str(log_file))
+    logger.info("Written once")
+    logger.debug("Not written")
+    ms.flush_logger()
+    # Perform assertion tests to ensure each record is only written once
+    assert len(logger.handlers) == 1
+    assert log_file.read_text().count("INFO - Written once") == 1
+    assert "Not written" not in log_file.read_text()
+    # Perform assertion tests to ensure the level and log file can be changed
+    other_file = tmp_path / "other.log"
+    logger = ms.init_logger(log_level="DEBUG", log_name=str(other_file))
+    logger.debug("Written to %s", "the other file")
+    ms.flush_logger()
+    assert len(logger.handlers) == 1
+    assert logger.isEnabledFor(logging.DEBUG)
+    assert "DEBUG - Written to the other file" in other_file.read_text()
+    assert "other file" not in log_file.read_text()
+    ms.stop_logger()
+    assert logger.handlers == []
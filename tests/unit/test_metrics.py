@@ -0,0 +1,61 @@
+"""
+Unit tests to ensure that the stage metrics are recorded and
+summarised as expected.
+"""
+
+# Import modules
+from motherstarter.metrics import Metrics
+import json
+import pytest
+
+
+def test_metrics_stage(tmp_path):
+    # Record a stage with rows, a stage with an output file and a failed stage
+    metrics = Metrics()
+    with metrics.stage("read inventory", rows=6):
+        pass
+    output = tmp_path / "hosts.yaml"
+    output.write_text("---\n")
+    metrics.add("write to_nr_hosts", seconds=0.5, rows=6, output=str(output))
+    with pytest.raises(OSError):
+        with metrics.stage("write to_ansible"):
+            raise OSError("disk full")
+    # Perform assertion tests to ensure every stage is recorded in order
+    stages = metrics.to_dict()["stages"]
+    assert [stage["stage"] for stage in stages] == [
+        "read inventory",
+        "write to_nr_hosts",
+        "write to_ansible",
+    ]
+    assert stages[0]["rows"] == 6 and stages[0]["bytes"] is None
+    assert stages[1] == {
+        "stage": "write to_nr_hosts",
+        "seconds": 0.5,
+        "rows": 6,
+        "bytes": 4,
+        "peak_memory_bytes": None,
+    }
+    assert all(stage["seconds"] >= 0 for stage in stages)
+    # Perform assertion tests to ensure the metrics are saved and summarised
+    metrics_file = tmp_path / "metrics" / "metrics.json"
+    metrics.save(str(metrics_file))
+    assert json.loads(metrics_file.read_text())["stages"] == stages
+    summary = metrics.summary().splitlines()
+    assert summary[0].split() == ["Stage", "Seconds", "Rows", "Bytes"]
+    assert summary[2].split() == ["write", "to_nr_hosts", "0.500", "6", "4"]
+    assert summary[-1].startswith("total")
+
+
+def test_metrics_trace_memory():
+    # Record a stage which allocates memory, tracing the memory allocations
+    metrics = Metrics(trace_memory=True)
+    try:
+        with metrics.stage("allocate"):
+            data = bytearray(10 * 1024 * 1024)
+        del data
+    finally:
+        metrics.stop()
+    # Perform assertion tests to ensure the peak memory of the stage is recorded
+    stage = metrics.to_dict()["stages"][0]
+    assert stage["peak_memory_bytes"] >= 10 * 1024 * 1024
+    assert "Peak memory" in metrics.summary().splitlines()[0]
@@ -0,0 +1,43 @@
+"""
+Unit tests to ensure that the nornir inventory plugin builds the same
+hosts and groups as the rendered nornir inventory files.
+"""
+
+# Import modules
+from motherstarter.api import render
+from motherstarter.nornir_plugin import (
+    MotherStarterInventory,
+    nornir_groups,
+    nornir_hosts,
+)
+from motherstarter import motherstarter as ms
+import pytest
+import yaml
+
+# Define the source and template directories globally for all tests.
+SD = "tests/test_data/inputs/core"
+TD = "tests/test_data/templates/core"
+
+
+def test_nornir_parity():
+    # Build the hosts and groups, and render the nornir inventory files
+    inventory = ms.init_inventory_json(source_dir=SD)
+    groups = ms.init_groups_json(source_dir=SD)
+    outputs = render(
+        output_type="nornir", inventory=inventory, groups=groups, template_dir=TD
+    )
+    # Perform assertion tests to ensure they are the same as the parsed files
+    assert nornir_hosts(inventory) == yaml.safe_load(outputs["hosts.yaml"])
+    assert nornir_groups(groups) == yaml.safe_load(outputs["groups.yaml"])
+
+
+def test_nornir_load():
+    # Only load the inventory when nornir is installed
+    pytest.importorskip("nornir")
+    inventory = MotherStarterInventory(source_dir=SD).load()
+    hosts = nornir_hosts(ms.init_inventory_json(source_dir=SD))
+    # Perform assertion tests to ensure every host is in its group
+    assert sorted(inventory.hosts) == sorted(hosts)
+    for name, host in inventory.hosts.items():
+        assert [group.name for group in host.groups] == hosts[name]["groups"]
+        assert host.get_connection_parameters("scrapli").platform
@@ -0,0 +1,58 @@
+"""
+Unit tests to ensure that the record views return the same rows
+as the dataframe they are built from.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import pytest
+
+# Define the source directory globally for all tests.
+SD = "tests/test_data/inputs/core"
+
+
+def test_record_view_matches_dataframe():
+    # Initialise the dataframe and the record view of it
+    df = ms.init_inventory_json(source_dir=SD)
+    view = ms.dataframe_to_records(df)
+    # Perform assertion tests to ensure the records match the dataframe rows
+    assert len(view) == len(df)
+    assert [dict(record) for record in view] == ms.dataframe_to_dict(df)
+    # Perform assertion tests to ensure the view can be iterated again
+    assert [dict(record) for record in view] == ms.dataframe_to_dict(df)
+    assert ms.dataframe_to_records(view) is view
+
+
+def test_record_access():
+    # Initialise the first record of the dataframe
+    df = ms.init_inventory_json(source_dir=SD)
+    record = next(iter(ms.dataframe_to_records(df)))
+    # Perform assertion tests to ensure attribute and key access match
+    assert record.name == record["name"] == df["name"].iloc[0]
+    with pytest.raises(AttributeError):
+        record.missing
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+def test_record_view_group_by():
+    # Initialise the record view and group it by operating system
+    df = ms.init_inventory_json(source_dir=SD)
+    groups = ms.RecordView(df).group_by("operating_system")
+    # Perform assertion tests to ensure each group matches the dataframe rows
+    assert set(groups) == set(df["operating_system"])
+    for os_name, group in groups.items():
+        expected = df[df["operating_system"] == os_name]
+        assert [record.name for record in group] == expected["name"].tolist()
+
+
+def test_chunked_records_reiterable():
+    # Initialise the records of the csv inventory, read in chunks
+    chunked = ms.ChunkedFrame("motherstarter/inputs/inventory.csv", chunk_size=2)
+    records = ms.dataframe_to_records(chunked)
+    expected = ms.init_inventory_csv(source_dir="motherstarter/inputs")
+    expected = expected["name"].tolist()
+    # Perform assertion tests to ensure every pass over the records reads
+    # every row again
+    assert [record.name for record in records] == expected
+    assert [record.name for record in records] == expected
@@ -0,0 +1,47 @@
+"""
+Unit tests to ensure that the inventory and groups schema is
+applied to the dataframes, regardless of the source type.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import pytest
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+@pytest.mark.parametrize("source_type", ["csv", "json", "xlsx"])
+def test_inventory_schema(source_type):
+    # Initialise the logger and the inventory dataframe
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory(logger=logger, source_dir=SD, source_type=source_type)
+    # Perform assertion tests to ensure the low-cardinality columns are categories
+    for column in ["vendor", "device_type", "operating_system"]:
+        assert df[column].dtype == "category"
+
+
+@pytest.mark.parametrize("source_type", ["csv", "json", "xlsx"])
+def test_groups_schema(source_type):
+    # Initialise the logger and the groups dataframe
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_groups(logger=logger, source_dir=SD, source_type=source_type)
+    # Perform assertion tests to ensure the low-cardinality columns are categories
+    for column in ["platform", "auth_strict_key"]:
+        assert df[column].dtype == "category"
+
+
+def test_schema_arrow_strings():
+    # The Arrow-backed strings require the optional pyarrow dependency
+    pytest.importorskip("pyarrow")
+    df = ms.init_inventory_json(source_dir=SD)
+    # Perform assertion tests to ensure the unique columns are Arrow-backed
+    for column in ["name", "mgmt_ip"]:
+        assert df[column].dtype == "string[pyarrow]"
+
+
+def test_schema_ignores_missing_columns():
+    # Initialise a dataframe without any of the schema columns
+    df = ms.init_inventory_json(source_dir=SD)[["name"]]
+    # Perform assertion tests to ensure the missing columns are not added
+    assert list(ms.apply_schema(df, schema=ms.INVENTORY_SCHEMA).columns) == ["name"]
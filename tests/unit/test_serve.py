@@ -0,0 +1,161 @@
+"""
+Unit tests to ensure that the render service serves the same outputs
+as the convert command, and only renders them again after a change.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+from motherstarter.serve import OUTPUT_TYPES, RenderService, make_server
+import http.client
+import json
+import os
+import shutil
+import socket
+import threading
+import pytest
+
+
+@pytest.fixture
+def service(tmp_path):
+    # Copy the sources and templates, so they can be changed
+    shutil.copytree("motherstarter/inputs", tmp_path / "inputs")
+    shutil.copytree("motherstarter/templates/core", tmp_path / "templates")
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    return RenderService(
+        logger=logger,
+        source_type="csv",
+        source_dir=str(tmp_path / "inputs"),
+        template_dir=str(tmp_path / "templates"),
+        output_dir=str(tmp_path / "outputs"),
+    )
+
+
+@pytest.fixture
+def server(service):
+    # Serve the service on any free port, in a background thread
+    with make_server(service, port=0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+
+def get(server, path):
+    # Request the path and return the status and body of the response
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port)
+    conn.request("GET", path)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def test_serve_outputs(server, tmp_path):
+    # Perform assertion tests to ensure the output types and files are listed
+    status, body = get(server, "/")
+    assert status == 200
+    assert "nornir" in json.loads(body)["output_types"]
+    status, body = get(server, "/nornir")
+    assert json.loads(body) == {"files": ["groups.yaml", "hosts.yaml"]}
+    # Perform assertion tests to ensure the output matches the convert output
+    status, body = get(server, "/nornir/hosts.yaml")
+    assert status == 200
+    with open("tests/test_data/outputs/core/hosts.yaml", "rb") as expected_f:
+        assert body == expected_f.read()
+    # Perform assertion tests to ensure unknown outputs aren't found
+    assert get(server, "/nornir/hosts")[0] == 404
+    assert get(server, "/yaml")[0] == 404
+
+
+def test_serve_rerender(service, tmp_path):
+    # Render every output, and then change the groups source
+    with service.lock:
+        outputs = service.render("all")
+        # Perform assertion tests to ensure only the other output types are stale
+        others = {w[0].__name__ for w in service.writers} - {
+            w[0].__name__ for w in ms.get_writers(output_type="all")
+        }
+        assert service.stale == others
+        mtimes = {name: os.stat(path).st_mtime_ns for name, path in outputs.items()}
+        groups = tmp_path / "inputs/groups.csv"
+        groups.write_text(groups.read_text().replace(",22,", ",2222,"))
+        stat = groups.stat()
+        os.utime(groups, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        outputs = service.render("ansible")
+        # Perform assertion tests to ensure only the groups outputs are stale
+        assert service.stale == others | {
+            "to_nr_groups",
+            "to_csv_groups",
+            "to_xlsx_groups",
+            "to_json_groups",
+        }
+        assert os.stat(outputs["hosts"]).st_mtime_ns == mtimes["hosts"]
+        outputs = service.render("nornir")
+    # Perform assertion tests to ensure the changed output is rendered again
+    assert "port: 2222" in open(outputs["groups.yaml"]).read()
+    assert "to_nr_groups" not in service.stale
+
+
+@pytest.mark.parametrize("output_type", OUTPUT_TYPES)
+def test_serve_output_types(server, output_type):
+    # The parquet and feather outputs require the optional pyarrow dependency
+    if output_type in ["feather", "parquet"]:
+        pytest.importorskip("pyarrow")
+    # Perform assertion tests to ensure every file of the output type is served
+    status, body = get(server, f"/{output_type}")
+    assert status == 200
+    files = json.loads(body)["files"]
+    expected = {
+        ms.OUTPUT_FILES[w[0].__name__] for w in ms.get_writers(output_type=output_type)
+    }
+    assert set(files) == expected
+    for file_name in files:
+        status, body = get(server, f"/{output_type}/{file_name}")
+        assert status == 200
+        assert body
+
+
+def test_serve_error(server, tmp_path):
+    # Break the inventory source, so rendering fails
+    (tmp_path / "inputs/inventory.csv").write_text("")
+    # Perform assertion tests to ensure the error is returned
+    assert get(server, "/ansible/hosts")[0] == 500
+
+
+def test_serve_error_detail(server, monkeypatch):
+    # Fail rendering with an error message which isn't valid in a status line
+    def render(output_type):
+        raise ValueError("Bad row <1>\nsite: Zürich ☃")
+
+    monkeypatch.setattr(server.service, "render", render)
+    # Perform assertion tests to ensure the status line has a fixed reason,
+    # and the escaped error detail is in the body
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_port)
+    conn.request("GET", "/ansible/hosts")
+    response = conn.getresponse()
+    body = response.read().decode()
+    assert response.status == 500
+    assert response.reason == "Failed to render output"
+    assert "Failed to render ansible: Bad row &lt;1&gt;\nsite: Zürich ☃" in body
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix sockets")
+def test_serve_unix_socket(service, tmp_path):
+    # Serve the service on a unix socket, in a background thread
+    socket_path = str(tmp_path / "ms.sock")
+    with make_server(service, socket_path=socket_path) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        # Send a request over the unix socket
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(b"GET /ansible/hosts HTTP/1.0\r\n\r\n")
+            response = b""
+            while True:
+                data = client.recv(65536)
+                if not data:
+                    break
+                response += data
+        server.shutdown()
+    # Perform assertion tests to ensure the output is returned
+    headers, body = response.split(b"\r\n\r\n", 1)
+    assert headers.startswith(b"HTTP/1.1 200")
+    assert b"[ios]" in body
@@ -0,0 +1,32 @@
+"""
+Unit tests to ensure that the inventory is split into shards with
+names which are safe to use as directory names.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize(
+    "value,name",
+    [("syd", "syd"), ("syd/dc1", "syd_dc1"), ("..", "_"), (None, "none"), (3, "3")],
+)
+def test_shard_name(value, name):
+    assert ms.shard_name(value) == name
+
+
+def test_shard_frame():
+    # Shard a dataframe with a missing value and two values with the same name
+    df = pd.DataFrame(
+        {"name": ["a", "b", "c", "d", "e"], "site": ["syd", "a/b", None, "a_b", "syd"]}
+    )
+    shards = ms.shard_frame(df, shard_by="site")
+    # Perform assertion tests to ensure every row is in the expected shard
+    assert list(shards) == ["a_b", "syd", "none"]
+    assert list(shards["a_b"]["name"]) == ["b", "d"]
+    assert list(shards["syd"]["name"]) == ["a", "e"]
+    assert list(shards["none"]["name"]) == ["c"]
+    with pytest.raises(ValueError):
+        ms.shard_frame(df, shard_by="region")
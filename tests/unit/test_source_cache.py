@@ -0,0 +1,81 @@
+"""
+Unit tests to ensure that the parsed source cache loads the
+parsed xlsx sources, and evicts old cache files.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import os
+import pytest
+import shutil
+
+# The source cache requires the optional pyarrow dependency
+pytest.importorskip("pyarrow")
+from motherstarter.cache import SourceCache  # noqa (import after skip)
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+def test_xlsx_source_cache(tmp_path):
+    # Copy the source files, so the modification time can be changed
+    source_dir = tmp_path / "inputs"
+    shutil.copytree(SD, source_dir)
+    cache_dir = str(tmp_path / "cache")
+    # The first read parses the xlsx file and caches it
+    df = ms.init_inventory_xlsx(source_dir=str(source_dir), cache_dir=cache_dir)
+    source_cache = SourceCache(cache_dir=cache_dir)
+    xlsx_file = str(source_dir / "inventory.xlsx")
+    cached_df = source_cache.load(
+        xlsx_file, sheet_name="inventory", schema=ms.INVENTORY_SCHEMA
+    )
+    assert cached_df is not None
+    assert cached_df.equals(df)
+    # The cached dataframe is read on the second read
+    assert ms.init_inventory_xlsx(
+        source_dir=str(source_dir), cache_dir=cache_dir
+    ).equals(df)
+    # Changing the modification time of the source file invalidates the cache
+    mtime = os.path.getmtime(xlsx_file) + 10
+    os.utime(xlsx_file, (mtime, mtime))
+    assert (
+        source_cache.load(xlsx_file, sheet_name="inventory", schema=ms.INVENTORY_SCHEMA)
+        is None
+    )
+
+
+def test_xlsx_source_cache_disabled(tmp_path):
+    # Read the source files without a cache directory
+    df = ms.init_groups_xlsx(source_dir=SD)
+    # Perform assertion tests to ensure the data is read
+    assert len(df) == 5
+
+
+def test_source_cache_eviction(tmp_path):
+    # Initialise a source cache which fits a single cache file
+    source_cache = SourceCache(cache_dir=str(tmp_path), max_size=1)
+    df = ms.init_inventory_xlsx(source_dir=SD)
+    source_cache.save(f"{SD}/inventory.xlsx", df, sheet_name="inventory")
+    source_cache.save(f"{SD}/groups.xlsx", df, sheet_name="groups")
+    # Perform assertion tests to ensure the cache was evicted
+    assert list((tmp_path / "sources").glob("*.feather")) == []
+    # Initialise a source cache where every cache file has expired
+    source_cache = SourceCache(cache_dir=str(tmp_path), max_age=-1)
+    source_cache.save(f"{SD}/inventory.xlsx", df, sheet_name="inventory")
+    assert list((tmp_path / "sources").glob("*.feather")) == []
+
+
+def test_xlsx_source_cache_mixed_types(tmp_path):
+    # Write a xlsx source with a column of both integers and strings
+    source_dir = tmp_path / "inputs"
+    source_dir.mkdir()
+    df = ms.init_inventory_xlsx(source_dir=SD)
+    df["rack"] = [1, "a"] + [2] * (len(df) - 2)
+    ms.write_xlsx(str(source_dir / "inventory.xlsx"), df=df, sheet_name="inventory")
+    cache_dir = tmp_path / "cache"
+    # Perform assertion tests to ensure the source is read, but not cached
+    mixed_df = ms.init_inventory_xlsx(
+        source_dir=str(source_dir), cache_dir=str(cache_dir)
+    )
+    assert mixed_df["rack"].tolist() == df["rack"].tolist()
+    assert list((cache_dir / "sources").iterdir()) == []
@@ -0,0 +1,77 @@
+"""
+Unit tests to ensure that the sqlite sources are read identically to the
+json sources, and that the WHERE clause is run by sqlite using the indexes.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import io
+import pytest
+import sqlite3
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+@pytest.mark.parametrize("source", ["inventory", "groups"])
+def test_sqlite_source_matches_json(tmp_path, source):
+    # Write the json source to a sqlite database, and read it back in
+    json_df = getattr(ms, f"init_{source}_json")(source_dir=SD)
+    ms.write_sqlite(str(tmp_path / f"{source}.sqlite"), json_df, table_name=source)
+    df = getattr(ms, f"init_{source}_sqlite")(source_dir=str(tmp_path))
+    # Perform assertion tests to ensure the dataframes are identical
+    assert df.equals(json_df)
+    assert df.dtypes.equals(json_df.dtypes)
+
+
+def test_sqlite_source_where():
+    # Read the inventory rows of one operating system, with projected columns
+    df = ms.init_inventory_sqlite(
+        source_dir=SD,
+        columns=["name", "operating_system"],
+        where="operating_system = ?",
+        params=["eos"],
+    )
+    # Perform assertion tests to ensure only the matching rows are read
+    assert list(df.columns) == ["name", "operating_system"]
+    assert list(df["name"]) == [
+        "lab-arista-01.lab.dfjt.local",
+        "lab-arista-02.lab.dfjt.local",
+    ]
+    with pytest.raises(FileNotFoundError):
+        ms.init_inventory_sqlite(source_dir="tests/test_data/inputs/core")
+
+
+def test_sqlite_output_indexes(tmp_path):
+    # Write the inventory to a sqlite database file and a file object
+    df = ms.init_inventory_json(source_dir=SD)
+    f = io.BytesIO()
+    ms.write_sqlite(f, df, table_name="inventory")
+    ms.write_sqlite(str(tmp_path / "inventory.sqlite"), df, table_name="inventory")
+    # Perform assertion tests to ensure the same database is written to both
+    assert f.getvalue() == (tmp_path / "inventory.sqlite").read_bytes()
+    conn = sqlite3.connect(str(tmp_path / "inventory.sqlite"))
+    # Perform assertion tests to ensure the columns are indexed and used
+    indexes = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    assert [row[0] for row in indexes] == [
+        "ix_inventory_name",
+        "ix_inventory_mgmt_ip",
+        "ix_inventory_operating_system",
+    ]
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM inventory WHERE operating_system = 'eos'"
+    ).fetchall()
+    assert "ix_inventory_operating_system" in plan[0][-1]
+
+
+def test_sqlite_quote_identifier(tmp_path):
+    # Write the inventory to a table with double quotes in its name
+    df = ms.init_inventory_json(source_dir=SD)
+    table_name = 'inventory"; DROP TABLE "inventory'
+    ms.write_sqlite(str(tmp_path / "inventory.sqlite"), df, table_name=table_name)
+    # Perform assertion tests to ensure the embedded quotes are escaped
+    assert ms.quote_identifier('a"b') == '"a""b"'
+    read_df = ms.read_sqlite(str(tmp_path / "inventory.sqlite"), table_name)
+    assert read_df["name"].tolist() == df["name"].tolist()
+    with pytest.raises(ValueError):
+        ms.quote_identifier("inventory\x00")
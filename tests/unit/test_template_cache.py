@@ -0,0 +1,53 @@
+"""
+Unit tests to ensure that the template bytecode cache stores the
+compiled templates and only compiles them again when they change.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+from click.testing import CliRunner
+import os
+import shutil
+
+# Define the template directory globally for all tests.
+TD = "tests/test_data/templates/core"
+
+
+def test_bytecode_cache_hit_and_miss(tmp_path):
+    # Copy the templates, so the modification time can be changed
+    tmpl_dir = tmp_path / "templates"
+    shutil.copytree(TD, tmpl_dir)
+    cache_dir = str(tmp_path / "cache")
+    # Compile the template for the first time
+    env = ms.prep_templates(tmpl_dir=str(tmpl_dir), cache_dir=cache_dir)
+    env.get_template("nornir/hosts.j2")
+    assert (env.bytecode_cache.hits, env.bytecode_cache.misses) == (0, 1)
+    # Load the compiled template from the cache in a new environment
+    env = ms.prep_templates(tmpl_dir=str(tmpl_dir), cache_dir=cache_dir)
+    env.get_template("nornir/hosts.j2")
+    assert (env.bytecode_cache.hits, env.bytecode_cache.misses) == (1, 0)
+    # Change the template modification time and ensure it is compiled again
+    template = tmpl_dir / "nornir/hosts.j2"
+    mtime = os.path.getmtime(template) + 10
+    os.utime(template, (mtime, mtime))
+    env = ms.prep_templates(tmpl_dir=str(tmpl_dir), cache_dir=cache_dir)
+    env.get_template("nornir/hosts.j2")
+    assert (env.bytecode_cache.hits, env.bytecode_cache.misses) == (0, 1)
+
+
+def test_bytecode_cache_disabled():
+    # Prepare the templates without a cache directory
+    env = ms.prep_templates(tmpl_dir=TD)
+    # Perform assertion tests to ensure no cache is used
+    assert env.bytecode_cache is None
+
+
+def test_convert_cache_counters(tmp_path):
+    # Execute the command twice, so the second run loads from the cache
+    runner = CliRunner()
+    args = ["-o", "nornir", "-cd", str(tmp_path)]
+    runner.invoke(ms.convert, args)
+    result = runner.invoke(ms.convert, args)
+    # Perform assertion tests to ensure the counters are logged
+    assert result.exit_code == 0
+    assert "DEBUG - Template bytecode cache hits: 2, misses: 0" in result.output
@@ -0,0 +1,156 @@
+"""
+Unit tests to ensure that the template writers produce exactly
+the same output as the expected output files.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+import json
+import pytest
+
+# Define the source, template and expected output directories globally
+# for all tests.
+SD = "tests/test_data/inputs/core"
+TD = "tests/test_data/templates/core"
+OD = "tests/test_data/outputs/core"
+
+
+@pytest.mark.parametrize(
+    "writer,source,output_file",
+    [
+        (ms.to_nr_hosts, "inventory", "hosts.yaml"),
+        (ms.to_nr_groups, "groups", "groups.yaml"),
+        (ms.to_pyats, "inventory", "mother_starter_tb.yaml"),
+        (ms.to_ansible, "inventory", "hosts"),
+    ],
+)
+def test_template_writer_output(tmp_path, writer, source, output_file):
+    # Initialise the logger, dataframe and template environment
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    if source == "inventory":
+        df = ms.init_inventory_json(source_dir=SD)
+    else:
+        df = ms.init_groups_json(source_dir=SD)
+    env = ms.prep_templates(tmpl_dir=TD)
+    # Write the output to a file, using the writer
+    writer(logger=logger, env=env, df=df, output_dir=str(tmp_path))
+    # Perform assertion tests to ensure the outputs are identical
+    with open(f"{OD}/{output_file}") as expected_f:
+        assert (tmp_path / output_file).read_text() == expected_f.read()
+
+
+@pytest.mark.parametrize(
+    "writer,output_file",
+    [
+        (ms.to_nr_hosts, "hosts.yaml"),
+        (ms.to_pyats, "mother_starter_tb.yaml"),
+        (ms.to_ansible, "hosts"),
+    ],
+)
+def test_template_writer_blank_cells(tmp_path, writer, output_file):
+    # Initialise the inventory from a csv file with blank cells
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory_json(source_dir=SD)
+    df.loc[0, ["mgmt_ip", "vendor"]] = None
+    df.to_csv(tmp_path / "inventory.csv", index=False)
+    blank_df = ms.init_inventory_csv(source_dir=str(tmp_path))
+    env = ms.prep_templates(tmpl_dir=TD)
+    outputs = []
+    # Write the output with the schema dtypes, and with plain None values
+    for output_df in [blank_df, blank_df.astype(object).where(blank_df.notna(), None)]:
+        output_dir = tmp_path / f"output-{len(outputs)}"
+        writer(logger=logger, env=env, df=output_df, output_dir=str(output_dir))
+        outputs.append((output_dir / output_file).read_text())
+    # Perform assertion tests to ensure every missing value is rendered as None
+    assert outputs[0] == outputs[1]
+    assert "<NA>" not in outputs[0]
+    assert "&lt;NA&gt;" not in outputs[0]
+    assert "nan" not in outputs[0]
+
+
+def test_ansible_other_os_group(tmp_path):
+    # Initialise the logger, dataframe and template environment
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory_json(source_dir=SD)
+    env = ms.prep_templates(tmpl_dir=TD)
+    # Add a device with an operating system outside of the default groups
+    df.loc[len(df)] = ["lab-srx-01", "10.0.0.20", "juniper", "firewall", "srx"]
+    ms.to_ansible(logger=logger, env=env, df=df, output_dir=str(tmp_path))
+    # Perform assertion tests to ensure the device is in its own group
+    output = (tmp_path / "hosts").read_text()
+    assert "[srx]\nlab-srx-01 ansible_host=10.0.0.20\n" in output
+
+
+def parse_ansible_ini(text):
+    # Parse the groups, group vars and host vars of an Ansible INI inventory
+    groups, hostvars, section = {}, {}, None
+    for line in text.splitlines():
+        if not line or line.startswith(("#", "---")):
+            continue
+        if line.startswith("["):
+            section = line.strip("[]")
+            groups.setdefault(section.split(":")[0], {})
+        elif section.endswith(":vars"):
+            key, value = line.split("=", 1)
+            group = groups[section.split(":")[0]]
+            group.setdefault("vars", {})[key] = value.strip('"')
+        else:
+            name, host_var = line.split(" ")
+            groups[section].setdefault("hosts", []).append(name)
+            hostvars[name] = dict([host_var.split("=", 1)])
+    return groups, hostvars
+
+
+def test_ansible_json_matches_ini(tmp_path):
+    # Initialise the logger, dataframe and template environment
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory_json(source_dir=SD)
+    env = ms.prep_templates(tmpl_dir=TD)
+    df.loc[len(df)] = ["lab-srx-01", "10.0.0.20", "juniper", "firewall", "srx"]
+    # Write the INI inventory and the dynamic inventory json
+    ms.to_ansible(logger=logger, env=env, df=df, output_dir=str(tmp_path))
+    ms.to_ansible_json(logger=logger, df=df, output_dir=str(tmp_path))
+    groups, hostvars = parse_ansible_ini((tmp_path / "hosts").read_text())
+    inventory = json.loads((tmp_path / "hosts.json").read_text())
+    # Perform assertion tests to ensure the groups and vars are the same
+    assert inventory.pop("_meta") == {"hostvars": hostvars}
+    assert inventory["all"]["children"] == [g for g in groups if g != "all"]
+    for name, group in groups.items():
+        assert inventory[name].get("vars") == group.get("vars")
+        if name != "all":
+            assert inventory[name]["hosts"] == group.get("hosts", [])
+
+
+def test_ansible_missing_os_group(tmp_path):
+    # Initialise the inventory from a csv file with a blank operating system
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory_json(source_dir=SD)
+    df.loc[0, "operating_system"] = None
+    df.to_csv(tmp_path / "inventory.csv", index=False)
+    df = ms.init_inventory_csv(source_dir=str(tmp_path))
+    env = ms.prep_templates(tmpl_dir=TD)
+    # Write the INI inventory and the dynamic inventory json
+    ms.to_ansible(logger=logger, env=env, df=df, output_dir=str(tmp_path))
+    ms.to_ansible_json(logger=logger, df=df, output_dir=str(tmp_path))
+    groups, _ = parse_ansible_ini((tmp_path / "hosts").read_text())
+    inventory = json.loads((tmp_path / "hosts.json").read_text())
+    # Perform assertion tests to ensure the device is in the ungrouped group
+    assert groups["ungrouped"]["hosts"] == [df.loc[0, "name"]]
+    assert inventory["ungrouped"]["hosts"] == [df.loc[0, "name"]]
+
+
+def test_ansible_json_missing_mgmt_ip(tmp_path):
+    # Initialise the inventory from a csv file with a blank management IP
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    df = ms.init_inventory_json(source_dir=SD)
+    df.loc[0, "mgmt_ip"] = None
+    df.to_csv(tmp_path / "inventory.csv", index=False)
+    df = ms.init_inventory_csv(source_dir=str(tmp_path))
+    # Write the dynamic inventory json
+    ms.to_ansible_json(logger=logger, df=df, output_dir=str(tmp_path))
+    output = (tmp_path / "hosts.json").read_text()
+    hostvars = json.loads(output)["_meta"]["hostvars"]
+    # Perform assertion tests to ensure the host has no ansible_host var
+    assert "NaN" not in output
+    assert hostvars[df.loc[0, "name"]] == {}
+    assert hostvars[df.loc[1, "name"]] == {"ansible_host": df.loc[1, "mgmt_ip"]}
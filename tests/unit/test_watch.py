@@ -0,0 +1,115 @@
+"""
+Unit tests to ensure that the watcher regenerates only the outputs
+affected by each change to the source and template files.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+from motherstarter.watch import SourceWatcher
+import os
+import shutil
+
+
+def init_watcher(tmp_path, monkeypatch, source_type="csv"):
+    # Copy the sources and templates, and write the outputs to the tmp_path
+    shutil.copytree("motherstarter/inputs", tmp_path / "inputs")
+    shutil.copytree("motherstarter/templates/core", tmp_path / "templates")
+    monkeypatch.chdir(tmp_path)
+    logger = ms.init_logger(log_level="CRITICAL", log_name="unit-tests.log")
+    watcher = SourceWatcher(
+        logger=logger,
+        source_type=source_type,
+        output_type="all",
+        source_dir="inputs",
+        template_dir="templates",
+    )
+    watcher.snapshot = watcher.take_snapshot()
+    return watcher
+
+
+def touch(path, text=None):
+    # Optionally rewrite the file, and move its modification time forward
+    if text is not None:
+        path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_watch_regenerate_all(tmp_path, monkeypatch):
+    watcher = init_watcher(tmp_path, monkeypatch)
+    # Perform assertion tests to ensure every writer is executed at first
+    names = watcher.regenerate()
+    assert names == [w[0].__name__ for w in ms.get_writers(output_type="all")]
+    assert set(watcher.dfs) == {"inventory", "groups"}
+    assert (tmp_path / "motherstarter/outputs/nr/inventory/hosts.yaml").exists()
+    # Perform assertion tests to ensure nothing is regenerated without changes
+    assert watcher.changed_files() == set()
+    assert watcher.regenerate(set()) == []
+
+
+def test_watch_source_change(tmp_path, monkeypatch):
+    watcher = init_watcher(tmp_path, monkeypatch)
+    watcher.regenerate()
+    inventory = watcher.dfs["inventory"]
+    # Change the groups source, changing the port of every group
+    groups = tmp_path / "inputs/groups.csv"
+    touch(groups, groups.read_text().replace(",22,", ",2222,"))
+    changed = watcher.changed_files()
+    assert changed == {os.path.normpath("inputs/groups.csv")}
+    # Perform assertion tests to ensure only the groups outputs are regenerated
+    names = watcher.regenerate(changed)
+    assert names == [
+        "to_nr_groups",
+        "to_csv_groups",
+        "to_xlsx_groups",
+        "to_json_groups",
+    ]
+    assert watcher.dfs["inventory"] is inventory
+    output = tmp_path / "motherstarter/outputs/nr/inventory/groups.yaml"
+    assert "port: 2222" in output.read_text()
+
+
+def test_watch_template_change(tmp_path, monkeypatch):
+    watcher = init_watcher(tmp_path, monkeypatch)
+    watcher.regenerate()
+    # Change the ansible template, adding a comment to the output
+    template = tmp_path / "templates/ansible/hosts.j2"
+    touch(template, "# Watched\n" + template.read_text())
+    # Perform assertion tests to ensure only the ansible output is regenerated
+    assert watcher.regenerate(watcher.changed_files()) == ["to_ansible"]
+    output = tmp_path / "motherstarter/outputs/ansible/inventory/hosts"
+    assert output.read_text().startswith("# Watched\n")
+
+
+def test_watch_source_error(tmp_path, monkeypatch):
+    watcher = init_watcher(tmp_path, monkeypatch)
+    watcher.regenerate()
+    # Break the inventory source, so reading it fails
+    inventory = tmp_path / "inputs/inventory.csv"
+    text = inventory.read_text()
+    touch(inventory, "")
+    # Perform assertion tests to ensure the error is handled, and the source
+    # is read again once it is fixed
+    assert watcher.regenerate(watcher.changed_files()) == []
+    assert "inventory" not in watcher.dfs
+    touch(inventory, text)
+    assert "to_ansible" in watcher.regenerate(watcher.changed_files())
+    assert "inventory" in watcher.dfs
+
+
+def test_watch_run(tmp_path, monkeypatch):
+    watcher = init_watcher(tmp_path, monkeypatch, source_type="workbook")
+    # Change the workbook on the first poll, and check run stops afterwards
+    polls = []
+
+    def changed_files():
+        polls.append(True)
+        if len(polls) == 1:
+            touch(tmp_path / "inputs/workbook.xlsx")
+        return SourceWatcher.changed_files(watcher)
+
+    monkeypatch.setattr(watcher, "changed_files", changed_files)
+    watcher.run(interval=0.1, debounce=0, max_changes=1)
+    # Perform assertion tests to ensure the debounce poll found no changes
+    assert len(polls) == 2
+    assert (tmp_path / "motherstarter/outputs/ansible/inventory/hosts").exists()
@@ -0,0 +1,106 @@
+"""
+Unit tests to ensure that the streaming xlsx writer writes the
+same cells as the dataframe, splitting them across worksheets
+when they do not fit in one worksheet.
+"""
+
+# Import modules
+from motherstarter import motherstarter as ms
+from openpyxl import load_workbook
+
+# Define the source directory globally for all tests.
+SD = "motherstarter/inputs"
+
+
+def read_sheets(xlsx_file):
+    """
+    Read the cell values of every worksheet of the xlsx file into
+    a dictionary, keyed by the worksheet name.
+
+    Args:
+        xlsx_file: The xlsx file to read.
+
+    Returns:
+        sheets: The dictionary of worksheet rows.
+
+    Raises:
+        N/A
+    """
+    wb = load_workbook(filename=xlsx_file)
+    return {ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets}
+
+
+def test_write_xlsx_matches_dataframe(tmp_path):
+    # Initialise the dataframe and write it to a xlsx file
+    df = ms.init_inventory_csv(source_dir=SD)
+    xlsx_file = str(tmp_path / "inventory.xlsx")
+    assert ms.write_xlsx(xlsx_file, df=df, sheet_name="inventory") == ["inventory"]
+    # Perform assertion tests to ensure the cells match the dataframe
+    rows = read_sheets(xlsx_file)["inventory"]
+    assert rows[0] == tuple(df.columns)
+    assert rows[1:] == list(df.itertuples(index=False, name=None))
+
+
+def test_write_xlsx_split_sheets(tmp_path):
+    # Initialise the dataframe and write it with three rows in each worksheet
+    df = ms.init_inventory_csv(source_dir=SD)
+    xlsx_file = str(tmp_path / "inventory.xlsx")
+    sheet_names = ms.write_xlsx(xlsx_file, df=df, sheet_name="inventory", max_rows=3)
+    # Perform assertion tests to ensure every worksheet has the header and
+    # the rows are split across the worksheets in order
+    sheets = read_sheets(xlsx_file)
+    assert list(sheets) == sheet_names
+    assert sheet_names[:2] == ["inventory", "inventory_2"]
+    assert len(sheet_names) == -(-len(df) // 2)
+    rows = []
+    for sheet_rows in sheets.values():
+        assert sheet_rows[0] == tuple(df.columns)
+        assert 1 < len(sheet_rows) <= 3
+        rows += sheet_rows[1:]
+    assert rows == list(df.itertuples(index=False, name=None))
+
+
+def test_write_xlsx_widths_formats(tmp_path):
+    # Initialise the dataframe and write it with a column width and format
+    df = ms.init_groups_csv(source_dir=SD)
+    xlsx_file = str(tmp_path / "groups.xlsx")
+    ms.write_xlsx(
+        xlsx_file,
+        df=df,
+        sheet_name="groups",
+        column_widths={"name": 30},
+        column_formats={"port": "0.00"},
+    )
+    # Perform assertion tests to ensure the width and format were applied
+    ws = load_workbook(filename=xlsx_file)["groups"]
+    assert ws.column_dimensions["A"].width == 30
+    assert ws["C2"].number_format == "0.00"
+    assert ws["C2"].value == df["port"].iloc[0]
+
+
+def test_write_xlsx_chunks(tmp_path):
+    # Initialise the chunked inventory and write it to a xlsx file
+    df = ms.init_inventory_csv(source_dir=SD)
+    chunked_df = ms.init_inventory_csv_chunks(source_dir=SD, chunk_size=2)
+    xlsx_file = str(tmp_path / "inventory.xlsx")
+    ms.write_xlsx(xlsx_file, df=chunked_df, sheet_name="inventory")
+    # Perform assertion tests to ensure the cells match the dataframe
+    rows = read_sheets(xlsx_file)["inventory"]
+    assert rows[0] == tuple(df.columns)
+    assert rows[1:] == list(df.itertuples(index=False, name=None))
+
+
+def test_write_xlsx_header_style(tmp_path):
+    # Initialise the dataframe and write it with two rows in each worksheet
+    df = ms.init_inventory_csv(source_dir=SD)
+    xlsx_file = str(tmp_path / "inventory.xlsx")
+    ms.write_xlsx(xlsx_file, df=df, sheet_name="inventory", max_rows=2)
+    # Perform assertion tests to ensure the header row of every worksheet
+    # is styled as pandas to_excel styles it, and the other rows are not
+    for ws in load_workbook(filename=xlsx_file).worksheets:
+        for cell in ws[1]:
+            assert cell.font.b
+            assert cell.border.left.style == cell.border.bottom.style == "thin"
+            assert cell.alignment.horizontal == "center"
+        assert not ws["A2"].font.b
+        assert ws["A2"].border.left.style is None